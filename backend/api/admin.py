@@ -1,5 +1,8 @@
 from django.contrib import admin
-from .models import Category, Restaurant, BingoTemplate, BingoTemplateItem, BingoBoard, Review
+from django.db.models import Count
+from .models import (
+    Category, Restaurant, BingoTemplate, BingoTemplateItem, BingoBoard, Review, ImageBlob,
+)
 
 
 @admin.register(Category)
@@ -23,8 +26,8 @@ class BingoTemplateItemInline(admin.TabularInline):
 
 @admin.register(BingoTemplate)
 class BingoTemplateAdmin(admin.ModelAdmin):
-    list_display = ["title", "category", "is_active", "created_at"]
-    list_filter = ["category", "is_active"]
+    list_display = ["title", "category", "size", "is_active", "created_at"]
+    list_filter = ["category", "size", "is_active"]
     search_fields = ["title"]
     inlines = [BingoTemplateItemInline]
 
@@ -38,6 +41,41 @@ class BingoBoardAdmin(admin.ModelAdmin):
 
 @admin.register(Review)
 class ReviewAdmin(admin.ModelAdmin):
-    list_display = ["user", "restaurant", "rating", "visited_date", "is_public"]
+    list_display = ["user", "restaurant", "rating", "visited_date", "is_public", "image_blob"]
     list_filter = ["rating", "is_public", "visited_date"]
     search_fields = ["user__username", "restaurant__name", "content"]
+    raw_id_fields = ["image_blob"]
+
+
+class NearDuplicateFilter(admin.SimpleListFilter):
+    title = "유사 중복"
+    parameter_name = "near_duplicate"
+
+    def lookups(self, request, model_admin):
+        return [("yes", "유사 중복 있음"), ("no", "없음")]
+
+    def queryset(self, request, queryset):
+        if self.value() == "yes":
+            return queryset.filter(near_duplicate_of__isnull=False)
+        if self.value() == "no":
+            return queryset.filter(near_duplicate_of__isnull=True)
+        return queryset
+
+
+@admin.register(ImageBlob)
+class ImageBlobAdmin(admin.ModelAdmin):
+    list_display = ["name", "size", "phash", "near_duplicate_of", "review_count", "created_at"]
+    list_filter = [NearDuplicateFilter]
+    search_fields = ["sha256", "phash", "name"]
+    raw_id_fields = ["near_duplicate_of"]
+    readonly_fields = [
+        "sha256", "phash", "phash_band0", "phash_band1", "phash_band2", "phash_band3",
+        "name", "size", "created_at",
+    ]
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(review_count=Count("reviews"))
+
+    @admin.display(ordering="review_count", description="리뷰 수")
+    def review_count(self, obj):
+        return obj.review_count
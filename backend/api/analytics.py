@@ -0,0 +1,188 @@
+"""
+템플릿 진행 퍼널 집계 (TemplateFunnel)
+
+- 리뷰 작성/삭제 시 보드의 activated_mask 비트를 F()로 켜고 끈다 (포지션 조회를 포함한 UPDATE 한 번).
+- 보드/리뷰 변경은 커밋 후 해당 템플릿 퍼널을 is_stale로 표시만 한다 (보드 잠금 밖에서).
+- 조회는 저장된 퍼널을 그대로 반환하고, 재계산은 refresh_template_funnels 명령이 주기적으로 한다.
+- 재계산은 템플릿 보드들의 (마스크, 완료 여부, 소요 시간)만 읽어 numpy로 한 번에 집계한다.
+  리뷰 테이블을 조인하지 않으므로 비용은 템플릿의 보드 수에만 비례한다.
+"""
+from functools import partial
+
+from django.db import transaction
+from django.db.models import BigIntegerField, F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Cast, Coalesce
+from django.utils import timezone
+
+from .models import BingoBoard, BingoTemplate, BingoTemplateItem, Review, TemplateFunnel
+from .services import line_masks
+
+# 목표 라인 수: 퍼널 필드
+MILESTONE_FIELDS = {
+    1: 'reached_1_line',
+    3: 'reached_3_lines',
+    5: 'reached_5_lines',
+}
+
+
+def _mark_stale(using, **lookup):
+    TemplateFunnel.objects.using(using).filter(is_stale=False, **lookup).update(is_stale=True)
+
+
+def mark_stale(template_id, using='default'):
+    """
+    템플릿 퍼널을 재계산 대상으로 표시 (트랜잭션 안이면 커밋 후)
+    템플릿의 모든 리뷰 작성이 같은 퍼널 행을 건드리므로 보드 잠금을 잡은 동안에는 쓰지 않는다
+    """
+    transaction.on_commit(partial(_mark_stale, using, template_id=template_id), using=using)
+
+
+def _update_board_cell(review, activate, using):
+    position = BingoTemplateItem.objects.using(using).filter(
+        template_id=OuterRef('template_id'), restaurant_id=review.restaurant_id
+    ).values('position')[:1]
+    # 템플릿에 없는 식당이면 0 (마스크 그대로)
+    bit = Coalesce(
+        Cast(Value(1), BigIntegerField()).bitleftshift(Subquery(position)),
+        Value(0), output_field=BigIntegerField(),
+    )
+    mask = F('activated_mask')
+    mask = mask.bitor(bit) if activate else mask - mask.bitand(bit)
+    BingoBoard.objects.using(using).filter(pk=review.bingo_board_id).update(activated_mask=mask)
+    transaction.on_commit(
+        partial(_mark_stale, using, template__boards=review.bingo_board_id), using=using,
+    )
+
+
+def record_review(review, using='default'):
+    """리뷰 작성: 보드에서 해당 식당 포지션 비트를 켠다"""
+    _update_board_cell(review, True, using)
+
+
+def forget_review(review, using='default'):
+    """리뷰 삭제: 보드에서 해당 식당 포지션 비트를 끈다 (보드당 식당 리뷰는 하나)"""
+    _update_board_cell(review, False, using)
+
+
+def compute_funnel(size, masks, completed, completion_seconds):
+    """
+    보드 마스크 배열로 퍼널 지표 계산 ((보드 수 × 셀 수), (보드 수 × 라인 수) 배열 연산)
+
+    - masks: 보드별 activated_mask
+    - completed: 보드별 완료 여부
+    - completion_seconds: 완료된 보드의 생성→완료 소요 시간(초)
+    """
+    import numpy as np
+
+    masks = np.asarray(masks, dtype=np.int64)
+    completed = np.asarray(completed, dtype=bool)
+    positions = np.arange(size * size, dtype=np.int64)
+    lines = np.array(line_masks(size), dtype=np.int64)
+
+    # 포지션별 활성 보드 수 (히트맵)
+    cell_counts = ((masks[:, None] >> positions) & 1).sum(axis=0)
+
+    # 라인별로 아직 비어 있는 비트: 0이면 완성, 한 비트만 남으면 한 칸 남은 라인
+    missing = lines & ~masks[:, None]
+    completed_lines = (missing == 0).sum(axis=1)
+    near_miss = (missing != 0) & ((missing & (missing - 1)) == 0) & ~completed[:, None]
+    near_miss_counts = ((missing[near_miss][:, None] >> positions) & 1).sum(axis=0)
+
+    seconds = np.asarray(completion_seconds, dtype=np.float64)
+    return {
+        'boards_started': len(masks),
+        'boards_activated': int((masks != 0).sum()),
+        **{
+            field: int((completed_lines >= k).sum())
+            for k, field in MILESTONE_FIELDS.items()
+        },
+        'boards_completed': int(completed.sum()),
+        'median_completion_seconds': float(np.median(seconds)) if len(seconds) else None,
+        'cell_counts': cell_counts.tolist(),
+        'near_miss_counts': near_miss_counts.tolist(),
+        'drop_off_position': int(near_miss_counts.argmax()) if near_miss_counts.any() else None,
+    }
+
+
+def refresh(template, using='default'):
+    """템플릿 퍼널 재계산"""
+    funnels = TemplateFunnel.objects.using(using)
+    funnel, _ = funnels.get_or_create(template=template)
+    # 읽기 전에 stale을 해제해 재계산 중에 들어온 변경은 다시 stale로 남긴다
+    funnels.filter(pk=funnel.pk).update(is_stale=False)
+
+    rows = list(
+        BingoBoard.objects.using(using).filter(template=template)
+        .values_list('activated_mask', 'is_completed', 'created_at', 'completed_at')
+    )
+    result = compute_funnel(
+        template.size,
+        [mask for mask, _, _, _ in rows],
+        [is_completed for _, is_completed, _, _ in rows],
+        [
+            (completed_at - created_at).total_seconds()
+            for _, is_completed, created_at, completed_at in rows
+            if is_completed and completed_at
+        ],
+    )
+    funnels.filter(pk=funnel.pk).update(**result, updated_at=timezone.now())
+    funnel.refresh_from_db()
+    return funnel
+
+
+def get_funnel(template):
+    """
+    저장된 퍼널 반환 (stale이어도 그대로, 처음 조회하는 템플릿만 계산)
+    변경분은 refresh_template_funnels 명령(refresh_stale)이 반영한다
+    """
+    funnel = TemplateFunnel.objects.filter(template=template).first()
+    if funnel is None:
+        funnel = refresh(template)
+    return funnel
+
+
+def refresh_stale():
+    """stale이거나 아직 없는 템플릿 퍼널을 재계산, 재계산한 템플릿 수 반환"""
+    templates = BingoTemplate.objects.filter(Q(funnel__isnull=True) | Q(funnel__is_stale=True))
+    count = 0
+    for template in templates.iterator():
+        refresh(template)
+        count += 1
+    return count
+
+
+def rebuild_masks(template_id=None):
+    """
+    리뷰와 템플릿 아이템으로 보드의 activated_mask를 다시 계산
+    (템플릿 아이템 포지션이 바뀐 경우 등, template_id로 범위 제한), 변경된 보드 수 반환
+    """
+    boards = BingoBoard.objects.all()
+    items = BingoTemplateItem.objects.all()
+    reviews = Review.objects.all()
+    funnels = TemplateFunnel.objects.all()
+    if template_id is not None:
+        boards = boards.filter(template_id=template_id)
+        items = items.filter(template_id=template_id)
+        reviews = reviews.filter(bingo_board__template_id=template_id)
+        funnels = funnels.filter(template_id=template_id)
+
+    positions = {
+        (item_template_id, restaurant_id): position
+        for item_template_id, restaurant_id, position in
+        items.values_list('template_id', 'restaurant_id', 'position')
+    }
+    masks = {}
+    rows = reviews.values_list('bingo_board_id', 'bingo_board__template_id', 'restaurant_id')
+    for board_id, board_template_id, restaurant_id in rows.iterator():
+        position = positions.get((board_template_id, restaurant_id))
+        if position is not None:
+            masks[board_id] = masks.get(board_id, 0) | (1 << position)
+
+    changed = [
+        BingoBoard(pk=board_id, activated_mask=masks.get(board_id, 0))
+        for board_id, current in boards.values_list('id', 'activated_mask')
+        if masks.get(board_id, 0) != current
+    ]
+    BingoBoard.objects.bulk_update(changed, ['activated_mask'], batch_size=1000)
+    funnels.update(is_stale=True)
+    return len(changed)
@@ -0,0 +1,199 @@
+"""
+엔드포인트 벤치마크 (benchmark_endpoints 명령)
+
+generate_load_data로 만든 데이터(고정 seed/기준일)에서 공개/Admin 엔드포인트를 반복 호출해
+p50/p95 지연, 쿼리 수, 응답 크기를 잰다.
+- 쿼리 수/응답 크기는 데이터가 같으면 결정적이므로 기준선보다 늘면 바로 회귀로 본다.
+- 지연은 머신/부하에 따라 흔들리므로 기준선 대비 배율 + 절대 여유(ms)를 넘을 때만 회귀로 본다.
+"""
+import gc
+import time
+from io import StringIO
+
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authtoken.models import Token
+
+from .models import BingoBoard, BingoTemplate, Review
+
+User = get_user_model()
+
+# (이름, 메서드, 경로, 인증 - None/'user'/'admin')
+# 경로의 {template}/{board}/{review}는 데이터에서 고른 대표 객체 (가장 많이 쓰인 것)
+ENDPOINTS = (
+    ('categories', 'GET', '/api/categories/', None),
+    ('template_list', 'GET', '/api/templates/', None),
+    ('template_detail', 'GET', '/api/templates/{template}/', None),
+    ('home', 'GET', '/api/home/', 'user'),
+    ('feed', 'GET', '/api/reviews/feed/', None),
+    ('feed_user', 'GET', '/api/reviews/feed/', 'user'),
+    ('leaderboard', 'GET', '/api/leaderboard/', None),
+    ('nearby', 'GET', '/api/restaurants/nearby/?lat=37.55&lng=127.0&radius=3000', None),
+    ('review_comments', 'GET', '/api/reviews/{review}/comments/', None),
+    ('board_list', 'GET', '/api/boards/', 'user'),
+    ('board_detail', 'GET', '/api/boards/{board}/', 'user'),
+    ('my_reviews', 'GET', '/api/reviews/', 'user'),
+    ('profile', 'GET', '/api/auth/profile/', 'user'),
+    ('review_create', 'POST', '/api/reviews/', 'user'),
+    ('admin_stats', 'GET', '/api/admin/stats/', 'admin'),
+    ('admin_restaurants', 'GET', '/api/admin/restaurants/', 'admin'),
+    ('admin_pending_restaurants', 'GET', '/api/admin/restaurants/?is_approved=false', 'admin'),
+    ('admin_templates', 'GET', '/api/admin/templates/', 'admin'),
+    ('admin_template_funnel', 'GET', '/api/admin/templates/{template}/funnel/', 'admin'),
+    ('admin_users', 'GET', '/api/admin/users/', 'admin'),
+)
+ENDPOINT_NAMES = tuple(name for name, *_ in ENDPOINTS)
+
+DEFAULT_THRESHOLDS = {
+    'latency_ratio': 1.5,
+    'latency_slack_ms': 5.0,
+    'bytes_ratio': 1.1,
+}
+
+
+class ReviewPayloads:
+    """review_create 호출마다 아직 리뷰가 없는 (보드, 식당) 쌍 (셀이 다 차면 새 보드)"""
+
+    def __init__(self, user):
+        self.user = user
+        self.template = BingoTemplate.objects.filter(is_active=True).order_by('-size', 'id').first()
+        self.restaurants = []
+
+    def __call__(self):
+        if not self.restaurants:
+            self.board = BingoBoard.objects.create(user=self.user, template=self.template)
+            self.restaurants = list(
+                self.template.items.order_by('-position').values_list('restaurant_id', flat=True)
+            )
+        return {
+            'bingo_board': self.board.id,
+            'restaurant': self.restaurants.pop(),
+            'content': '벤치마크 리뷰입니다. 맛있어요.',
+            'rating': 5,
+            'visited_date': '2026-01-01',
+        }
+
+
+def build_context():
+    """대표 객체 id와 인증 헤더, review_create 페이로드 생성기"""
+    user = User.objects.annotate(n=Count('bingo_boards')).order_by('-n', 'id').first()
+    admin, _ = User.objects.get_or_create(
+        username='bench_admin', defaults={'is_staff': True, 'is_superuser': True},
+    )
+    template = (
+        BingoTemplate.objects.filter(is_active=True)
+        .annotate(n=Count('boards')).order_by('-n', 'id').first()
+    )
+    board = user.bingo_boards.annotate(n=Count('reviews')).order_by('-n', 'id').first()
+    review = (
+        Review.objects.filter(is_public=True)
+        .annotate(n=Count('comments')).order_by('-n', 'id').first()
+    )
+    return {
+        'ids': {'template': template.id, 'board': board.id, 'review': review.id},
+        'headers': {
+            None: {},
+            'user': {'Authorization': f'Token {Token.objects.get_or_create(user=user)[0].key}'},
+            'admin': {'Authorization': f'Token {Token.objects.get_or_create(user=admin)[0].key}'},
+        },
+        'payloads': ReviewPayloads(user),
+    }
+
+
+def percentile_ms(samples, q):
+    return round(float(np.percentile(samples, q)) * 1000, 2)
+
+
+def run_endpoint(client, context, method, path, auth, iterations, warmup):
+    """
+    한 엔드포인트를 warmup + iterations번 호출
+    쿼리 수/응답 크기는 캡처를 켠 첫 호출에서, 지연은 캡처 없이 잰다 (SQL 기록 비용 제외)
+    """
+    path = path.format(**context['ids'])
+    headers = context['headers'][auth]
+
+    def call():
+        if method == 'POST':
+            return client.post(
+                path, context['payloads'](), content_type='application/json', headers=headers, secure=True,
+            )
+        return client.get(path, headers=headers, secure=True)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = call()
+    # 다음 요청의 request_started(reset_queries)가 기록을 비우기 전에 센다
+    query_count = len(queries)
+    for _ in range(warmup):
+        call()
+    # timeit처럼 측정 중에는 gc를 꺼 수집 시점에 따라 p95가 튀지 않게 한다
+    gc.collect()
+    gc.disable()
+    samples = []
+    try:
+        for _ in range(iterations):
+            started = time.perf_counter()
+            call()
+            samples.append(time.perf_counter() - started)
+    finally:
+        gc.enable()
+    return {
+        'status': response.status_code,
+        'queries': query_count,
+        'bytes': len(response.content),
+        'p50_ms': percentile_ms(samples, 50),
+        'p95_ms': percentile_ms(samples, 95),
+    }
+
+
+def run_scale(scale, seed, until, iterations=20, warmup=2, only=None):
+    """현재 DB를 비우고 scale 규모 데이터를 생성해 엔드포인트를 잰다"""
+    call_command('flush', interactive=False, verbosity=0)
+    call_command(
+        'generate_load_data', '--scale', str(scale), '--seed', str(seed), '--until', until,
+        stdout=StringIO(),
+    )
+    rows = {
+        'reviews': Review.objects.count(),
+        'boards': BingoBoard.objects.count(),
+        'users': User.objects.count(),
+    }
+    context = build_context()
+    client = Client()
+    endpoints = {}
+    for name, method, path, auth in ENDPOINTS:
+        if only and name not in only:
+            continue
+        endpoints[name] = run_endpoint(client, context, method, path, auth, iterations, warmup)
+    return {'rows': rows, 'endpoints': endpoints}
+
+
+def compare(baseline, result, thresholds=None):
+    """
+    기준선 대비 회귀 목록 [(scale, endpoint, 메시지)]
+    기준선에 없는 scale/엔드포인트는 비교하지 않는다
+    """
+    thresholds = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+    regressions = []
+    for scale, current in result['scales'].items():
+        base_endpoints = baseline.get('scales', {}).get(scale, {}).get('endpoints', {})
+        for name, metrics in current['endpoints'].items():
+            base = base_endpoints.get(name)
+            if base is None:
+                continue
+            if metrics['status'] != base['status']:
+                regressions.append((scale, name, f"상태 코드 {base['status']} → {metrics['status']}"))
+            if metrics['queries'] > base['queries']:
+                regressions.append((scale, name, f"쿼리 수 {base['queries']} → {metrics['queries']}"))
+            if metrics['bytes'] > base['bytes'] * thresholds['bytes_ratio']:
+                regressions.append((scale, name, f"응답 크기 {base['bytes']} → {metrics['bytes']} bytes"))
+            limit = base['p95_ms'] * thresholds['latency_ratio'] + thresholds['latency_slack_ms']
+            if metrics['p95_ms'] > limit:
+                regressions.append(
+                    (scale, name, f"p95 {base['p95_ms']}ms → {metrics['p95_ms']}ms (허용 {limit:.1f}ms)")
+                )
+    return regressions
@@ -0,0 +1,96 @@
+"""
+프로세스 메모리 / import 비용 측정 (import_footprint, memory_budget 명령)
+
+측정 대상보다 먼저 import되므로 표준 라이브러리만 사용한다.
+- memory_usage(): RSS와 (Linux) PSS/USS. preload 후 fork한 워커는 마스터와 페이지를 공유하므로
+  워커 하나가 실제로 더 쓰는 메모리는 USS(private)로 본다.
+- ImportFootprint: sys.meta_path 훅으로 모듈 실행마다 걸린 시간과 RSS 증가량을 잰다.
+"""
+import os
+import resource
+import sys
+import time
+from importlib.machinery import PathFinder
+
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+
+
+def current_rss():
+    """현재 RSS (bytes)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except OSError:
+        # /proc가 없는 OS(macOS 등)는 최대 RSS로 대신한다
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def memory_usage():
+    """{'rss', 'pss', 'uss'} (bytes, pss/uss는 /proc/self/smaps_rollup이 있을 때만)"""
+    usage = {'rss': current_rss()}
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            fields = {}
+            for line in f:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == 'kB':
+                    fields[parts[0].rstrip(':')] = int(parts[1]) * 1024
+    except OSError:
+        return usage
+    usage['pss'] = fields.get('Pss', 0)
+    usage['uss'] = fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0)
+    return usage
+
+
+class ImportFootprint:
+    """
+    모듈별 import 시간(초)과 RSS 증가량(bytes)
+
+    중첩 import 비용은 안쪽 모듈 몫으로 빼서 각 모듈에는 자기 코드 실행분만 남긴다.
+    PathFinder 바로 앞에 끼워 넣으므로 내장/frozen 모듈은 측정하지 않는다.
+    """
+
+    def __init__(self):
+        self.modules = {}
+        self._stack = []
+
+    def __enter__(self):
+        sys.meta_path.insert(sys.meta_path.index(PathFinder), self)
+        return self
+
+    def __exit__(self, *exc_info):
+        sys.meta_path.remove(self)
+
+    def find_spec(self, name, path=None, target=None):
+        spec = PathFinder.find_spec(name, path, target)
+        if spec is None or not hasattr(spec.loader, 'exec_module'):
+            return spec
+        exec_module = spec.loader.exec_module
+
+        def measured_exec_module(module):
+            self._stack.append([0.0, 0])
+            started, rss = time.perf_counter(), current_rss()
+            try:
+                exec_module(module)
+            finally:
+                seconds, grown = time.perf_counter() - started, current_rss() - rss
+                child_seconds, child_grown = self._stack.pop()
+                entry = self.modules.setdefault(name, [0.0, 0])
+                entry[0] += seconds - child_seconds
+                entry[1] += grown - child_grown
+                if self._stack:
+                    self._stack[-1][0] += seconds
+                    self._stack[-1][1] += grown
+
+        spec.loader.exec_module = measured_exec_module
+        return spec
+
+    def by_package(self):
+        """최상위 패키지별 합계 {package: [seconds, rss_bytes]}"""
+        packages = {}
+        for name, (seconds, grown) in self.modules.items():
+            entry = packages.setdefault(name.partition('.')[0], [0.0, 0])
+            entry[0] += seconds
+            entry[1] += grown
+        return packages
@@ -0,0 +1,132 @@
+"""
+로컬 가짜 카카오 서버 (loadtest 명령, 테스트에서 사용)
+
+KAKAO_AUTH_HOST / KAKAO_API_HOST / KAKAO_LOCAL_HOST를 이 서버 주소로 두면
+카카오 로그인(토큰 발급 → 사용자 정보)과 장소 검색이 외부 호출 없이 동작한다.
+- 인가 코드가 곧 카카오 사용자 id(숫자)이고, 액세스 토큰은 'fake-<id>'
+- latency_ms만큼 응답을 늦춰 원격 API 호출이 워커 스레드를 붙잡는 시간을 재현한다
+"""
+import json
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+TOKEN_PREFIX = 'fake-'
+
+
+def search_documents(query, size=15):
+    """검색어마다 같은 결과를 돌려주는 가짜 음식점 목록 (카카오 로컬 검색 응답 형식)"""
+    seed = zlib.crc32(query.encode())
+    documents = []
+    for index in range(size):
+        place_id = str(seed % 10_000_000 * 100 + index)
+        documents.append({
+            'id': place_id,
+            'place_name': f'{query} {index + 1}호점',
+            'category_name': '음식점 > 한식',
+            'address_name': f'서울 중구 가짜동 {index + 1}',
+            'road_address_name': f'서울 중구 가짜로 {index + 1}',
+            'phone': f'02-000-{index:04d}',
+            'x': f'{126.97 + (seed % 1000) / 100_000 + index / 1000:.6f}',
+            'y': f'{37.55 + (seed % 997) / 100_000 + index / 1000:.6f}',
+            'place_url': f'https://place.map.kakao.com/{place_id}',
+            'distance': str(index * 120),
+        })
+    return documents
+
+
+class FakeKakaoHandler(BaseHTTPRequestHandler):
+    """/oauth/token, /v2/user/me, /v2/local/search/keyword.json"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _begin(self):
+        url = urlsplit(self.path)
+        self.server.record(url.path)
+        if self.server.latency_ms:
+            time.sleep(self.server.latency_ms / 1000)
+        return url
+
+    def do_POST(self):
+        url = self._begin()
+        if url.path != '/oauth/token':
+            return self._reply(404, {'msg': 'not found'})
+        length = int(self.headers.get('Content-Length') or 0)
+        form = parse_qs(self.rfile.read(length).decode())
+        code = form.get('code', [''])[0]
+        if not code.isdigit():
+            return self._reply(400, {
+                'error': 'invalid_grant', 'error_description': 'authorization code not found',
+            })
+        self._reply(200, {
+            'access_token': f'{TOKEN_PREFIX}{code}', 'token_type': 'bearer', 'expires_in': 21599,
+        })
+
+    def do_GET(self):
+        url = self._begin()
+        if url.path == '/v2/user/me':
+            token = self.headers.get('Authorization', '').removeprefix('Bearer ')
+            kakao_id = token.removeprefix(TOKEN_PREFIX)
+            if not token.startswith(TOKEN_PREFIX) or not kakao_id.isdigit():
+                return self._reply(401, {'msg': 'this access token does not exist', 'code': -401})
+            return self._reply(200, {
+                'id': int(kakao_id),
+                'properties': {'nickname': f'부하{kakao_id}'},
+                'kakao_account': {
+                    'profile': {'nickname': f'부하{kakao_id}'},
+                    'email': f'{kakao_id}@loadtest.invalid',
+                    'is_email_verified': False,
+                },
+            })
+        if url.path == '/v2/local/search/keyword.json':
+            query = parse_qs(url.query).get('query', [''])[0]
+            documents = search_documents(query) if query else []
+            return self._reply(200, {
+                'documents': documents,
+                'meta': {'total_count': len(documents), 'is_end': True},
+            })
+        self._reply(404, {'msg': 'not found'})
+
+
+class FakeKakaoServer(ThreadingHTTPServer):
+    """
+    with FakeKakaoServer(latency_ms=80) as kakao:
+        env['KAKAO_AUTH_HOST'] = kakao.url
+    백그라운드 스레드에서 127.0.0.1의 빈 포트로 뜨고, 경로별 호출 수를 센다
+    """
+    daemon_threads = True
+
+    def __init__(self, latency_ms=0, port=0):
+        super().__init__(('127.0.0.1', port), FakeKakaoHandler)
+        self.latency_ms = latency_ms
+        self.calls = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def record(self, path):
+        with self._lock:
+            self.calls[path] += 1
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
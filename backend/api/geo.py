@@ -0,0 +1,135 @@
+"""
+위치 기반 조회 유틸리티 (PostGIS 없이 SQLite/PostgreSQL 공통)
+
+- Restaurant.geohash 컬럼(B-tree 인덱스)을 geohash 접두사 범위 조건으로 조회해 후보를 좁히고
+- NumPy 벡터화 haversine으로 정확한 거리를 계산해 걸러낸다.
+"""
+import math
+
+from django.db.models import Q
+
+GEOHASH_PRECISION = 9
+GEOHASH_ALPHABET = '0123456789bcdefghjkmnpqrstuvwxyz'
+# geohash 문자 중 가장 큰 'z' 다음 문자 (접두사 범위 조회의 상한)
+GEOHASH_UPPER_BOUND = '{'
+
+EARTH_RADIUS_M = 6_371_000
+METERS_PER_DEGREE_LAT = 111_320
+
+# 한 번의 조회에서 사용할 최대 geohash 셀 수
+MAX_COVER_CELLS = 16
+
+
+def encode_geohash(latitude, longitude, precision=GEOHASH_PRECISION):
+    """위도/경도를 geohash 문자열로 변환"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    latitude = float(latitude)
+    longitude = float(longitude)
+
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        rng, value = (lng_range, longitude) if even else (lat_range, latitude)
+        mid = (rng[0] + rng[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            rng[0] = mid
+        else:
+            bits <<= 1
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(GEOHASH_ALPHABET[bits])
+            bits = 0
+            bit_count = 0
+    return ''.join(chars)
+
+
+def _cell_size(precision):
+    """geohash 정밀도별 셀 크기 (위도 높이, 경도 너비) - 도 단위"""
+    total_bits = precision * 5
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def covering_geohashes(south, west, north, east):
+    """
+    bbox를 덮는 geohash 셀 목록
+
+    MAX_COVER_CELLS 이하로 덮을 수 있는 가장 세밀한 정밀도를 고른다.
+    """
+    best = ['']
+    for precision in range(1, GEOHASH_PRECISION + 1):
+        height, width = _cell_size(precision)
+        rows = range(math.floor((south + 90) / height), math.floor((north + 90) / height) + 1)
+        cols = range(math.floor((west + 180) / width), math.floor((east + 180) / width) + 1)
+        if len(rows) * len(cols) > MAX_COVER_CELLS:
+            break
+        best = sorted({
+            encode_geohash(
+                min((row + 0.5) * height - 90, 90.0),
+                min((col + 0.5) * width - 180, 180.0),
+                precision,
+            )
+            for row in rows
+            for col in cols
+        })
+    return best
+
+
+def geohash_cover_q(cells, field='geohash'):
+    """geohash 접두사들을 인덱스를 타는 범위 조건(Q)으로 변환"""
+    query = Q()
+    for prefix in cells:
+        if not prefix:
+            return Q(**{f'{field}__gt': ''})
+        query |= Q(**{f'{field}__gte': prefix, f'{field}__lt': prefix + GEOHASH_UPPER_BOUND})
+    return query
+
+
+def bbox_around(latitude, longitude, radius_m):
+    """중심점과 반경(m)을 감싸는 bbox (south, west, north, east)"""
+    dlat = radius_m / METERS_PER_DEGREE_LAT
+    cos_lat = max(math.cos(math.radians(latitude)), 1e-6)
+    dlng = radius_m / (METERS_PER_DEGREE_LAT * cos_lat)
+    return (
+        max(latitude - dlat, -90.0),
+        max(longitude - dlng, -180.0),
+        min(latitude + dlat, 90.0),
+        min(longitude + dlng, 180.0),
+    )
+
+
+def haversine_m(latitude, longitude, latitudes, longitudes):
+    """한 점에서 여러 점까지의 거리 (m, NumPy 배열)"""
+    import numpy as np
+
+    lat1 = np.radians(float(latitude))
+    lng1 = np.radians(float(longitude))
+    lat2 = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lng2 = np.radians(np.asarray(longitudes, dtype=np.float64))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+
+
+def distance_matrix_m(latitudes, longitudes):
+    """점들 사이의 거리 행렬 (m, NumPy 2차원 배열)"""
+    import numpy as np
+
+    lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lng = np.radians(np.asarray(longitudes, dtype=np.float64))
+    a = (
+        np.sin((lat[:, None] - lat[None, :]) / 2) ** 2
+        + np.cos(lat)[:, None] * np.cos(lat)[None, :]
+        * np.sin((lng[:, None] - lng[None, :]) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
@@ -0,0 +1,255 @@
+"""
+동시 사용자 부하 테스트 (loadtest 명령)
+
+로컬에 띄운 서버(start.sh와 같은 gunicorn + uvicorn 워커)에 가상 사용자 스레드가
+실제 사용 흐름을 반복하고, 단계별 처리량/지연 백분위/오류율을 집계한다.
+- 사용자 여정: 카카오 로그인 → 보드 열기(없으면 템플릿 골라 생성) → 리뷰 작성 → 피드 → 좋아요 → 댓글
+- 관리자 여정: 카카오 장소 검색 → 통계
+카카오는 api/fake_kakao.py 가짜 서버가 대신한다.
+"""
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from .benchmarks import percentile_ms
+
+USER_STEPS = (
+    'authorize', 'login', 'templates', 'create_board', 'open_board',
+    'submit_review', 'feed', 'like', 'comment',
+)
+ADMIN_STEPS = ('kakao_search', 'admin_stats')
+STEPS = USER_STEPS + ADMIN_STEPS
+
+# 가상 사용자 i의 카카오 id (같은 seed로 다시 돌리면 기존 사용자로 로그인)
+KAKAO_ID_BASE = 9_000_000_000
+REDIRECT_URI = 'http://127.0.0.1/oauth/callback'
+SEARCH_QUERIES = ('국밥', '냉면', '칼국수', '떡볶이', '파스타', '초밥')
+
+
+class Recorder:
+    """요청 결과 (단계, 시작 시각, 소요 시간, 상태 코드) 모음 (0은 연결 실패)"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.records = []
+        self._lock = threading.Lock()
+
+    def add(self, step, started, seconds, status):
+        with self._lock:
+            self.records.append((step, started - self.started, seconds, status))
+
+
+def summarize(records, elapsed, warmup=0.0):
+    """
+    단계별 {requests, errors, error_rate, rps, p50_ms, p95_ms, p99_ms}와 'total'
+    warmup초 전에 시작한 요청은 버린다 (연결 풀/캐시 준비 구간)
+    """
+    window = max(elapsed - warmup, 1e-9)
+    measured = [record for record in records if record[1] >= warmup]
+    by_step = {}
+    for step, _, seconds, status in measured:
+        by_step.setdefault(step, []).append((seconds, status))
+
+    def stats(samples):
+        errors = sum(1 for _, status in samples if not 200 <= status < 400)
+        seconds = [value for value, _ in samples]
+        return {
+            'requests': len(samples),
+            'errors': errors,
+            'error_rate': round(errors / len(samples), 4),
+            'rps': round(len(samples) / window, 2),
+            'p50_ms': percentile_ms(seconds, 50),
+            'p95_ms': percentile_ms(seconds, 95),
+            'p99_ms': percentile_ms(seconds, 99),
+        }
+
+    steps = {step: stats(by_step[step]) for step in STEPS if step in by_step}
+    if measured:
+        steps['total'] = stats([(seconds, status) for _, _, seconds, status in measured])
+    return {
+        'elapsed_s': round(window, 2),
+        'steps': steps,
+        'errors': dict(Counter(
+            f'{step} {status or "연결 실패"}'
+            for step, _, _, status in measured if not 200 <= status < 400
+        ).most_common(10)),
+    }
+
+
+class StepFailed(Exception):
+    """단계가 실패하면 이번 여정의 나머지 단계는 건너뛴다"""
+
+
+class VirtualUser:
+    """세션 하나로 여정을 반복하는 가상 사용자"""
+
+    def __init__(self, base_url, recorder, rng, think_ms=0, timeout=30):
+        self.base_url = base_url.rstrip('/')
+        self.recorder = recorder
+        self.rng = rng
+        self.think_ms = think_ms
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def request(self, step, method, path, **kwargs):
+        if self.think_ms:
+            time.sleep(self.rng.uniform(0, 2 * self.think_ms) / 1000)
+        started = time.perf_counter()
+        try:
+            response = self.session.request(
+                method, self.base_url + path, timeout=self.timeout, **kwargs,
+            )
+        except requests.RequestException:
+            self.recorder.add(step, started, time.perf_counter() - started, 0)
+            raise StepFailed(step)
+        self.recorder.add(step, started, time.perf_counter() - started, response.status_code)
+        if response.status_code >= 400:
+            raise StepFailed(step)
+        return response.json() if response.content else None
+
+    def run(self, journeys=None, deadline=None):
+        done = 0
+        while (journeys is None or done < journeys) and (deadline is None or time.perf_counter() < deadline):
+            try:
+                self.journey()
+            except StepFailed:
+                pass
+            done += 1
+        self.session.close()
+
+
+class KakaoUser(VirtualUser):
+    """카카오 로그인 → 보드 → 리뷰 작성 → 피드 → 좋아요 → 댓글"""
+
+    def __init__(self, base_url, recorder, rng, kakao_id, **kwargs):
+        super().__init__(base_url, recorder, rng, **kwargs)
+        self.kakao_id = kakao_id
+        self.board_id = None
+
+    def journey(self):
+        authorize = self.request(
+            'authorize', 'GET', '/api/auth/kakao/authorize/', params={'redirect_uri': REDIRECT_URI},
+        )
+        state = parse_qs(urlsplit(authorize['url']).query)['state'][0]
+        login = self.request('login', 'POST', '/api/auth/kakao/login/', json={
+            'code': str(self.kakao_id), 'state': state,
+        })
+        self.session.headers['Authorization'] = f"Token {login['token']}"
+
+        if self.board_id is None:
+            templates = self.request('templates', 'GET', '/api/templates/')
+            templates = templates['results'] if isinstance(templates, dict) else templates
+            board = self.request('create_board', 'POST', '/api/boards/', json={
+                'template': self.rng.choice(templates)['id'],
+            })
+            self.board_id = board['id']
+        board = self.request('open_board', 'GET', f'/api/boards/{self.board_id}/')
+        empty = [cell['restaurant']['id'] for cell in board['cells'] if not cell['is_activated']]
+        if empty:
+            self.request('submit_review', 'POST', '/api/reviews/', json={
+                'bingo_board': self.board_id,
+                'restaurant': self.rng.choice(empty),
+                'content': '부하 테스트 리뷰입니다. 다음에 또 올게요.',
+                'rating': self.rng.randint(3, 5),
+                'visited_date': time.strftime('%Y-%m-%d'),
+            })
+        if len(empty) <= 1:
+            # 보드를 다 채우면 다음 여정에서 새 보드를 만든다
+            self.board_id = None
+
+        feed = self.request('feed', 'GET', '/api/reviews/feed/')
+        if feed['results']:
+            review_id = self.rng.choice(feed['results'])['id']
+            self.request('like', 'POST', f'/api/reviews/{review_id}/like/')
+            self.request('comment', 'POST', f'/api/reviews/{review_id}/comments/', json={
+                'content': '저도 가봐야겠어요!',
+            })
+
+
+class AdminUser(VirtualUser):
+    """카카오 장소 검색 → 통계 (토큰은 미리 발급)"""
+
+    def __init__(self, base_url, recorder, rng, token, **kwargs):
+        super().__init__(base_url, recorder, rng, **kwargs)
+        self.session.headers['Authorization'] = f'Token {token}'
+
+    def journey(self):
+        self.request('kakao_search', 'GET', '/api/admin/kakao/search/', params={
+            'query': self.rng.choice(SEARCH_QUERIES),
+        })
+        self.request('admin_stats', 'GET', '/api/admin/stats/')
+
+
+def run_load(base_url, users, duration=None, journeys=None, admin_users=0, admin_token=None,
+             think_ms=0, warmup=0.0, seed=42):
+    """
+    가상 사용자 users명(+ 관리자 admin_users명)이 duration초 동안(또는 각자 journeys번) 여정을 반복
+    카카오 id는 seed마다 고정이라 같은 seed로 다시 돌리면 기존 사용자로 로그인한다
+    """
+    recorder = Recorder()
+    deadline = recorder.started + duration if duration else None
+    virtual_users = [
+        KakaoUser(base_url, recorder, random.Random(seed * 100_003 + index),
+                  kakao_id=KAKAO_ID_BASE + seed * 100_000 + index, think_ms=think_ms)
+        for index in range(users)
+    ] + [
+        AdminUser(base_url, recorder, random.Random(-seed * 100_003 - index - 1),
+                  token=admin_token, think_ms=think_ms)
+        for index in range(admin_users)
+    ]
+    threads = [
+        threading.Thread(target=user.run, kwargs={'journeys': journeys, 'deadline': deadline})
+        for user in virtual_users
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return summarize(recorder.records, time.perf_counter() - recorder.started, warmup)
+
+
+def start_server(base_dir, port, workers, threads, env=None, log=None):
+    """start.sh와 같은 gunicorn 설정(gunicorn.conf.py)으로 워커/스레드 수만 바꿔 띄운다"""
+    server_env = {
+        **os.environ,
+        'PORT': str(port),
+        'WEB_CONCURRENCY': str(workers),
+        'WSGI_THREADS': str(threads),
+        **(env or {}),
+    }
+    return subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', 'config.asgi:application'],
+        cwd=base_dir, env=server_env, stdout=log or subprocess.DEVNULL, stderr=subprocess.STDOUT,
+    )
+
+
+def wait_ready(process, base_url, timeout=60):
+    """/api/health/가 응답할 때까지 대기, 서버가 먼저 죽거나 시간이 지나면 False"""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            if requests.get(f'{base_url}/api/health/', timeout=2).status_code == 200:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    return False
+
+
+def stop_server(process, timeout=30):
+    """gunicorn 마스터에 SIGTERM (워커까지 정리), 응답이 없으면 SIGKILL"""
+    process.terminate()
+    try:
+        process.wait(timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
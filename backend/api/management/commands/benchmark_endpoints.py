@@ -0,0 +1,121 @@
+import json
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+
+from api.benchmarks import DEFAULT_THRESHOLDS, ENDPOINT_NAMES, compare, run_scale
+
+DEFAULT_BASELINE = Path(settings.BASE_DIR) / 'benchmarks' / 'baseline.json'
+# 기준선과 같은 데이터를 만들도록 기준일을 고정한다
+DEFAULT_UNTIL = '2026-01-01'
+
+
+class Command(BaseCommand):
+    help = (
+        '생성한 부하 데이터(규모별)에서 공개/Admin 엔드포인트의 p50/p95 지연, 쿼리 수, 응답 크기를 재고 '
+        '기준선(JSON)보다 나빠지면 실패합니다 (테스트 DB 사용, SQLite에서 오프라인 실행 가능)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scales', default='0.002,0.02',
+                            help='generate_load_data --scale 값 목록 (쉼표 구분)')
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument('--warmup', type=int, default=2)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--until', default=DEFAULT_UNTIL)
+        parser.add_argument('--only', action='append', choices=ENDPOINT_NAMES, default=[],
+                            help='이 엔드포인트만 (여러 번 지정 가능)')
+        parser.add_argument('--baseline', default=str(DEFAULT_BASELINE))
+        parser.add_argument('--update-baseline', action='store_true', help='결과를 기준선으로 저장')
+        parser.add_argument('--output', help='결과 JSON 저장 경로')
+        parser.add_argument('--latency-ratio', type=float, default=DEFAULT_THRESHOLDS['latency_ratio'],
+                            help='허용 p95 = 기준선 p95 × 배율 + 여유')
+        parser.add_argument('--latency-slack-ms', type=float,
+                            default=DEFAULT_THRESHOLDS['latency_slack_ms'])
+        parser.add_argument('--bytes-ratio', type=float, default=DEFAULT_THRESHOLDS['bytes_ratio'])
+        parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+
+    def handle(self, *args, **options):
+        try:
+            scales = [float(value) for value in options['scales'].split(',')]
+        except ValueError:
+            raise CommandError('--scales는 쉼표로 구분한 숫자여야 합니다.')
+        result = {
+            'meta': {
+                'seed': options['seed'], 'until': options['until'],
+                'iterations': options['iterations'], 'vendor': connection.vendor,
+            },
+            'scales': {},
+        }
+
+        # 개발 DB를 건드리지 않도록 테스트 DB에서, 플레이스홀더 이미지는 임시 MEDIA_ROOT에
+        setup_test_environment(debug=False)
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            with tempfile.TemporaryDirectory() as media_root, override_settings(MEDIA_ROOT=media_root):
+                for scale in scales:
+                    scale_result = run_scale(
+                        scale, options['seed'], options['until'],
+                        iterations=options['iterations'], warmup=options['warmup'],
+                        only=options['only'],
+                    )
+                    result['scales'][str(scale)] = scale_result
+                    if not options['json']:
+                        self._print_scale(scale, scale_result)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        if options['output']:
+            Path(options['output']).write_text(json.dumps(result, ensure_ascii=False, indent=2) + '\n')
+        if options['json']:
+            self.stdout.write(json.dumps(result, ensure_ascii=False))
+
+        failed = [
+            f'{scale} {name}: HTTP {metrics["status"]}'
+            for scale, scale_result in result['scales'].items()
+            for name, metrics in scale_result['endpoints'].items()
+            if metrics['status'] >= 400
+        ]
+        if failed:
+            raise CommandError('실패한 요청:\n' + '\n'.join(failed))
+
+        baseline_path = Path(options['baseline'])
+        if options['update_baseline']:
+            baseline_path.parent.mkdir(parents=True, exist_ok=True)
+            baseline_path.write_text(json.dumps(result, ensure_ascii=False, indent=2) + '\n')
+            if not options['json']:
+                self.stdout.write(self.style.SUCCESS(f'기준선 저장: {baseline_path}'))
+            return
+        if not baseline_path.exists():
+            if not options['json']:
+                self.stdout.write(f'기준선이 없습니다 ({baseline_path}), --update-baseline으로 저장하세요')
+            return
+
+        regressions = compare(json.loads(baseline_path.read_text()), result, {
+            'latency_ratio': options['latency_ratio'],
+            'latency_slack_ms': options['latency_slack_ms'],
+            'bytes_ratio': options['bytes_ratio'],
+        })
+        if regressions:
+            raise CommandError('기준선 대비 회귀:\n' + '\n'.join(
+                f'[{scale}] {name}: {message}' for scale, name, message in regressions
+            ))
+        if not options['json']:
+            self.stdout.write(self.style.SUCCESS('기준선 대비 회귀 없음'))
+
+    def _print_scale(self, scale, scale_result):
+        rows = scale_result['rows']
+        self.stdout.write(
+            f"scale {scale:g} (리뷰 {rows['reviews']:,}, 보드 {rows['boards']:,}, 사용자 {rows['users']:,})"
+        )
+        self.stdout.write(f"  {'엔드포인트':<28} {'p50(ms)':>8} {'p95(ms)':>8} {'쿼리':>5} {'bytes':>8}")
+        for name, metrics in scale_result['endpoints'].items():
+            self.stdout.write(
+                f"  {name:<28} {metrics['p50_ms']:>8.2f} {metrics['p95_ms']:>8.2f} "
+                f"{metrics['queries']:>5} {metrics['bytes']:>8}"
+            )
@@ -0,0 +1,46 @@
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+
+from api.models import ImageBlob, Review
+from api.services_upload import ImageStore, image_hashes
+
+
+class Command(BaseCommand):
+    help = '해시가 없는 기존 리뷰 이미지를 ImageBlob으로 등록하고 동일 이미지를 하나로 합칩니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--delete-duplicates', action='store_true',
+            help='다른 이미지와 내용이 같은 파일을 스토리지에서 삭제합니다',
+        )
+
+    def handle(self, *args, **options):
+        registered = merged = failed = 0
+        reviews = Review.objects.filter(image_blob__isnull=True).exclude(image='')
+        for review in reviews.iterator():
+            name = review.image.name
+            try:
+                blob = ImageBlob.objects.filter(name=name).first()
+                if blob is None:
+                    with default_storage.open(name) as file:
+                        sha256, dhash, size = image_hashes(file)
+                    blob = ImageBlob.objects.filter(sha256=sha256).first()
+                    if blob is None:
+                        blob = ImageStore.register(name, sha256, dhash, size)
+                        registered += 1
+            except (OSError, ValueError) as e:
+                failed += 1
+                self.stderr.write(f'리뷰 {review.id} ({name}) 처리 실패: {e}')
+                continue
+
+            if blob.name != name:
+                merged += 1
+                if options['delete_duplicates'] and not Review.objects.filter(
+                    image=name
+                ).exclude(pk=review.pk).exists():
+                    default_storage.delete(name)
+            Review.objects.filter(pk=review.pk).update(image=blob.name, image_blob=blob)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'이미지 등록 {registered}개, 중복 합침 {merged}개, 실패 {failed}개'
+        ))
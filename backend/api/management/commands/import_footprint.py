@@ -0,0 +1,93 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# 새 프로세스에서 gunicorn 마스터와 같은 기동 경로를 ImportFootprint 훅 안에서 실행한다
+PROBE = '''
+import json, os
+from api.diagnostics import ImportFootprint, memory_usage
+
+baseline = memory_usage()
+with ImportFootprint() as footprint:
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    import django
+    django.setup()
+    import config.asgi
+    from config import startup
+    startup.warm_up()
+print(json.dumps({
+    'baseline': baseline,
+    'after': memory_usage(),
+    'modules': footprint.modules,
+    'packages': footprint.by_package(),
+}))
+'''
+
+MB = 1024 * 1024
+
+
+def parse_env(values):
+    env = {}
+    for value in values:
+        key, sep, val = value.partition('=')
+        if not sep or not key:
+            raise CommandError(f'--env는 KEY=VALUE 형식이어야 합니다: {value}')
+        env[key] = val
+    return env
+
+
+class Command(BaseCommand):
+    help = '기동 경로에서 import되는 모듈/패키지별 import 시간과 RSS 증가량을 측정합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--by', choices=('package', 'module'), default='package',
+                            help='집계 단위 (최상위 패키지 / 모듈)')
+        parser.add_argument('--sort', choices=('rss', 'time'), default='rss')
+        parser.add_argument('--top', type=int, default=20)
+        parser.add_argument(
+            '--env', action='append', default=[], metavar='KEY=VALUE',
+            help='측정 프로세스 환경 변수 (예: --env SENTRY_DSN=https://key@o0.ingest.sentry.io/0)',
+        )
+        parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+
+    def handle(self, *args, **options):
+        completed = subprocess.run(
+            [sys.executable, '-c', PROBE],
+            cwd=settings.BASE_DIR, capture_output=True, text=True,
+            env={**os.environ, **parse_env(options['env'])},
+        )
+        if completed.returncode != 0:
+            raise CommandError(f'import 측정 실패:\n{completed.stderr[-2000:]}')
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+
+        entries = result['packages' if options['by'] == 'package' else 'modules']
+        sort_index = 1 if options['sort'] == 'rss' else 0
+        ranked = sorted(entries.items(), key=lambda item: item[1][sort_index], reverse=True)
+        report = {
+            'baseline_rss_mb': round(result['baseline']['rss'] / MB, 1),
+            'rss_mb': round(result['after']['rss'] / MB, 1),
+            'import_rss_mb': round((result['after']['rss'] - result['baseline']['rss']) / MB, 1),
+            'import_seconds': round(sum(seconds for seconds, _ in result['modules'].values()), 3),
+            'module_count': len(result['modules']),
+            'top': [
+                {'name': name, 'seconds': round(seconds, 4), 'rss_mb': round(grown / MB, 2)}
+                for name, (seconds, grown) in ranked[:options['top']]
+            ],
+        }
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, ensure_ascii=False))
+            return
+
+        self.stdout.write(
+            f"기동 후 RSS {report['rss_mb']}MB (인터프리터 {report['baseline_rss_mb']}MB + "
+            f"import {report['import_rss_mb']}MB), 모듈 {report['module_count']}개 "
+            f"{report['import_seconds']:.3f}s"
+        )
+        self.stdout.write(f"{'이름':<40} {'시간(s)':>9} {'RSS(MB)':>9}")
+        for entry in report['top']:
+            self.stdout.write(f"{entry['name']:<40} {entry['seconds']:>9.4f} {entry['rss_mb']:>9.2f}")
@@ -0,0 +1,164 @@
+import json
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from rest_framework.authtoken.models import Token
+
+from api.fake_kakao import FakeKakaoServer
+from api.loadtest import run_load, start_server, stop_server, wait_ready
+from api.models import BingoTemplate
+
+User = get_user_model()
+
+
+def parse_configs(value):
+    """'2x2,4x1' → [(워커, 스레드), ...]"""
+    try:
+        configs = [tuple(int(part) for part in item.lower().split('x')) for item in value.split(',')]
+    except ValueError:
+        configs = []
+    if not configs or any(len(config) != 2 or min(config) < 1 for config in configs):
+        raise CommandError('--configs는 "워커x스레드"를 쉼표로 구분해야 합니다 (예: 2x2,4x1).')
+    return configs
+
+
+class Command(BaseCommand):
+    help = (
+        'start.sh와 같은 gunicorn 서버를 워커x스레드 구성별로 로컬에 띄우고, 가상 사용자들이 '
+        '카카오 로그인 → 보드 → 리뷰 → 피드 → 좋아요 → 댓글 여정을 반복해 단계별 처리량/지연/오류율을 잽니다 '
+        '(카카오는 로컬 가짜 서버, DB는 현재 설정 - seed_data 또는 generate_load_data 먼저)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--configs', default='2x2',
+                            help='WEB_CONCURRENCY x WSGI_THREADS 목록 (쉼표 구분, 기본은 start.sh 기본값)')
+        parser.add_argument('--users', type=int, default=8, help='동시 가상 사용자 수')
+        parser.add_argument('--admin-users', type=int, default=1, help='동시 관리자 수 (장소 검색/통계)')
+        parser.add_argument('--duration', type=float, default=30, help='구성별 측정 시간 (초)')
+        parser.add_argument('--warmup', type=float, default=5, help='집계에서 뺄 시작 구간 (초)')
+        parser.add_argument('--think-ms', type=float, default=0,
+                            help='요청 사이 평균 대기 (0이면 쉬지 않고 최대 처리량 측정)')
+        parser.add_argument('--kakao-latency-ms', type=float, default=80,
+                            help='가짜 카카오 서버 응답 지연 (실제 외부 API 왕복 흉내)')
+        parser.add_argument('--port', type=int, default=8765)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--max-error-rate', type=float,
+                            help='전체 오류율이 이 값을 넘는 구성이 있으면 실패 (예: 0.01)')
+        parser.add_argument('--server-log', help='서버 로그 저장 경로 (기본은 임시 파일)')
+        parser.add_argument('--output', help='결과 JSON 저장 경로')
+        parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+
+    def handle(self, *args, **options):
+        configs = parse_configs(options['configs'])
+        if options['duration'] <= options['warmup']:
+            raise CommandError('--duration은 --warmup보다 길어야 합니다.')
+        if not BingoTemplate.objects.filter(is_active=True, items__isnull=False).exists():
+            raise CommandError('활성 템플릿이 없습니다. seed_data 또는 generate_load_data를 먼저 실행하세요.')
+        admin, _ = User.objects.get_or_create(
+            username='loadtest_admin', defaults={'is_staff': True, 'is_superuser': True},
+        )
+        admin_token = Token.objects.get_or_create(user=admin)[0].key
+        if connection.vendor == 'sqlite' and not options['json']:
+            timeout = connection.settings_dict['OPTIONS'].get('timeout', 5)
+            self.stdout.write(self.style.WARNING(
+                f'SQLite: 쓰기 트랜잭션은 모든 워커를 통틀어 한 번에 하나씩 처리됩니다 '
+                f'(다른 쓰기가 끝나기를 최대 {timeout}초 기다리고, 넘으면 실패). '
+                '쓰기 단계(보드/리뷰/좋아요/댓글/로그인)의 지연과 처리량은 운영과 다르므로 '
+                '비교하려면 DATABASE_URL로 PostgreSQL을 쓰세요.'
+            ))
+
+        base_url = f"http://127.0.0.1:{options['port']}"
+        log_path = options['server_log'] or tempfile.NamedTemporaryFile(
+            prefix='loadtest-server-', suffix='.log', delete=False,
+        ).name
+        result = {
+            'meta': {
+                key: options[key] for key in (
+                    'users', 'admin_users', 'duration', 'warmup', 'think_ms', 'kakao_latency_ms', 'seed',
+                )
+            },
+            'configs': {},
+        }
+        result['meta']['vendor'] = connection.vendor
+        # 서버 프로세스가 같은 DB 파일에 쓰도록 명령의 연결은 닫아 둔다
+        connection.close()
+
+        with FakeKakaoServer(latency_ms=options['kakao_latency_ms']) as kakao, open(log_path, 'ab') as log:
+            env = {
+                'KAKAO_AUTH_HOST': kakao.url,
+                'KAKAO_API_HOST': kakao.url,
+                'KAKAO_LOCAL_HOST': kakao.url,
+                'KAKAO_REST_API_KEY': 'loadtest',
+                'KAKAO_CLIENT_SECRET': '',
+                # 운영과 같은 설정으로 돌리되 로컬 HTTP로 접속
+                'DEBUG': 'False',
+                'SECURE_SSL_REDIRECT': 'False',
+                'ALLOWED_HOSTS': '127.0.0.1,localhost',
+            }
+            for workers, threads in configs:
+                name = f'{workers}x{threads}'
+                process = start_server(settings.BASE_DIR, options['port'], workers, threads, env=env, log=log)
+                try:
+                    if not wait_ready(process, base_url):
+                        raise CommandError(f'{name} 서버가 뜨지 않았습니다. 로그: {log_path}')
+                    kakao.calls.clear()
+                    config_result = run_load(
+                        base_url, options['users'], duration=options['duration'],
+                        admin_users=options['admin_users'], admin_token=admin_token,
+                        think_ms=options['think_ms'], warmup=options['warmup'], seed=options['seed'],
+                    )
+                    config_result['kakao_calls'] = dict(kakao.calls)
+                finally:
+                    stop_server(process)
+                result['configs'][name] = config_result
+                if not options['json']:
+                    self._print_config(name, config_result)
+
+        if options['output']:
+            Path(options['output']).write_text(json.dumps(result, ensure_ascii=False, indent=2) + '\n')
+        if options['json']:
+            self.stdout.write(json.dumps(result, ensure_ascii=False))
+        else:
+            if len(configs) > 1:
+                self._print_comparison(result['configs'])
+            self.stdout.write(f'서버 로그: {log_path}')
+
+        if options['max_error_rate'] is not None:
+            over = [
+                f"{name}: {config['steps']['total']['error_rate']:.2%}"
+                for name, config in result['configs'].items()
+                if config['steps'].get('total', {}).get('error_rate', 1.0) > options['max_error_rate']
+            ]
+            if over:
+                raise CommandError(
+                    f"오류율이 {options['max_error_rate']:.2%}를 넘었습니다: " + ', '.join(over)
+                )
+
+    def _print_config(self, name, config_result):
+        self.stdout.write(f"구성 {name} (워커x스레드, 측정 {config_result['elapsed_s']}s)")
+        self.stdout.write(
+            f"  {'단계':<16} {'요청':>6} {'req/s':>8} {'p50(ms)':>8} {'p95(ms)':>8} {'p99(ms)':>8} {'오류율':>7}"
+        )
+        for step, stats in config_result['steps'].items():
+            self.stdout.write(
+                f"  {step:<16} {stats['requests']:>6} {stats['rps']:>8.2f} {stats['p50_ms']:>8.1f} "
+                f"{stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f} {stats['error_rate']:>7.2%}"
+            )
+        if config_result['errors']:
+            self.stdout.write('  오류: ' + ', '.join(
+                f'{key} ×{count}' for key, count in config_result['errors'].items()
+            ))
+
+    def _print_comparison(self, configs):
+        self.stdout.write('구성 비교 (전체)')
+        for name, config_result in configs.items():
+            total = config_result['steps'].get('total')
+            if total:
+                self.stdout.write(
+                    f"  {name:<8} {total['rps']:>8.2f} req/s  p95 {total['p95_ms']:>8.1f}ms  "
+                    f"오류율 {total['error_rate']:.2%}"
+                )
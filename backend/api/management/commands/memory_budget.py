@@ -0,0 +1,168 @@
+import json
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# 새 프로세스에서 gunicorn preload와 같은 구조로 측정한다
+# 마스터: 앱/URLconf 로드 + 테스트 DB 준비 → fork → 워커: 요청 묶음을 스레드 N개로 반복
+PROBE = '''
+import json, os, sys, tempfile, threading
+from api.diagnostics import memory_usage
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+import django
+django.setup()
+import config.asgi
+from config import startup
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client
+from django.test.utils import setup_test_environment
+
+options = json.loads(sys.argv[1])
+setup_test_environment(debug=False)
+if connection.vendor == 'sqlite':
+    # fork 후에도 남도록 메모리 DB 대신 임시 파일 사용
+    test_db = tempfile.NamedTemporaryFile(suffix='.sqlite3', delete=False).name
+    connection.settings_dict['TEST']['NAME'] = test_db
+connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+call_command('seed_data', stdout=open(os.devnull, 'w'))
+startup.warm_up()
+startup.prepare_fork()
+master = memory_usage()
+
+read_fd, write_fd = os.pipe()
+pid = os.fork()
+if pid == 0:
+    from django.contrib.auth.models import User
+    from django.db import connections
+    from rest_framework.authtoken.models import Token
+    from api.models import BingoTemplate
+
+    token = Token.objects.get_or_create(user=User.objects.get(username='testuser'))[0].key
+    template_id = BingoTemplate.objects.values_list('id', flat=True).first()
+    paths = [
+        ('/api/home/', None), ('/api/home/', token),
+        ('/api/templates/', None), (f'/api/templates/{template_id}/', None),
+        ('/api/categories/', None), ('/api/reviews/feed/', None),
+        ('/api/leaderboard/', None), ('/api/boards/', token),
+        ('/api/restaurants/nearby/?lat=37.498&lng=127.028&radius=3000', None),
+    ]
+    errors = []
+
+    def run_mix():
+        client = Client()
+        for _ in range(options['repeat']):
+            for path, auth in paths:
+                headers = {'Authorization': f'Token {auth}'} if auth else {}
+                response = client.get(path, headers=headers)
+                if response.status_code != 200:
+                    errors.append(f'{path} {response.status_code}')
+        connections.close_all()
+
+    samples = []
+    for _ in range(options['rounds']):
+        threads = [threading.Thread(target=run_mix) for _ in range(options['threads'])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        samples.append(memory_usage())
+    os.write(write_fd, json.dumps({
+        'samples': samples,
+        'requests': options['rounds'] * options['threads'] * options['repeat'] * len(paths),
+        'errors': sorted(set(errors)),
+    }).encode())
+    os._exit(0)
+
+os.close(write_fd)
+with os.fdopen(read_fd) as pipe:
+    worker = json.loads(pipe.read() or '{}')
+os.waitpid(pid, 0)
+connection.creation.destroy_test_db(connection.settings_dict['NAME'], verbosity=0)
+print(json.dumps({'master': master, 'worker': worker}))
+'''
+
+MB = 1024 * 1024
+
+
+class Command(BaseCommand):
+    help = (
+        'preload 후 fork한 워커에 요청 묶음을 반복해 워커당 정상 상태 메모리를 측정하고 '
+        '예산을 넘으면 실패합니다 (테스트 DB와 seed_data 사용)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--budget-mb', type=float, default=64,
+                            help='워커당 메모리 예산 (USS, 없으면 RSS 기준)')
+        parser.add_argument('--max-growth-mb', type=float, default=8,
+                            help='첫 라운드 이후 허용하는 메모리 증가량 (누수 감지)')
+        parser.add_argument('--rounds', type=int, default=5)
+        parser.add_argument('--repeat', type=int, default=10, help='라운드당 스레드별 요청 묶음 반복 횟수')
+        parser.add_argument('--threads', type=int, default=2, help='워커 스레드 수 (WSGI_THREADS)')
+        parser.add_argument('--workers', type=int, default=2, help='VM 예상치 계산용 워커 수')
+        parser.add_argument('--vm-mb', type=float, default=256, help='VM 메모리 (예상치 비교용)')
+        parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+
+    def handle(self, *args, **options):
+        if options['rounds'] < 2:
+            raise CommandError('--rounds는 2 이상이어야 합니다 (증가량 비교).')
+        probe_options = {key: options[key] for key in ('rounds', 'repeat', 'threads')}
+        completed = subprocess.run(
+            [sys.executable, '-c', PROBE, json.dumps(probe_options)],
+            cwd=settings.BASE_DIR, capture_output=True, text=True,
+        )
+        if completed.returncode != 0:
+            raise CommandError(f'메모리 측정 실패:\n{completed.stderr[-2000:]}')
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        worker = result['worker']
+        if not worker.get('samples'):
+            raise CommandError(f'워커 측정 결과가 없습니다:\n{completed.stderr[-2000:]}')
+
+        # fork한 워커의 실제 몫은 USS(private), /proc가 없으면 RSS로 대신한다
+        metric = 'uss' if 'uss' in worker['samples'][-1] else 'rss'
+        series = [sample[metric] / MB for sample in worker['samples']]
+        steady, growth = series[-1], series[-1] - series[0]
+        master_rss = result['master']['rss'] / MB
+        report = {
+            'metric': metric,
+            'master_rss_mb': round(master_rss, 1),
+            'worker_rss_mb': round(worker['samples'][-1]['rss'] / MB, 1),
+            'worker_mb': round(steady, 1),
+            'growth_mb': round(growth, 1),
+            'series_mb': [round(value, 1) for value in series],
+            'requests': worker['requests'],
+            'errors': worker['errors'],
+            # 마스터 + 워커 N개 (워커는 마스터와 공유하지 않는 메모리만 더한다)
+            'projected_total_mb': round(master_rss + options['workers'] * steady, 1),
+            'budget_mb': options['budget_mb'],
+        }
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, ensure_ascii=False))
+        else:
+            self.stdout.write(
+                f"마스터 RSS {report['master_rss_mb']}MB, "
+                f"워커 {metric.upper()} {report['worker_mb']}MB (RSS {report['worker_rss_mb']}MB), "
+                f"라운드별 {report['series_mb']}"
+            )
+            self.stdout.write(
+                f"요청 {report['requests']}개, 예상 합계 (워커 {options['workers']}개) "
+                f"{report['projected_total_mb']}MB / VM {options['vm_mb']:g}MB"
+            )
+
+        problems = []
+        if worker['errors']:
+            problems.append(f"실패한 요청: {', '.join(worker['errors'])}")
+        if steady > options['budget_mb']:
+            problems.append(f"워커 메모리 {steady:.1f}MB가 예산 {options['budget_mb']:g}MB를 넘었습니다.")
+        if growth > options['max_growth_mb']:
+            problems.append(
+                f"첫 라운드 이후 {growth:.1f}MB 증가 (허용 {options['max_growth_mb']:g}MB): 누수 의심"
+            )
+        if problems:
+            raise CommandError('\n'.join(problems))
+        if not options['json']:
+            self.stdout.write(self.style.SUCCESS('메모리 예산 이내'))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from api import stats
+
+
+class Command(BaseCommand):
+    help = '관리자 대시보드 일별 집계(DailyStat)를 원본 데이터에서 다시 계산합니다'
+
+    def handle(self, *args, **options):
+        days = stats.rebuild()
+        self.stdout.write(self.style.SUCCESS(f'일별 집계 재계산 완료: {days}일'))
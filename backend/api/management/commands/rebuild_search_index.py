@@ -0,0 +1,43 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from api.models import Restaurant, SearchNgram
+from api.search import text_ngrams, uses_trigram_index
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = '관리자 검색용 n-gram 색인을 다시 생성합니다 (PostgreSQL은 pg_trgm 인덱스 사용)'
+
+    def handle(self, *args, **options):
+        if uses_trigram_index():
+            self.stdout.write('PostgreSQL은 pg_trgm 인덱스를 사용하므로 재생성이 필요 없습니다')
+            return
+
+        with transaction.atomic():
+            SearchNgram.objects.all().delete()
+            count = self._index(
+                'restaurant', Restaurant.objects.values_list('id', 'name', 'address')
+            )
+            count += self._index(
+                'user', User.objects.values_list('id', 'username', 'email')
+            )
+
+        self.stdout.write(self.style.SUCCESS(f'검색 색인 생성 완료: {count}개 gram'))
+
+    def _index(self, kind, rows, batch_size=1000):
+        batch = []
+        count = 0
+        for pk, *texts in rows.iterator():
+            batch.extend(
+                SearchNgram(kind=kind, object_id=pk, gram=gram)
+                for gram in text_ngrams(*texts)
+            )
+            if len(batch) >= batch_size:
+                SearchNgram.objects.bulk_create(batch)
+                count += len(batch)
+                batch = []
+        SearchNgram.objects.bulk_create(batch)
+        return count + len(batch)
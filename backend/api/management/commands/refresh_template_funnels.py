@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from api import analytics
+
+
+class Command(BaseCommand):
+    help = '변경된(stale) 템플릿 퍼널 집계를 다시 계산합니다 (주기 실행용)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rebuild-masks', action='store_true',
+            help='리뷰로 모든 보드의 활성 마스크를 다시 계산한 뒤 전체 퍼널을 갱신합니다 '
+                 '(템플릿 아이템 포지션을 바꾼 경우)',
+        )
+
+    def handle(self, *args, **options):
+        if options['rebuild_masks']:
+            changed = analytics.rebuild_masks()
+            self.stdout.write(f'보드 활성 마스크 재계산: {changed}개 변경')
+        refreshed = analytics.refresh_stale()
+        self.stdout.write(self.style.SUCCESS(f'템플릿 퍼널 재계산 완료: {refreshed}개'))
@@ -0,0 +1,51 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.models import BingoTemplate
+from api.services_simulation import TemplateSimulator
+
+
+class Command(BaseCommand):
+    help = '빙고 템플릿 난이도를 몬테카를로 시뮬레이션으로 추정합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('template_id', type=int)
+        parser.add_argument('--simulations', type=int, default=100_000)
+        parser.add_argument('--mode', choices=TemplateSimulator.MODES, default='random')
+        parser.add_argument('--seed', type=int, default=None)
+        parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+
+    def handle(self, *args, **options):
+        try:
+            template = BingoTemplate.objects.get(id=options['template_id'])
+        except BingoTemplate.DoesNotExist:
+            raise CommandError(f"템플릿을 찾을 수 없습니다: {options['template_id']}")
+
+        started = time.perf_counter()
+        try:
+            result = TemplateSimulator.simulate_template(
+                template,
+                simulations=options['simulations'],
+                mode=options['mode'],
+                seed=options['seed'],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+        elapsed = time.perf_counter() - started
+
+        if options['json']:
+            self.stdout.write(json.dumps(result, ensure_ascii=False))
+            return
+
+        self.stdout.write(
+            f"{template.title} - {result['simulations']:,}회 ({result['mode']}) {elapsed:.2f}초"
+        )
+        self.stdout.write('라인  기대 방문  p50  p90  기대 거리(km)  p90 거리(km)')
+        for lines, stats in result['milestones'].items():
+            self.stdout.write(
+                f"{lines:>4}  {stats['expected_visits']:>9}  {stats['p50_visits']:>3}  "
+                f"{stats['p90_visits']:>3}  {stats['expected_distance_km']:>13}  "
+                f"{stats['p90_distance_km']:>12}"
+            )
@@ -0,0 +1,124 @@
+import json
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# 새 프로세스에서 gunicorn 마스터와 같은 순서로 기동 단계를 재고 JSON으로 출력한다
+PROBE = '''
+import json, os, sys, time
+started = time.perf_counter()
+phases = {}
+
+def mark(name):
+    global started
+    now = time.perf_counter()
+    phases[name] = round(now - started, 4)
+    started = now
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+import django
+django.setup()
+mark('django_setup')
+import config.asgi
+mark('app_load')
+from config import startup
+if %(check_migrations)r:
+    pending = len(startup.pending_migrations())
+    mark('migration_check')
+else:
+    pending = None
+startup.warm_up()
+mark('urlconf')
+print(json.dumps({
+    'phases': phases,
+    'pending_migrations': pending,
+    'deferred_imported': sorted(set(%(deferred)r) & set(sys.modules)),
+}))
+'''
+
+# 기동 시 import되면 안 되는 모듈 (첫 사용 시 지연 import)
+# requests는 rest_framework.compat이 선택적으로 import하므로 목록에서 제외한다
+DEFERRED_MODULES = (
+    'cloudinary',
+    'cloudinary_storage',
+    'api.services_oauth',
+    'numpy',
+    'PIL.Image',
+)
+
+
+def parse_importtime(stderr, top):
+    """python -X importtime 출력에서 누적 시간이 큰 최상위 import 목록"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # 들여쓰기가 없는 줄이 다른 모듈이 아닌 기동 코드에서 직접 import한 모듈
+        if not name[1:].startswith(' '):
+            entries.append((name.strip(), int(cumulative) / 1_000_000))
+    entries.sort(key=lambda entry: entry[1], reverse=True)
+    return [{'module': name, 'seconds': round(seconds, 4)} for name, seconds in entries[:top]]
+
+
+class Command(BaseCommand):
+    help = '서버 기동 단계별 시간과 import 비용을 측정합니다 (콜드 스타트 회귀 추적용)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=15, help='표시할 import 개수')
+        parser.add_argument('--skip-migrations', action='store_true',
+                            help='마이그레이션 확인 단계를 건너뜁니다 (DB 접속 없음)')
+        parser.add_argument('--max-seconds', type=float, default=None,
+                            help='전체 기동 시간이 이 값을 넘으면 실패합니다')
+        parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+
+    def handle(self, *args, **options):
+        probe = PROBE % {
+            'check_migrations': not options['skip_migrations'],
+            'deferred': DEFERRED_MODULES,
+        }
+        started = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', probe],
+            cwd=settings.BASE_DIR, capture_output=True, text=True,
+        )
+        total = time.perf_counter() - started
+        if completed.returncode != 0:
+            raise CommandError(f'기동 측정 실패:\n{completed.stderr[-2000:]}')
+
+        probe_result = json.loads(completed.stdout.strip().splitlines()[-1])
+        phases = probe_result['phases']
+        report = {
+            'total_seconds': round(total, 4),
+            # 인터프리터 기동 + 프로세스 생성/종료 (측정 단계 외 시간)
+            'interpreter_seconds': round(total - sum(phases.values()), 4),
+            'phases': phases,
+            'pending_migrations': probe_result['pending_migrations'],
+            'deferred_imported': probe_result['deferred_imported'],
+            'top_imports': parse_importtime(completed.stderr, options['top']),
+        }
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, ensure_ascii=False))
+        else:
+            self.stdout.write(f"전체 기동: {report['total_seconds']:.3f}s "
+                              f"(인터프리터 {report['interpreter_seconds']:.3f}s)")
+            for name, seconds in phases.items():
+                self.stdout.write(f'  {name:<16} {seconds:.3f}s')
+            if report['pending_migrations'] is not None:
+                self.stdout.write(f"적용 대기 마이그레이션: {report['pending_migrations']}개")
+            self.stdout.write('누적 import 시간 상위:')
+            for entry in report['top_imports']:
+                self.stdout.write(f"  {entry['module']:<40} {entry['seconds']:.3f}s")
+            if report['deferred_imported']:
+                self.stdout.write(self.style.WARNING(
+                    f"기동 중 import된 지연 대상 모듈: {', '.join(report['deferred_imported'])}"
+                ))
+
+        if options['max_seconds'] is not None and total > options['max_seconds']:
+            raise CommandError(
+                f"기동 시간 {total:.2f}s가 기준 {options['max_seconds']:.2f}s를 넘었습니다."
+            )
@@ -0,0 +1,87 @@
+# Generated by Django 6.0.1 on 2026-10-19 15:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+TRIGRAM_INDEXES = [
+    ('api_restaurant_name_trgm', 'api_restaurant', 'name'),
+    ('api_restaurant_address_trgm', 'api_restaurant', 'address'),
+    ('auth_user_username_trgm', 'auth_user', 'username'),
+    ('auth_user_email_trgm', 'auth_user', 'email'),
+]
+
+
+def _word_grams(word):
+    grams = set(word)
+    grams.update(word[i:i + 2] for i in range(len(word) - 1))
+    return grams
+
+
+def _text_ngrams(*texts):
+    grams = set()
+    for text in texts:
+        for word in (text or '').lower().split():
+            grams |= _word_grams(word)
+    return grams
+
+
+def build_search_index(apps, schema_editor):
+    """PostgreSQL: pg_trgm GIN 인덱스 생성 / 그 외: n-gram 테이블 백필"""
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for name, table, column in TRIGRAM_INDEXES:
+            # icontains는 UPPER("col"::text) LIKE UPPER(...)로 컴파일되므로 같은 식으로 색인
+            schema_editor.execute(
+                f'CREATE INDEX IF NOT EXISTS {name} ON {table} '
+                f'USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+            )
+        return
+
+    SearchNgram = apps.get_model('api', 'SearchNgram')
+    Restaurant = apps.get_model('api', 'Restaurant')
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+
+    rows = []
+    for pk, name, address in Restaurant.objects.values_list('id', 'name', 'address'):
+        rows.extend(
+            SearchNgram(kind='restaurant', object_id=pk, gram=gram)
+            for gram in _text_ngrams(name, address)
+        )
+    for pk, username, email in User.objects.values_list('id', 'username', 'email'):
+        rows.extend(
+            SearchNgram(kind='user', object_id=pk, gram=gram)
+            for gram in _text_ngrams(username, email)
+        )
+    SearchNgram.objects.bulk_create(rows, batch_size=1000)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        for name, _, _ in TRIGRAM_INDEXES:
+            schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_bingoboard_api_bingobo_user_id_8605b2_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchNgram',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('restaurant', 'Restaurant'), ('user', 'User')], max_length=20)),
+                ('object_id', models.BigIntegerField()),
+                ('gram', models.CharField(max_length=2)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['kind', 'gram', 'object_id'], name='api_searchn_kind_2b26d7_idx')],
+                'unique_together': {('kind', 'object_id', 'gram')},
+            },
+        ),
+        migrations.RunPython(build_search_index, drop_search_index),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 6.0.1 on 2026-10-19 15:54
+
+from django.db import migrations, models
+
+
+GEOHASH_ALPHABET = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+
+def _encode_geohash(latitude, longitude, precision=9):
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        rng, value = (lng_range, float(longitude)) if even else (lat_range, float(latitude))
+        mid = (rng[0] + rng[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            rng[0] = mid
+        else:
+            bits <<= 1
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(GEOHASH_ALPHABET[bits])
+            bits = 0
+            bit_count = 0
+    return ''.join(chars)
+
+
+def backfill_geohash(apps, schema_editor):
+    Restaurant = apps.get_model('api', 'Restaurant')
+    restaurants = list(Restaurant.objects.only('id', 'latitude', 'longitude'))
+    for restaurant in restaurants:
+        restaurant.geohash = _encode_geohash(restaurant.latitude, restaurant.longitude)
+    Restaurant.objects.bulk_update(restaurants, ['geohash'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_search_ngram'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='restaurant',
+            name='geohash',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=12),
+        ),
+        migrations.RunPython(backfill_geohash, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 6.0.1 on 2026-10-19 16:20
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_restaurant_geohash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bingotemplate',
+            name='size',
+            field=models.PositiveSmallIntegerField(choices=[(3, '3x3'), (4, '4x4'), (5, '5x5'), (7, '7x7')], default=5),
+        ),
+        migrations.AlterField(
+            model_name='bingotemplateitem',
+            name='position',
+            field=models.IntegerField(validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(48)]),
+        ),
+    ]
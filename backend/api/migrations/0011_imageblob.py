@@ -0,0 +1,35 @@
+# Generated by Django 6.0.1 on 2026-10-19 16:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_bingotemplate_size'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImageBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('phash', models.CharField(db_index=True, max_length=16)),
+                ('phash_band0', models.PositiveIntegerField(db_index=True)),
+                ('phash_band1', models.PositiveIntegerField(db_index=True)),
+                ('phash_band2', models.PositiveIntegerField(db_index=True)),
+                ('phash_band3', models.PositiveIntegerField(db_index=True)),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('size', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('near_duplicate_of', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='near_duplicates', to='api.imageblob')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='image_blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='reviews', to='api.imageblob'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0.1 on 2026-10-19 18:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_imageblob'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reviewcomment',
+            index=models.Index(fields=['review', 'created_at'], name='api_reviewc_review__5da7a4_idx'),
+        ),
+    ]
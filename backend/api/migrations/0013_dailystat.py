@@ -0,0 +1,65 @@
+# Generated by Django 6.0.1 on 2026-10-19 19:20
+
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+METRIC_SOURCES = {
+    'signups': (settings.AUTH_USER_MODEL, 'date_joined'),
+    'boards_created': ('api.BingoBoard', 'created_at'),
+    'boards_completed': ('api.BingoBoard', 'completed_at'),
+    'reviews': ('api.Review', 'created_at'),
+    'likes': ('api.ReviewLike', 'created_at'),
+    'comments': ('api.ReviewComment', 'created_at'),
+}
+
+
+def backfill_daily_stats(apps, schema_editor):
+    """기존 데이터로 일별 집계 생성"""
+    DailyStat = apps.get_model('api', 'DailyStat')
+    rows = defaultdict(dict)
+    for metric, (model_label, field) in METRIC_SOURCES.items():
+        model = apps.get_model(model_label)
+        counts = (
+            model.objects.filter(**{f'{field}__isnull': False}).order_by()
+            .annotate(day=TruncDate(field)).values('day')
+            .annotate(total=Count('pk')).values_list('day', 'total')
+        )
+        for day, total in counts:
+            rows[day][metric] = total
+    DailyStat.objects.bulk_create(
+        [DailyStat(date=day, **values) for day, values in sorted(rows.items())],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_reviewcomment_review_created_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True)),
+                ('signups', models.IntegerField(default=0)),
+                ('boards_created', models.IntegerField(default=0)),
+                ('boards_completed', models.IntegerField(default=0)),
+                ('reviews', models.IntegerField(default=0)),
+                ('likes', models.IntegerField(default=0)),
+                ('comments', models.IntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['date'],
+            },
+        ),
+        migrations.RunPython(backfill_daily_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 6.0.1 on 2026-10-19 19:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_activated_masks(apps, schema_editor):
+    """기존 리뷰로 보드별 활성 포지션 비트마스크 채우기"""
+    BingoBoard = apps.get_model('api', 'BingoBoard')
+    BingoTemplateItem = apps.get_model('api', 'BingoTemplateItem')
+    Review = apps.get_model('api', 'Review')
+    positions = {
+        (template_id, restaurant_id): position
+        for template_id, restaurant_id, position in
+        BingoTemplateItem.objects.values_list('template_id', 'restaurant_id', 'position')
+    }
+    masks = {}
+    reviews = Review.objects.values_list('bingo_board_id', 'bingo_board__template_id', 'restaurant_id')
+    for board_id, template_id, restaurant_id in reviews.iterator():
+        position = positions.get((template_id, restaurant_id))
+        if position is not None:
+            masks[board_id] = masks.get(board_id, 0) | (1 << position)
+    BingoBoard.objects.bulk_update(
+        [BingoBoard(pk=board_id, activated_mask=mask) for board_id, mask in masks.items()],
+        ['activated_mask'], batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_dailystat'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bingoboard',
+            name='activated_mask',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='TemplateFunnel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('boards_started', models.IntegerField(default=0)),
+                ('boards_activated', models.IntegerField(default=0)),
+                ('reached_1_line', models.IntegerField(default=0)),
+                ('reached_3_lines', models.IntegerField(default=0)),
+                ('reached_5_lines', models.IntegerField(default=0)),
+                ('boards_completed', models.IntegerField(default=0)),
+                ('median_completion_seconds', models.FloatField(blank=True, null=True)),
+                ('cell_counts', models.JSONField(default=list)),
+                ('near_miss_counts', models.JSONField(default=list)),
+                ('drop_off_position', models.IntegerField(blank=True, null=True)),
+                ('is_stale', models.BooleanField(default=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('template', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='funnel', to='api.bingotemplate')),
+            ],
+        ),
+        migrations.RunPython(backfill_activated_masks, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 6.0.1 on 2026-10-19 21:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_templatefunnel'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='review',
+            name='api_review_is_publ_38eb6f_idx',
+        ),
+        migrations.AddIndex(
+            model_name='bingoboard',
+            index=models.Index(condition=models.Q(('is_completed', True)), fields=['user', '-completed_at'], name='board_user_completed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='restaurant',
+            index=models.Index(fields=['-created_at'], name='restaurant_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='restaurant',
+            index=models.Index(condition=models.Q(('is_approved', False)), fields=['-created_at'], name='restaurant_pending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(condition=models.Q(('is_public', True)), fields=['-created_at'], name='review_public_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['user', '-created_at'], name='review_user_created_idx'),
+        ),
+    ]
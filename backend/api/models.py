@@ -1,6 +1,8 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator, MinLengthValidator
+from .geo import encode_geohash
 from .validators import validate_image_file_size
 
 
@@ -23,6 +25,8 @@ class Restaurant(models.Model):
     address = models.CharField(max_length=500)
     latitude = models.DecimalField(max_digits=10, decimal_places=7)
     longitude = models.DecimalField(max_digits=10, decimal_places=7)
+    # 위치 기반 조회용 geohash (latitude/longitude로부터 save 시 자동 계산)
+    geohash = models.CharField(max_length=12, blank=True, db_index=True, editable=False)
     kakao_place_id = models.CharField(max_length=100, blank=True)
     place_url = models.URLField(blank=True)
     is_approved = models.BooleanField(default=False)
@@ -31,22 +35,53 @@ class Restaurant(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Admin 식당 목록 (최신순), 승인 대기 목록은 대기 중인 식당만 담는 부분 인덱스
+            models.Index(fields=['-created_at'], name='restaurant_created_idx'),
+            models.Index(
+                fields=['-created_at'], condition=models.Q(is_approved=False),
+                name='restaurant_pending_idx',
+            ),
+        ]
+
     def __str__(self):
         return f"{self.name} ({self.category.name})"
 
+    def save(self, *args, **kwargs):
+        if self.latitude is not None and self.longitude is not None:
+            self.geohash = encode_geohash(self.latitude, self.longitude)
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None and {'latitude', 'longitude'} & set(update_fields):
+                kwargs['update_fields'] = {*update_fields, 'geohash'}
+        super().save(*args, **kwargs)
+
 
 class BingoTemplate(models.Model):
+    SIZE_CHOICES = [
+        (3, "3x3"),
+        (4, "4x4"),
+        (5, "5x5"),
+        (7, "7x7"),
+    ]
+    MAX_SIZE = 7
+
     category = models.ForeignKey(
         Category, on_delete=models.CASCADE, related_name="templates"
     )
     title = models.CharField(max_length=200)
     description = models.TextField(blank=True)
+    size = models.PositiveSmallIntegerField(choices=SIZE_CHOICES, default=5)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
         return self.title
 
+    @property
+    def cell_count(self):
+        return self.size * self.size
+
 
 class BingoTemplateItem(models.Model):
     template = models.ForeignKey(
@@ -56,7 +91,10 @@ class BingoTemplateItem(models.Model):
         Restaurant, on_delete=models.CASCADE, related_name="template_items"
     )
     position = models.IntegerField(
-        validators=[MinValueValidator(0), MaxValueValidator(24)]
+        validators=[
+            MinValueValidator(0),
+            MaxValueValidator(BingoTemplate.MAX_SIZE * BingoTemplate.MAX_SIZE - 1),
+        ]
     )
 
     class Meta:
@@ -66,6 +104,15 @@ class BingoTemplateItem(models.Model):
     def __str__(self):
         return f"{self.template.title} - Position {self.position}: {self.restaurant.name}"
 
+    def clean(self):
+        super().clean()
+        if self.template_id and self.position is not None \
+                and self.position >= self.template.cell_count:
+            raise ValidationError({
+                'position': f'{self.template.size}x{self.template.size} 템플릿의 포지션은 '
+                            f'0~{self.template.cell_count - 1} 사이여야 합니다.'
+            })
+
 
 class BingoBoard(models.Model):
     TARGET_CHOICES = [
@@ -82,17 +129,50 @@ class BingoBoard(models.Model):
     is_completed = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     completed_at = models.DateTimeField(null=True, blank=True)
+    # 리뷰로 활성화된 포지션 비트마스크 (position p → bit p, 템플릿 퍼널 집계용)
+    activated_mask = models.BigIntegerField(default=0)
 
     class Meta:
         indexes = [
             models.Index(fields=['user', '-created_at']),
             models.Index(fields=['is_completed', 'completed_at']),
+            # 프로필 최근 완료 보드 (완료된 보드만 담는 부분 인덱스)
+            models.Index(
+                fields=['user', '-completed_at'], condition=models.Q(is_completed=True),
+                name='board_user_completed_idx',
+            ),
         ]
 
     def __str__(self):
         return f"{self.user.username}'s {self.template.title} Board"
 
 
+class ImageBlob(models.Model):
+    """
+    콘텐츠 주소 기반 이미지 저장 단위 (같은 내용의 이미지는 한 번만 저장)
+
+    - sha256: 원본 바이트 해시 (완전 동일 이미지 조회)
+    - phash: 64비트 dHash (16진수), phash_band0~3: 16비트씩 나눈 값
+      해밍 거리 3 이하인 해시는 네 밴드 중 하나 이상이 반드시 같으므로
+      밴드 인덱스로 유사 이미지 후보를 찾는다.
+    """
+    sha256 = models.CharField(max_length=64, unique=True)
+    phash = models.CharField(max_length=16, db_index=True)
+    phash_band0 = models.PositiveIntegerField(db_index=True)
+    phash_band1 = models.PositiveIntegerField(db_index=True)
+    phash_band2 = models.PositiveIntegerField(db_index=True)
+    phash_band3 = models.PositiveIntegerField(db_index=True)
+    name = models.CharField(max_length=255, unique=True)
+    size = models.PositiveIntegerField(default=0)
+    near_duplicate_of = models.ForeignKey(
+        "self", on_delete=models.SET_NULL, null=True, blank=True, related_name="near_duplicates"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.name
+
+
 class Review(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="reviews")
     bingo_board = models.ForeignKey(
@@ -102,6 +182,9 @@ class Review(models.Model):
         Restaurant, on_delete=models.CASCADE, related_name="reviews"
     )
     image = models.ImageField(upload_to="reviews/", validators=[validate_image_file_size])
+    image_blob = models.ForeignKey(
+        ImageBlob, on_delete=models.SET_NULL, null=True, blank=True, related_name="reviews"
+    )
     content = models.TextField(validators=[MinLengthValidator(10)])
     rating = models.IntegerField(
         validators=[MinValueValidator(1), MaxValueValidator(5)]
@@ -113,7 +196,13 @@ class Review(models.Model):
     class Meta:
         unique_together = ["bingo_board", "restaurant"]
         indexes = [
-            models.Index(fields=['is_public', '-created_at']),
+            # 공개 리뷰 피드 (공개 리뷰만 담는 부분 인덱스)
+            models.Index(
+                fields=['-created_at'], condition=models.Q(is_public=True),
+                name='review_public_feed_idx',
+            ),
+            # 내 리뷰 목록 / 프로필 최근 리뷰
+            models.Index(fields=['user', '-created_at'], name='review_user_created_idx'),
         ]
 
     def __str__(self):
@@ -137,6 +226,9 @@ class ReviewComment(models.Model):
 
     class Meta:
         ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['review', 'created_at']),
+        ]
 
 
 class UserProfile(models.Model):
@@ -174,3 +266,75 @@ class SocialAccount(models.Model):
 
     def __str__(self):
         return f"{self.user.username} - {self.provider}"
+
+
+class DailyStat(models.Model):
+    """
+    일별 활동 집계 (관리자 대시보드용)
+
+    활동이 생기거나 삭제될 때 그날(Asia/Seoul) 행을 증감하고,
+    rebuild_daily_stats 명령으로 원본 테이블에서 다시 계산할 수 있다.
+    """
+    date = models.DateField(unique=True)
+    signups = models.IntegerField(default=0)
+    boards_created = models.IntegerField(default=0)
+    boards_completed = models.IntegerField(default=0)
+    reviews = models.IntegerField(default=0)
+    likes = models.IntegerField(default=0)
+    comments = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ['date']
+
+    def __str__(self):
+        return f"{self.date} stats"
+
+
+class TemplateFunnel(models.Model):
+    """
+    템플릿별 진행 퍼널 집계 (관리자 분석용)
+
+    리뷰/보드 변경 시 is_stale만 표시하고, 보드별 activated_mask를 모아
+    다시 계산한다 (처음 조회 시 또는 refresh_template_funnels 명령).
+    """
+    template = models.OneToOneField(
+        BingoTemplate, on_delete=models.CASCADE, related_name="funnel"
+    )
+    boards_started = models.IntegerField(default=0)
+    boards_activated = models.IntegerField(default=0)
+    reached_1_line = models.IntegerField(default=0)
+    reached_3_lines = models.IntegerField(default=0)
+    reached_5_lines = models.IntegerField(default=0)
+    boards_completed = models.IntegerField(default=0)
+    median_completion_seconds = models.FloatField(null=True, blank=True)
+    # 포지션별 활성화된 보드 수 (히트맵)
+    cell_counts = models.JSONField(default=list)
+    # 미완료 보드에서 한 칸만 남은 라인의 빈 칸 횟수 (이탈 지점)
+    near_miss_counts = models.JSONField(default=list)
+    drop_off_position = models.IntegerField(null=True, blank=True)
+    is_stale = models.BooleanField(default=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.template.title} funnel"
+
+
+class SearchNgram(models.Model):
+    """관리자 검색용 n-gram 역색인 (pg_trgm을 쓸 수 없는 DB용)"""
+    KIND_CHOICES = [
+        ('restaurant', 'Restaurant'),
+        ('user', 'User'),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.BigIntegerField()
+    gram = models.CharField(max_length=2)
+
+    class Meta:
+        unique_together = [['kind', 'object_id', 'gram']]
+        indexes = [
+            models.Index(fields=['kind', 'gram', 'object_id']),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.object_id} '{self.gram}'"
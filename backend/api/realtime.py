@@ -0,0 +1,181 @@
+"""
+리뷰 좋아요/댓글 실시간 이벤트 브로커 (SSE 스트림용)
+
+- InProcessBroker: 같은 프로세스의 구독자에게 바로 전달 (SQLite/테스트)
+- PostgresBroker: pg_notify로 발행하고, 프로세스마다 LISTEN 전용 스레드가
+  알림을 받아 그 프로세스의 구독자에게 전달한다 (gunicorn 워커 간 fan-out)
+
+구독자는 이벤트 루프에서 asyncio.Queue로 이벤트를 받고,
+발행은 동기 뷰/시그널(다른 스레드)에서 call_soon_threadsafe로 넘긴다.
+"""
+import asyncio
+import json
+import logging
+import select
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = 'review_events'
+# 구독자 큐 한도 (느린 클라이언트 때문에 메모리가 늘지 않도록 초과분은 버린다)
+SUBSCRIBER_QUEUE_SIZE = 100
+LISTEN_POLL_SECONDS = 5
+LISTEN_RETRY_SECONDS = 3
+
+
+class Subscription:
+    """특정 리뷰 id들의 이벤트를 받는 구독 (이벤트 루프 안에서 생성)"""
+
+    def __init__(self, broker, review_ids):
+        self.broker = broker
+        self.review_ids = frozenset(review_ids)
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def offer(self, event):
+        """다른 스레드에서 호출 가능"""
+        if event.get('review_id') in self.review_ids:
+            self.loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning('review event dropped for slow subscriber: %s', event.get('type'))
+
+    async def get(self, timeout=None):
+        """다음 이벤트 (timeout 초 동안 없으면 None)"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class InProcessBroker:
+    def __init__(self):
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self, review_ids):
+        subscription = Subscription(self, review_ids)
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscribers)
+
+    def publish(self, event):
+        self.dispatch(event)
+
+    def dispatch(self, event):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            subscription.offer(event)
+
+
+class PostgresBroker(InProcessBroker):
+    """LISTEN/NOTIFY 기반 프로세스 간 fan-out (psycopg2/psycopg 3 모두 지원)"""
+
+    def __init__(self, alias='default'):
+        super().__init__()
+        self.alias = alias
+        self._listener = None
+
+    def publish(self, event):
+        # 자기 프로세스 구독자에게도 LISTEN 스레드를 통해 전달되므로 직접 dispatch하지 않는다
+        with connections[self.alias].cursor() as cursor:
+            cursor.execute('SELECT pg_notify(%s, %s)', [CHANNEL, json.dumps(event)])
+
+    def subscribe(self, review_ids):
+        self._ensure_listener()
+        return super().subscribe(review_ids)
+
+    def _ensure_listener(self):
+        with self._lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(
+                    target=self._listen_forever, name='review-events-listener', daemon=True
+                )
+                self._listener.start()
+
+    def _listen_forever(self):
+        while True:
+            try:
+                self._listen()
+            except Exception:
+                logger.exception('review events listener failed, reconnecting')
+            time.sleep(LISTEN_RETRY_SECONDS)
+
+    def _listen(self):
+        wrapper = connections[self.alias]
+        # 트랜잭션 풀러는 LISTEN 세션을 유지하지 못하므로 직접 연결 설정이 있으면 그쪽으로 붙는다
+        params = {**wrapper.get_connection_params(), **(settings.REALTIME_LISTEN_PARAMS or {})}
+        # 연결 풀(OPTIONS['pool'])을 쓰더라도 풀 밖에서 직접 연다: get_new_connection은 풀이 있으면
+        # params를 무시하고 풀에서 꺼내므로, LISTEN 연결이 요청용 풀 자리를 계속 차지하게 된다
+        conn = wrapper.Database.connect(**params)
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(f'LISTEN {CHANNEL}')
+            if hasattr(conn, 'poll'):
+                self._listen_psycopg2(conn)
+            else:
+                self._listen_psycopg3(conn)
+        finally:
+            conn.close()
+
+    def _listen_psycopg2(self, conn):
+        while True:
+            if select.select([conn], [], [], LISTEN_POLL_SECONDS) == ([], [], []):
+                continue
+            conn.poll()
+            while conn.notifies:
+                self._handle(conn.notifies.pop(0).payload)
+
+    def _listen_psycopg3(self, conn):
+        while True:
+            for notify in conn.notifies(timeout=LISTEN_POLL_SECONDS):
+                self._handle(notify.payload)
+
+    def _handle(self, payload):
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning('invalid review event payload: %s', payload[:200])
+            return
+        self.dispatch(event)
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    """DB 종류에 맞는 프로세스 전역 브로커"""
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            if connections['default'].vendor == 'postgresql':
+                _broker = PostgresBroker()
+            else:
+                _broker = InProcessBroker()
+        return _broker
+
+
+def publish(event):
+    """이벤트 발행 (동기 코드용)"""
+    get_broker().publish(event)
@@ -0,0 +1,134 @@
+"""
+읽기 전용 복제본(replica) 라우팅
+
+공개 조회 API(피드, 리더보드, 카테고리, 템플릿)만 replica_reads() 안에서 조회를 복제본으로 보낸다.
+그 밖의 조회와 모든 쓰기는 기본 DB(primary)를 쓴다.
+
+복제 지연 때문에 방금 쓴 내용이 복제본에 아직 없을 수 있으므로 (read-your-writes)
+쓰기 요청이 성공하면 PrimaryPinMiddleware가 REPLICA_PIN_SECONDS 동안 그 사용자를 기본 DB에 고정한다.
+- 로그인 사용자: 캐시 키 replica_pin:<user_id> (토큰 인증 SPA는 다른 도메인이라 쿠키가 오지 않는다)
+- 그 밖에: 쿠키
+워커/머신이 여럿이면 고정이 공유되도록 캐시도 공유되어야 한다 (CACHE_TABLE 설정).
+
+READ_REPLICA_ALIAS 설정이 없거나 복제본이 기본 DB와 같은 DB를 가리키면(테스트 미러 포함)
+모두 기본 DB를 쓴다.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PIN_COOKIE = 'db_primary_pin'
+PIN_CACHE_KEY = 'replica_pin:{}'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# 현재 조회를 보낼 복제본 alias (None이면 기본 DB)
+_replica_alias = ContextVar('replica_alias', default=None)
+
+
+def replica_alias():
+    """사용할 복제본 alias, 미설정이거나 기본 DB와 같은 DB면 None"""
+    alias = settings.READ_REPLICA_ALIAS
+    if not alias:
+        return None
+    replica, primary = connections.settings[alias], connections.settings[DEFAULT_DB_ALIAS]
+    if all(replica.get(key) == primary.get(key) for key in ('ENGINE', 'HOST', 'PORT', 'NAME')):
+        return None
+    return alias
+
+
+def _authenticated_user(request):
+    user = getattr(request, 'user', None)
+    return user if user is not None and user.is_authenticated else None
+
+
+def is_pinned(request):
+    """최근 쓰기로 기본 DB에 고정된 사용자(캐시) 또는 클라이언트(쿠키)인지"""
+    if PIN_COOKIE in request.COOKIES:
+        return True
+    user = _authenticated_user(request)
+    return user is not None and cache.get(PIN_CACHE_KEY.format(user.pk)) is not None
+
+
+@contextmanager
+def replica_reads(request):
+    """블록 안의 조회를 복제본으로 보낸다 (복제본 미설정 / 고정된 사용자면 기본 DB)"""
+    alias = replica_alias()
+    token = _replica_alias.set(alias if alias and not is_pinned(request) else None)
+    try:
+        yield
+    finally:
+        _replica_alias.reset(token)
+
+
+def reads_from_replica(view_func):
+    """함수 뷰 데코레이터 (@api_view 아래에 두어 인증이 끝난 뒤 적용)"""
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        with replica_reads(request):
+            return view_func(request, *args, **kwargs)
+    return wrapper
+
+
+class ReplicaReadMixin:
+    """읽기 전용 ViewSet의 list/retrieve 조회를 복제본으로 보낸다"""
+
+    def list(self, request, *args, **kwargs):
+        with replica_reads(request):
+            return super().list(request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        with replica_reads(request):
+            return super().retrieve(request, *args, **kwargs)
+
+
+class ReplicaRouter:
+    """replica_reads() 안의 조회만 복제본으로, 쓰기/마이그레이션은 기본 DB로"""
+
+    def db_for_read(self, model, **hints):
+        # DB 캐시(복제본 고정 키)는 방금 쓴 값을 봐야 하므로 항상 기본 DB에서 읽는다
+        if model._meta.app_label == 'django_cache':
+            return DEFAULT_DB_ALIAS
+        return _replica_alias.get()
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 기본 DB와 같은 데이터이므로 두 DB에서 읽은 객체끼리 관계를 허용한다
+        same_data = {DEFAULT_DB_ALIAS, settings.READ_REPLICA_ALIAS}
+        if obj1._state.db in same_data and obj2._state.db in same_data:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # 복제본 스키마는 복제로 따라온다
+        if settings.READ_REPLICA_ALIAS and db == settings.READ_REPLICA_ALIAS:
+            return False
+        return None
+
+
+class PrimaryPinMiddleware:
+    """
+    성공한 쓰기 요청 뒤 REPLICA_PIN_SECONDS 동안 이 사용자/클라이언트의 조회를 기본 DB로 고정
+    (토큰 인증 사용자는 DRF가 인증한 뒤 request.user에 넣어 주므로 응답 시점에 알 수 있다)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if (settings.READ_REPLICA_ALIAS and request.method not in SAFE_METHODS
+                and response.status_code < 400):
+            user = _authenticated_user(request)
+            if user is not None:
+                cache.set(PIN_CACHE_KEY.format(user.pk), 1, settings.REPLICA_PIN_SECONDS)
+            response.set_cookie(
+                PIN_COOKIE, '1', max_age=settings.REPLICA_PIN_SECONDS,
+                secure=request.is_secure(), httponly=True, samesite='Lax',
+            )
+        return response
@@ -0,0 +1,116 @@
+"""
+관리자 검색 색인
+
+- PostgreSQL: pg_trgm GIN 인덱스(UPPER(col) gin_trgm_ops)가 icontains(ILIKE)를 가속하고
+  TrigramWordSimilarity로 결과를 정렬한다.
+- SQLite 등: SearchNgram 테이블(1-gram + 2-gram 역색인)로 후보 id를 좁힌 뒤
+  후보 집합에서만 icontains로 최종 확인한다. 한글 부분 일치(예: '밀대')도 색인을 탄다.
+"""
+from django.db import connections, transaction
+from django.db.models import Case, Count, IntegerField, Value, When
+from rest_framework import filters
+
+from .models import SearchNgram
+
+
+def uses_trigram_index(using='default'):
+    """pg_trgm 인덱스를 사용하는 DB인지 (n-gram 테이블 유지 불필요)"""
+    return connections[using].vendor == 'postgresql'
+
+
+def _word_grams(word):
+    grams = set(word)
+    grams.update(word[i:i + 2] for i in range(len(word) - 1))
+    return grams
+
+
+def text_ngrams(*texts):
+    """색인할 텍스트들의 1-gram/2-gram 집합 (단어 단위, 소문자)"""
+    grams = set()
+    for text in texts:
+        for word in (text or '').lower().split():
+            grams |= _word_grams(word)
+    return grams
+
+
+def term_ngrams(term):
+    """검색어에 대한 조회용 gram 집합 (2자 이상이면 2-gram만 사용)"""
+    grams = set()
+    for word in term.lower().split():
+        if len(word) == 1:
+            grams.add(word)
+        else:
+            grams.update(word[i:i + 2] for i in range(len(word) - 1))
+    return grams
+
+
+def update_ngrams(kind, object_id, *texts):
+    """객체 하나의 n-gram 색인을 갱신한다"""
+    grams = text_ngrams(*texts)
+    with transaction.atomic():
+        SearchNgram.objects.filter(kind=kind, object_id=object_id).delete()
+        SearchNgram.objects.bulk_create([
+            SearchNgram(kind=kind, object_id=object_id, gram=gram)
+            for gram in grams
+        ])
+
+
+def delete_ngrams(kind, object_id):
+    SearchNgram.objects.filter(kind=kind, object_id=object_id).delete()
+
+
+def candidate_ids(kind, term):
+    """검색어의 모든 gram을 포함하는 객체 id 서브쿼리"""
+    grams = term_ngrams(term)
+    return (
+        SearchNgram.objects
+        .filter(kind=kind, gram__in=grams)
+        .values('object_id')
+        .annotate(hits=Count('gram', distinct=True))
+        .filter(hits=len(grams))
+        .values('object_id')
+    )
+
+
+class IndexedSearchFilter(filters.SearchFilter):
+    """
+    색인 기반 SearchFilter (관련도 순 정렬)
+
+    뷰에 `search_index_kind`(SearchNgram.kind)를 지정해야 한다.
+    결과는 `search_rank` 내림차순, 동점이면 기존 정렬을 따른다.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+        if not search_fields or not search_terms:
+            return queryset
+
+        ordering = list(queryset.query.order_by)
+
+        if uses_trigram_index(queryset.db):
+            from django.contrib.postgres.search import TrigramWordSimilarity
+            from django.db.models.functions import Greatest
+
+            query = ' '.join(search_terms)
+            similarities = [TrigramWordSimilarity(query, field) for field in search_fields]
+            rank = Greatest(*similarities) if len(similarities) > 1 else similarities[0]
+        else:
+            kind = view.search_index_kind
+            for term in search_terms:
+                queryset = queryset.filter(pk__in=candidate_ids(kind, term))
+
+            # 첫 번째 검색 필드 기준: 완전 일치 > 접두 일치 > 부분 일치 > 기타 필드 일치
+            primary = search_fields[0]
+            term = search_terms[0]
+            rank = Case(
+                When(**{f'{primary}__iexact': term}, then=Value(3)),
+                When(**{f'{primary}__istartswith': term}, then=Value(2)),
+                When(**{f'{primary}__icontains': term}, then=Value(1)),
+                default=Value(0),
+                output_field=IntegerField(),
+            )
+
+        # 최종 확인은 기본 icontains (PostgreSQL에서는 trigram 인덱스가 처리)
+        queryset = super().filter_queryset(request, queryset, view)
+        return queryset.annotate(search_rank=rank).order_by('-search_rank', *ordering)
@@ -1,15 +1,128 @@
+from django.db.models import Count, Exists, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from rest_framework import serializers
-from .models import Category, Restaurant, BingoTemplate, BingoTemplateItem, BingoBoard, Review, ReviewComment
+from .models import (
+    Category, Restaurant, BingoTemplate, BingoTemplateItem, BingoBoard,
+    Review, ReviewComment, ReviewLike,
+)
+from .validators import validate_image_file_size
 
 
-class CategorySerializer(serializers.ModelSerializer):
+# =============================================================================
+# Sparse fieldsets (?fields=) & expansion (?expand=)
+# =============================================================================
+
+def _parse_field_paths(value):
+    """'id,cells.position,cells.restaurant.name' → {'id': {}, 'cells': {'position': {}, ...}}"""
+    tree = {}
+    for path in (value or '').split(','):
+        node = tree
+        for part in path.strip().split('.'):
+            if part:
+                node = node.setdefault(part, {})
+    return tree
+
+
+class FieldSelection:
+    """
+    ?fields=/?expand= 요청 해석 결과
+
+    - fields: 반환할 필드 (중첩 필드는 점으로 구분, 미지정 시 전체)
+    - expand: id로 반환되는 관계 필드를 객체로 펼칠 필드 (예: restaurant)
+    뷰는 같은 객체로 필요한 조인/prefetch만 고른다.
+    """
+
+    def __init__(self, fields=None, expand=None):
+        self.fields = fields or None
+        self.expand = expand or {}
+
+    @classmethod
+    def from_request(cls, request):
+        params = getattr(request, 'query_params', {})
+        return cls(
+            _parse_field_paths(params.get('fields')),
+            _parse_field_paths(params.get('expand')),
+        )
+
+    def wants(self, path):
+        """path(점 구분) 필드를 반환해야 하는지"""
+        node = self.fields
+        for part in path.split('.'):
+            if not node:
+                return True
+            if part not in node:
+                return False
+            node = node[part]
+        return True
+
+    def expands(self, path):
+        """path 필드를 반환하면서 객체로 펼쳐야 하는지"""
+        if not self.wants(path):
+            return False
+        node = self.expand
+        for part in path.split('.'):
+            if part not in node:
+                return False
+            node = node[part]
+        return True
+
+    def nested(self, name):
+        """중첩 필드 name 아래의 선택"""
+        return FieldSelection(
+            (self.fields or {}).get(name), self.expand.get(name)
+        )
+
+
+class SparseFieldsMixin:
+    """
+    FieldSelection에 따라 필드를 거르고 expandable_fields를 펼치는 Serializer mixin
+
+    최상위 Serializer는 요청의 ?fields=/?expand=를 읽고,
+    중첩 Serializer는 상위에서 잘라 준 선택을 따른다.
+    """
+    # {필드 이름: 펼쳤을 때 사용할 Serializer 클래스}
+    expandable_fields = {}
+
+    def __init__(self, *args, selection=None, **kwargs):
+        self._selection = selection
+        super().__init__(*args, **kwargs)
+
+    @property
+    def selection(self):
+        if self._selection is None:
+            parent = self.parent
+            if isinstance(parent, serializers.ListSerializer):
+                parent = parent.parent
+            if parent is None:
+                self._selection = FieldSelection.from_request(self.context.get('request'))
+            else:
+                self._selection = FieldSelection()
+        return self._selection
+
+    def get_fields(self):
+        fields = super().get_fields()
+        selection = self.selection
+        for name, serializer_class in self.expandable_fields.items():
+            if name in fields and selection.expands(name):
+                fields[name] = serializer_class(read_only=True)
+        if selection.fields is not None:
+            fields = {name: field for name, field in fields.items() if name in selection.fields}
+        for name, field in fields.items():
+            target = getattr(field, 'child', field)
+            if isinstance(target, SparseFieldsMixin):
+                target._selection = selection.nested(name)
+        return fields
+
+
+class CategorySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = ['id', 'name', 'description']
 
 
-class RestaurantSerializer(serializers.ModelSerializer):
+class RestaurantSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     category_name = serializers.CharField(source='category.name', read_only=True)
+    expandable_fields = {'category': CategorySerializer}
 
     class Meta:
         model = Restaurant
@@ -19,7 +132,30 @@ class RestaurantSerializer(serializers.ModelSerializer):
         ]
 
 
-class BingoTemplateItemSerializer(serializers.ModelSerializer):
+class NearbyRestaurantSerializer(RestaurantSerializer):
+    """주변 식당 Serializer (거리 및 포함된 템플릿 셀 포함)"""
+    distance_m = serializers.SerializerMethodField()
+    template_cells = serializers.SerializerMethodField()
+
+    class Meta(RestaurantSerializer.Meta):
+        fields = RestaurantSerializer.Meta.fields + ['distance_m', 'template_cells']
+
+    def get_distance_m(self, obj):
+        return round(obj.distance_m)
+
+    def get_template_cells(self, obj):
+        """활성 템플릿에서 이 식당이 놓인 셀 목록 (active_template_items prefetch 사용)"""
+        return [
+            {
+                'template_id': item.template_id,
+                'template_title': item.template.title,
+                'position': item.position,
+            }
+            for item in obj.active_template_items
+        ]
+
+
+class BingoTemplateItemSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     restaurant = RestaurantSerializer(read_only=True)
 
     class Meta:
@@ -27,7 +163,7 @@ class BingoTemplateItemSerializer(serializers.ModelSerializer):
         fields = ['id', 'position', 'restaurant']
 
 
-class BingoTemplateListSerializer(serializers.ModelSerializer):
+class BingoTemplateListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     category_name = serializers.CharField(source='category.name', read_only=True)
     item_count = serializers.SerializerMethodField()
 
@@ -35,22 +171,31 @@ class BingoTemplateListSerializer(serializers.ModelSerializer):
         model = BingoTemplate
         fields = [
             'id', 'title', 'description', 'category',
-            'category_name', 'item_count', 'created_at'
+            'category_name', 'size', 'item_count', 'created_at'
         ]
 
     def get_item_count(self, obj):
+        # with_item_count()로 주석된 값이 있으면 사용
+        if hasattr(obj, 'num_items'):
+            return obj.num_items
         return obj.items.count()
 
 
-class BingoTemplateDetailSerializer(serializers.ModelSerializer):
+def with_item_count(queryset):
+    """템플릿 목록의 item_count를 행마다 세지 않도록 주석"""
+    return queryset.annotate(num_items=Count('items'))
+
+
+class BingoTemplateDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     category_name = serializers.CharField(source='category.name', read_only=True)
     items = BingoTemplateItemSerializer(many=True, read_only=True)
+    expandable_fields = {'category': CategorySerializer}
 
     class Meta:
         model = BingoTemplate
         fields = [
             'id', 'title', 'description', 'category',
-            'category_name', 'items', 'created_at'
+            'category_name', 'size', 'items', 'created_at'
         ]
 
 
@@ -68,10 +213,11 @@ def _get_display_name(user):
     return user.username
 
 
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     like_count = serializers.SerializerMethodField()
     comment_count = serializers.SerializerMethodField()
     is_liked = serializers.SerializerMethodField()
+    expandable_fields = {'restaurant': RestaurantSerializer}
 
     class Meta:
         model = Review
@@ -82,19 +228,53 @@ class ReviewSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at']
 
+    # with_social_counts()로 주석된 값이 있으면 리뷰마다 쿼리하지 않는다
     def get_like_count(self, obj):
+        if hasattr(obj, 'num_likes'):
+            return obj.num_likes
         return obj.likes.count()
 
     def get_comment_count(self, obj):
+        if hasattr(obj, 'num_comments'):
+            return obj.num_comments
         return obj.comments.count()
 
     def get_is_liked(self, obj):
         request = self.context.get('request')
         if request and hasattr(request, 'user') and request.user.is_authenticated:
+            if hasattr(obj, 'liked_by_user'):
+                return obj.liked_by_user
             return obj.likes.filter(user=request.user).exists()
         return False
 
 
+def with_social_counts(queryset, user, selection=None):
+    """리뷰 좋아요/댓글 수와 현재 사용자의 좋아요 여부를 서브쿼리로 주석 (선택된 필드만)"""
+    selection = selection or FieldSelection()
+
+    def count_of(model):
+        return Coalesce(Subquery(
+            model.objects.filter(review=OuterRef('pk')).order_by()
+            .values('review').annotate(total=Count('pk')).values('total')
+        ), 0)
+
+    if selection.wants('like_count'):
+        queryset = queryset.annotate(num_likes=count_of(ReviewLike))
+    if selection.wants('comment_count'):
+        queryset = queryset.annotate(num_comments=count_of(ReviewComment))
+    if user is not None and user.is_authenticated and selection.wants('is_liked'):
+        queryset = queryset.annotate(liked_by_user=Exists(
+            ReviewLike.objects.filter(review=OuterRef('pk'), user=user)
+        ))
+    return queryset
+
+
+def _prefetched(instance, name):
+    """prefetch_related로 이미 불러온 관계면 그 목록, 아니면 None"""
+    cache = getattr(instance, '_prefetched_objects_cache', {})
+    return list(cache[name]) if name in cache else None
+
+
 class ReviewFeedSerializer(ReviewSerializer):
     restaurant_name = serializers.CharField(source='restaurant.name', read_only=True)
     display_name = serializers.SerializerMethodField()
@@ -133,11 +313,13 @@ class ReviewCommentCreateSerializer(serializers.ModelSerializer):
 class ReviewCreateSerializer(serializers.ModelSerializer):
     # 테스트 환경에서 image 필드를 optional로 설정
     image = serializers.ImageField(required=False, allow_null=True)
+    # 직접 업로드한 이미지의 서명된 참조 (POST /api/uploads/review-image/ 발급)
+    image_ref = serializers.CharField(write_only=True, required=False)
 
     class Meta:
         model = Review
         fields = [
-            'bingo_board', 'restaurant', 'image', 'content',
+            'bingo_board', 'restaurant', 'image', 'image_ref', 'content',
             'rating', 'visited_date', 'is_public'
         ]
 
@@ -151,55 +333,119 @@ class ReviewCreateSerializer(serializers.ModelSerializer):
                 'restaurant': '이 레스토랑은 빙고 템플릿에 포함되어 있지 않습니다.'
             })
 
-        return data
+        image_ref = data.pop('image_ref', None)
+        if image_ref:
+            if data.get('image'):
+                raise serializers.ValidationError({
+                    'image_ref': 'image와 image_ref는 함께 보낼 수 없습니다.'
+                })
+            data['image'] = self._resolve_image_ref(image_ref)
 
+        return data
 
-class BingoBoardSerializer(serializers.ModelSerializer):
+    def store_image(self):
+        """
+        이미지를 콘텐츠 해시 기준으로 중복 없이 저장 (is_valid 이후, 한 번만)
+        해시 계산은 파일 전체를 읽으므로 뷰가 보드 잠금 트랜잭션을 열기 전에 호출한다
+        """
+        from .services_upload import ImageStore
+        image = self.validated_data.get('image')
+        if image and 'image_blob' not in self.validated_data:
+            if isinstance(image, str):
+                blob = ImageStore.adopt_stored(image)
+            else:
+                blob = ImageStore.store_upload(image)
+            self.validated_data['image'] = blob.name
+            self.validated_data['image_blob'] = blob
+
+    def create(self, validated_data):
+        """리뷰 저장 (이미지는 store_image에서 저장한 것을 연결)"""
+        self.store_image()
+        for key in ('image', 'image_blob'):
+            if key in self.validated_data:
+                validated_data[key] = self.validated_data[key]
+        return super().create(validated_data)
+
+    def _resolve_image_ref(self, image_ref):
+        from .services_upload import UploadService
+        try:
+            name = UploadService.resolve_ref(image_ref, self.context['request'].user)
+        except ValueError as e:
+            raise serializers.ValidationError({'image_ref': str(e)})
+        if Review.objects.filter(image=name).exists():
+            raise serializers.ValidationError({'image_ref': '이미 다른 리뷰에 사용된 이미지입니다.'})
+        return name
+
+
+class LocalImageUploadSerializer(serializers.Serializer):
+    """로컬 업로드 엔드포인트 요청 (Cloudinary 업로드 폼과 같은 필드 구성)"""
+    upload_token = serializers.CharField()
+    file = serializers.ImageField(validators=[validate_image_file_size])
+
+
+class BingoBoardSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     template_title = serializers.CharField(source='template.title', read_only=True)
+    size = serializers.IntegerField(source='template.size', read_only=True)
     cells = serializers.SerializerMethodField()
     completed_lines = serializers.SerializerMethodField()
     progress = serializers.SerializerMethodField()
+    expandable_fields = {'template': BingoTemplateListSerializer}
 
     class Meta:
         model = BingoBoard
         fields = [
-            'id', 'template', 'template_title', 'target_line_count',
+            'id', 'template', 'template_title', 'size', 'target_line_count',
             'is_completed', 'created_at', 'completed_at',
             'cells', 'completed_lines', 'progress'
         ]
         read_only_fields = ['id', 'is_completed', 'created_at', 'completed_at']
 
     def get_cells(self, obj):
-        """25개 셀 데이터를 반환 (활성화 상태 포함)"""
-        template_items = obj.template.items.select_related('restaurant').all()
+        """템플릿 크기(N×N)만큼의 셀 데이터를 반환 (활성화 상태 포함, ?fields=cells.* 반영)"""
+        selection = self.selection.nested('cells')
+        want_restaurant = selection.wants('restaurant')
+        want_review = selection.wants('review')
+
+        template_items = _prefetched(obj.template, 'items')
+        if template_items is None:
+            template_items = obj.template.items.all()
+            if want_restaurant:
+                template_items = template_items.select_related('restaurant')
         reviews_by_restaurant = {
             r.restaurant_id: r for r in obj.reviews.all()
         }
 
         cells = []
-        for item in template_items:
+        for item in sorted(template_items, key=lambda x: x.position):
             review = reviews_by_restaurant.get(item.restaurant_id)
-            cells.append({
-                'position': item.position,
-                'restaurant': RestaurantSerializer(item.restaurant, context=self.context).data,
-                'is_activated': review is not None,
-                'review': ReviewSerializer(review, context=self.context).data if review else None,
-            })
-        return sorted(cells, key=lambda x: x['position'])
+            cell = {'position': item.position}
+            if want_restaurant:
+                cell['restaurant'] = RestaurantSerializer(
+                    item.restaurant, context=self.context,
+                    selection=selection.nested('restaurant'),
+                ).data
+            cell['is_activated'] = review is not None
+            if want_review:
+                cell['review'] = ReviewSerializer(
+                    review, context=self.context, selection=selection.nested('review'),
+                ).data if review else None
+            cells.append({key: value for key, value in cell.items() if selection.wants(key)})
+        return cells
 
     def get_completed_lines(self, obj):
         """완성된 빙고 라인 수"""
         from .services import BingoService
         activated = BingoService.get_activated_positions(obj)
-        return BingoService.count_completed_lines(activated)
+        return BingoService.count_completed_lines(activated, obj.template.size)
 
     def get_progress(self, obj):
         """진행률 정보"""
         activated_count = obj.reviews.count()
+        total_cells = obj.template.cell_count
         return {
             'activated_count': activated_count,
-            'total_cells': 25,
-            'percentage': round(activated_count / 25 * 100, 1)
+            'total_cells': total_cells,
+            'percentage': round(activated_count / total_cells * 100, 1)
         }
 
 
@@ -1,6 +1,6 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
-from .models import Category, Restaurant, BingoTemplate, BingoTemplateItem
+from .models import Category, Restaurant, BingoTemplate, BingoTemplateItem, TemplateFunnel
 
 User = get_user_model()
 
@@ -43,7 +43,9 @@ class AdminTemplateItemSerializer(serializers.ModelSerializer):
 
 class AdminTemplateItemWriteSerializer(serializers.Serializer):
     """템플릿 아이템 생성/수정용 Serializer"""
-    position = serializers.IntegerField(min_value=0, max_value=24)
+    position = serializers.IntegerField(
+        min_value=0, max_value=BingoTemplate.MAX_SIZE * BingoTemplate.MAX_SIZE - 1
+    )
     restaurant = serializers.PrimaryKeyRelatedField(queryset=Restaurant.objects.all())
 
 
@@ -56,7 +58,7 @@ class AdminTemplateListSerializer(serializers.ModelSerializer):
         model = BingoTemplate
         fields = [
             'id', 'category', 'category_name', 'title', 'description',
-            'is_active', 'item_count', 'created_at'
+            'size', 'is_active', 'item_count', 'created_at'
         ]
 
     def get_item_count(self, obj):
@@ -72,7 +74,7 @@ class AdminTemplateDetailSerializer(serializers.ModelSerializer):
         model = BingoTemplate
         fields = [
             'id', 'category', 'category_name', 'title', 'description',
-            'is_active', 'items', 'created_at'
+            'size', 'is_active', 'items', 'created_at'
         ]
 
 
@@ -82,7 +84,24 @@ class AdminTemplateCreateUpdateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = BingoTemplate
-        fields = ['id', 'category', 'title', 'description', 'is_active', 'items']
+        fields = ['id', 'category', 'title', 'description', 'size', 'is_active', 'items']
+
+    def validate(self, attrs):
+        size = attrs.get('size', self.instance.size if self.instance else 5)
+        items = attrs.get('items')
+        if items is None and self.instance is not None and 'size' in attrs:
+            # 크기만 바꾸는 경우 기존 아이템이 새 크기에 들어가는지 확인
+            positions = list(self.instance.items.values_list('position', flat=True))
+        else:
+            positions = [item['position'] for item in items or []]
+
+        out_of_range = sorted(p for p in positions if p >= size * size)
+        if out_of_range:
+            raise serializers.ValidationError({
+                'items': f'{size}x{size} 템플릿의 포지션은 0~{size * size - 1} 사이여야 합니다. '
+                         f'(범위 초과: {out_of_range})'
+            })
+        return attrs
 
     def create(self, validated_data):
         items_data = validated_data.pop('items', [])
@@ -118,6 +137,10 @@ class AdminTemplateCreateUpdateSerializer(serializers.ModelSerializer):
                     restaurant=item_data['restaurant']
                 )
 
+            # 포지션이 바뀌었을 수 있으므로 기존 보드의 활성 마스크를 다시 맞춘다
+            from .analytics import rebuild_masks
+            rebuild_masks(template_id=instance.id)
+
         return instance
 
 
@@ -135,3 +158,57 @@ class AdminUserSerializer(serializers.ModelSerializer):
 
     def get_board_count(self, obj):
         return obj.bingo_boards.count()
+
+
+class AdminTemplateFunnelSerializer(serializers.ModelSerializer):
+    """Admin 템플릿 퍼널 Serializer (heatmap: size×size 포지션별 활성 보드 수)"""
+    template_id = serializers.IntegerField(source='template.id')
+    size = serializers.IntegerField(source='template.size')
+    heatmap = serializers.SerializerMethodField()
+
+    class Meta:
+        model = TemplateFunnel
+        fields = [
+            'template_id', 'size', 'boards_started', 'boards_activated',
+            'reached_1_line', 'reached_3_lines', 'reached_5_lines', 'boards_completed',
+            'median_completion_seconds', 'heatmap', 'cell_counts', 'near_miss_counts',
+            'drop_off_position', 'is_stale', 'updated_at',
+        ]
+
+    def get_heatmap(self, obj):
+        size = obj.template.size
+        return [obj.cell_counts[row * size:(row + 1) * size] for row in range(size)]
+
+
+class AdminRestaurantBulkSerializer(serializers.Serializer):
+    """식당 일괄 처리 요청 Serializer"""
+    ACTION_CHOICES = ['approve', 'reject', 'recategorize']
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=500,
+    )
+    action = serializers.ChoiceField(choices=ACTION_CHOICES)
+    category = serializers.PrimaryKeyRelatedField(
+        queryset=Category.objects.all(), required=False
+    )
+
+    def validate(self, data):
+        if data['action'] == 'recategorize' and 'category' not in data:
+            raise serializers.ValidationError({
+                'category': '카테고리 변경 시 category가 필요합니다.'
+            })
+        return data
+
+
+class AdminUserBulkSerializer(serializers.Serializer):
+    """사용자 일괄 처리 요청 Serializer"""
+    ACTION_CHOICES = ['activate', 'deactivate']
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=500,
+    )
+    action = serializers.ChoiceField(choices=ACTION_CHOICES)
@@ -1,31 +1,63 @@
+from functools import lru_cache
+
+
+DEFAULT_BOARD_SIZE = 5
+
+
+@lru_cache(maxsize=None)
+def winning_lines(size):
+    """N×N 보드의 빙고 라인 (가로 N, 세로 N, 대각선 2)"""
+    rows = [tuple(range(r * size, (r + 1) * size)) for r in range(size)]
+    cols = [tuple(range(c, size * size, size)) for c in range(size)]
+    diagonals = [
+        tuple(i * (size + 1) for i in range(size)),
+        tuple((i + 1) * (size - 1) for i in range(size)),
+    ]
+    return tuple(rows + cols + diagonals)
+
+
+@lru_cache(maxsize=None)
+def line_masks(size):
+    """각 라인의 비트마스크 (position p → bit p)"""
+    return tuple(sum(1 << pos for pos in line) for line in winning_lines(size))
+
+
+@lru_cache(maxsize=None)
+def cell_lines(size):
+    """포지션별로 그 포지션을 지나는 라인 인덱스 목록"""
+    lines = winning_lines(size)
+    return tuple(
+        tuple(i for i, line in enumerate(lines) if pos in line)
+        for pos in range(size * size)
+    )
+
+
 class BingoService:
     """빙고 라인 감지 및 완료 체크 서비스"""
 
-    # 12개의 빙고 라인 (가로 5, 세로 5, 대각선 2)
-    WINNING_LINES = [
-        # 가로 라인 (5개)
-        [0, 1, 2, 3, 4],
-        [5, 6, 7, 8, 9],
-        [10, 11, 12, 13, 14],
-        [15, 16, 17, 18, 19],
-        [20, 21, 22, 23, 24],
-        # 세로 라인 (5개)
-        [0, 5, 10, 15, 20],
-        [1, 6, 11, 16, 21],
-        [2, 7, 12, 17, 22],
-        [3, 8, 13, 18, 23],
-        [4, 9, 14, 19, 24],
-        # 대각선 라인 (2개)
-        [0, 6, 12, 18, 24],
-        [4, 8, 12, 16, 20],
-    ]
+    # 기본 5×5 보드의 12개 라인 (가로 5, 세로 5, 대각선 2)
+    WINNING_LINES = [list(line) for line in winning_lines(DEFAULT_BOARD_SIZE)]
+    LINE_MASKS = list(line_masks(DEFAULT_BOARD_SIZE))
+    CELL_LINES = list(cell_lines(DEFAULT_BOARD_SIZE))
+
+    @staticmethod
+    def positions_to_mask(positions):
+        """포지션 집합을 비트마스크로 변환한다"""
+        mask = 0
+        for pos in positions:
+            mask |= 1 << pos
+        return mask
 
     @classmethod
     def get_activated_positions(cls, bingo_board):
         """리뷰가 작성된 포지션들의 집합을 반환한다"""
-        reviewed_restaurant_ids = set(
-            bingo_board.reviews.values_list('restaurant_id', flat=True)
-        )
+        prefetched = getattr(bingo_board, '_prefetched_objects_cache', {})
+        if 'reviews' in prefetched:
+            reviewed_restaurant_ids = {r.restaurant_id for r in prefetched['reviews']}
+        else:
+            reviewed_restaurant_ids = set(
+                bingo_board.reviews.values_list('restaurant_id', flat=True)
+            )
         template_items = bingo_board.template.items.all()
         activated = set()
         for item in template_items:
@@ -34,17 +66,68 @@ class BingoService:
         return activated
 
     @classmethod
-    def count_completed_lines(cls, activated_positions):
-        """완성된 빙고 라인의 개수를 반환한다"""
-        count = 0
-        for line in cls.WINNING_LINES:
-            if all(pos in activated_positions for pos in line):
-                count += 1
-        return count
+    def count_completed_lines(cls, activated_positions, size=DEFAULT_BOARD_SIZE):
+        """완성된 빙고 라인의 개수를 반환한다 (라인당 비트마스크 비교 1회)"""
+        mask = cls.positions_to_mask(activated_positions)
+        return sum(1 for line in line_masks(size) if mask & line == line)
 
     @classmethod
     def check_board_completion(cls, bingo_board):
         """보드가 목표 라인 수를 달성했는지 확인한다"""
         activated = cls.get_activated_positions(bingo_board)
-        completed_lines = cls.count_completed_lines(activated)
+        completed_lines = cls.count_completed_lines(activated, bingo_board.template.size)
         return completed_lines >= bingo_board.target_line_count
+
+    @classmethod
+    def update_board_completion(cls, bingo_board):
+        """
+        목표 달성 시 보드를 완료 처리한다 (멱등)
+
+        is_completed=False 조건부 UPDATE로 완료 처리는 한 번만 적용되고
+        completed_at도 처음 달성한 시각으로 유지된다.
+        반환: (완성 라인 수, 이번 호출로 목표를 달성했는지)
+        """
+        from django.utils import timezone
+        from . import analytics, stats
+        from .models import BingoBoard
+
+        if bingo_board.is_completed:
+            return 0, False
+        activated = cls.get_activated_positions(bingo_board)
+        completed_lines = cls.count_completed_lines(activated, bingo_board.template.size)
+        if completed_lines < bingo_board.target_line_count:
+            return completed_lines, False
+
+        now = timezone.now()
+        updated = BingoBoard.objects.filter(pk=bingo_board.pk, is_completed=False).update(
+            is_completed=True, completed_at=now
+        )
+        if updated:
+            bingo_board.is_completed = True
+            bingo_board.completed_at = now
+            stats.bump('boards_completed', now)
+            analytics.mark_stale(bingo_board.template_id)
+        return completed_lines, bool(updated)
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def rank_next_cells(cls, activated_mask, size=DEFAULT_BOARD_SIZE):
+        """
+        미활성 포지션을 빙고 진행 기여도 순으로 정렬한다 (마스크별 결과 캐시)
+
+        반환: (position, lines_completed, lines_one_away, score) 튜플의 튜플
+        - lines_completed: 이 셀을 채우면 바로 완성되는 라인 수
+        - lines_one_away: 이 셀을 채우면 한 칸만 남는 라인 수
+        - score: lines_completed > lines_one_away > 지나는 라인의 진행도 순으로 가중한 점수
+        """
+        counts = [(activated_mask & line).bit_count() for line in line_masks(size)]
+        ranking = []
+        for pos, lines in enumerate(cell_lines(size)):
+            if activated_mask >> pos & 1:
+                continue
+            completed = sum(1 for i in lines if counts[i] == size - 1)
+            one_away = sum(1 for i in lines if counts[i] == size - 2)
+            progress = sum(counts[i] + 1 for i in lines)
+            ranking.append((pos, completed, one_away, completed * 100 + one_away * 10 + progress))
+        ranking.sort(key=lambda r: (-r[3], r[0]))
+        return tuple(ranking)
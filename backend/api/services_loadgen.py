@@ -0,0 +1,426 @@
+"""
+부하 테스트용 대용량 합성 데이터 생성 서비스 (generate_load_data 명령)
+
+- 같은 seed와 기준 시각(until)이면 빈 DB에서 항상 같은 데이터를 만든다 (numpy 난수 생성기).
+- 편중 분포: 템플릿 인기는 Zipf, 사용자 활동량과 리뷰 좋아요 수는 멱법칙(Pareto).
+- 보드 묶음 단위로 보드 → 리뷰 → 좋아요/댓글을 bulk_create하고 버려서
+  리뷰 100만 개도 객체를 메모리에 쌓지 않는다. pk가 필요 없는 좋아요/댓글은 executemany로 넣는다.
+- bulk_create는 save()/시그널을 거치지 않으므로 geohash, activated_mask, 완료 여부는 직접 계산한다.
+  (일별 집계/템플릿 퍼널/검색 색인은 명령이 마지막에 다시 계산한다)
+"""
+import io
+import math
+from contextlib import contextmanager
+from datetime import timedelta
+
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from .geo import encode_geohash
+from .models import (
+    BingoBoard, BingoTemplate, BingoTemplateItem, Category, Restaurant, Review,
+    ReviewComment, ReviewLike, UserProfile,
+)
+from .services import line_masks
+
+User = get_user_model()
+
+# 기본 규모 (--scale로 한꺼번에 조절)
+DEFAULT_COUNTS = {
+    'users': 20_000,
+    'categories': 20,
+    'restaurants': 10_000,
+    'templates': 500,
+    'boards': 120_000,
+    'reviews': 1_000_000,
+    'likes': 2_000_000,
+    'comments': 300_000,
+}
+
+TEMPLATE_SIZES = (3, 4, 5, 7)
+TEMPLATE_SIZE_WEIGHTS = (0.1, 0.2, 0.6, 0.1)
+TARGET_LINES = (1, 3, 5)
+TARGET_LINE_WEIGHTS = (0.5, 0.3, 0.2)
+RATING_WEIGHTS = (0.03, 0.07, 0.2, 0.35, 0.35)
+PUBLIC_RATIO = 0.9
+APPROVED_RATIO = 0.95
+NICKNAME_RATIO = 0.3
+# 템플릿 인기 Zipf 지수, 사용자 활동량/좋아요 Pareto 형상 모수 (작을수록 편중)
+TEMPLATE_ZIPF = 1.1
+USER_ACTIVITY_SHAPE = 1.5
+LIKE_SHAPE = 1.5
+# 보드 하나를 진행하는 기간, 좋아요/댓글이 달리는 기간 (리뷰 이후)
+BOARD_ACTIVE_DAYS = 30
+REACTION_DAYS = 7
+
+LOAD_PASSWORD = 'loadpass123'
+# 서울 범위
+LAT_RANGE = (37.45, 37.65)
+LNG_RANGE = (126.85, 127.15)
+PLACEHOLDER_COLORS = (
+    (230, 126, 34), (241, 196, 15), (46, 204, 113), (52, 152, 219),
+    (155, 89, 182), (231, 76, 60), (26, 188, 156), (149, 165, 166),
+)
+REVIEW_TEXTS = (
+    '국물이 진하고 면이 쫄깃해서 또 오고 싶어요.',
+    '가격 대비 양이 많고 맛도 괜찮았습니다.',
+    '웨이팅이 길었지만 기다린 보람이 있었어요.',
+    '직원분들이 친절하고 매장이 깔끔했습니다.',
+    '기대보다는 평범했지만 재방문 의사 있어요.',
+    '양념이 살짝 달았지만 전체적으로 만족합니다.',
+    '분위기가 좋아서 친구들과 오기 좋아요.',
+    '대표 메뉴는 꼭 먹어봐야 할 맛입니다.',
+)
+COMMENT_TEXTS = (
+    '저도 가봐야겠어요!', '여기 진짜 맛있죠', '사진만 봐도 배고프네요', '웨이팅 얼마나 했어요?',
+    '추천 감사합니다', '다음에 같이 가요', '저는 별로였어요', '메뉴 추천해주세요',
+)
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """auto_now_add 필드를 잠시 꺼서 bulk_create에 넣은 created_at을 그대로 저장"""
+    fields = [
+        field for model in models for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now_add', False)
+    ]
+    for field in fields:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field in fields:
+            field.auto_now_add = True
+
+
+def scaled_counts(scale=1.0, **overrides):
+    """기본 규모에 scale을 곱하고 개별 지정값(None 제외)으로 덮어쓴 생성 개수"""
+    counts = {name: max(1, round(count * scale)) for name, count in DEFAULT_COUNTS.items()}
+    counts.update({name: value for name, value in overrides.items() if value is not None})
+    return counts
+
+
+def coprime_stride(n, start=7919):
+    """n과 서로소인 보폭 (offset + j * stride) % n 이 j < n 동안 겹치지 않도록"""
+    stride = start % n or 1
+    while math.gcd(stride, n) != 1:
+        stride += 1
+    return stride
+
+
+class LoadDataGenerator:
+    """
+    생성 순서: 사용자 → 카테고리/식당 → 템플릿/아이템 → (보드 묶음마다) 보드 → 리뷰 → 좋아요/댓글
+    모든 시각은 [until - days, until) 구간에 흩뿌린다 (사용자/식당/템플릿은 구간 이전).
+    """
+
+    def __init__(self, counts, seed=42, until=None, days=180, prefix='load',
+                 batch_size=5000, chunk_boards=2000, log=None):
+        self.counts = counts
+        self.rng = np.random.default_rng(seed)
+        if until is None:
+            until = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.until = until
+        # 현지 시간 기준 (리뷰 visited_date = 작성 시각의 현지 날짜)
+        self.start = timezone.localtime(until) - timedelta(days=days)
+        self.window = (until - self.start).total_seconds()
+        self.prefix = prefix
+        self.batch_size = batch_size
+        self.chunk_boards = chunk_boards
+        self.log = log or (lambda message: None)
+        self.created = {}
+
+    def _at(self, seconds):
+        """구간 시작 기준 초 → datetime"""
+        return self.start + timedelta(seconds=float(seconds))
+
+    def _bulk_create(self, model, objects):
+        model.objects.bulk_create(objects, batch_size=self.batch_size)
+        self.created[model._meta.model_name] = self.created.get(model._meta.model_name, 0) + len(objects)
+        return objects
+
+    def generate(self):
+        if User.objects.filter(username__startswith=f'{self.prefix}_').exists():
+            raise ValueError(
+                f"'{self.prefix}_' 사용자가 이미 있습니다. --prefix를 바꾸거나 빈 DB에서 실행하세요."
+            )
+        with explicit_timestamps(
+            Restaurant, BingoTemplate, BingoBoard, Review,
+        ):
+            self.create_users()
+            self.create_restaurants()
+            self.create_templates()
+            self.create_activity()
+        return self.created
+
+    # -------------------------------------------------------------------------
+    # 사용자 / 식당 / 템플릿
+    # -------------------------------------------------------------------------
+
+    def create_users(self):
+        n = self.counts['users']
+        password = make_password(LOAD_PASSWORD)
+        # 가입은 활동 구간 이전 90일 안
+        joined = self.rng.uniform(-90 * 86400, 0, n)
+        with transaction.atomic():
+            users = self._bulk_create(User, [
+                User(
+                    username=f'{self.prefix}_{i:07d}', email=f'{self.prefix}_{i:07d}@example.com',
+                    password=password, date_joined=self._at(joined[i]),
+                )
+                for i in range(n)
+            ])
+            has_nickname = self.rng.random(n) < NICKNAME_RATIO
+            self._bulk_create(UserProfile, [
+                UserProfile(user=user, nickname=f'{self.prefix}닉{i}' if has_nickname[i] else '')
+                for i, user in enumerate(users)
+            ])
+        self.user_ids = np.array([user.pk for user in users])
+        # 활동량 가중치 (소수 사용자가 보드 대부분을 만든다)
+        activity = self.rng.pareto(USER_ACTIVITY_SHAPE, n) + 1
+        self.user_weights = activity / activity.sum()
+        self.log(f'사용자 {n:,}명')
+
+    def create_restaurants(self):
+        n_categories, n = self.counts['categories'], self.counts['restaurants']
+        with transaction.atomic():
+            categories = self._bulk_create(Category, [
+                Category(name=f'{self.prefix} 카테고리 {i + 1}', description='부하 테스트용 카테고리')
+                for i in range(n_categories)
+            ])
+            category_index = self.rng.integers(n_categories, size=n)
+            latitudes = np.round(self.rng.uniform(*LAT_RANGE, n), 7)
+            longitudes = np.round(self.rng.uniform(*LNG_RANGE, n), 7)
+            approved = self.rng.random(n) < APPROVED_RATIO
+            created = self.rng.uniform(-60 * 86400, -30 * 86400, n)
+            restaurants = self._bulk_create(Restaurant, [
+                Restaurant(
+                    category=categories[category_index[i]],
+                    name=f'{self.prefix} 식당 {i + 1}', address=f'서울 부하구 테스트로 {i + 1}',
+                    latitude=latitudes[i], longitude=longitudes[i],
+                    geohash=encode_geohash(latitudes[i], longitudes[i]),
+                    is_approved=bool(approved[i]), created_at=self._at(created[i]),
+                )
+                for i in range(n)
+            ])
+        self.categories = categories
+        restaurant_ids = np.array([restaurant.pk for restaurant in restaurants])
+        self.category_restaurants = [
+            restaurant_ids[(category_index == i) & approved] for i in range(n_categories)
+        ]
+        self.log(f'카테고리 {n_categories:,}개, 식당 {n:,}개')
+
+    def create_templates(self):
+        n = self.counts['templates']
+        available = np.array([len(ids) for ids in self.category_restaurants])
+        # 가장 큰 카테고리의 승인된 식당 수로 채울 수 있는 크기만 고른다
+        feasible = np.array([size ** 2 <= available.max() for size in TEMPLATE_SIZES])
+        if not feasible.any():
+            raise ValueError(
+                '템플릿을 채울 승인된 식당이 부족합니다. --restaurants를 늘리거나 --categories를 줄이세요.'
+            )
+        weights = np.where(feasible, TEMPLATE_SIZE_WEIGHTS, 0.0)
+        sizes = self.rng.choice(TEMPLATE_SIZES, size=n, p=weights / weights.sum())
+        templates, items = [], []
+        for i in range(n):
+            # 셀 수만큼 승인된 식당이 있는 카테고리에서만 만든다
+            category = self.rng.choice(np.flatnonzero(available >= sizes[i] ** 2))
+            restaurant_ids = self.rng.choice(
+                self.category_restaurants[category], sizes[i] ** 2, replace=False,
+            )
+            templates.append(BingoTemplate(
+                category=self.categories[category], title=f'{self.prefix} 빙고 {i + 1}',
+                size=int(sizes[i]), created_at=self._at(self.rng.uniform(-30 * 86400, 0)),
+            ))
+            items.append(restaurant_ids)
+
+        with transaction.atomic():
+            self._bulk_create(BingoTemplate, templates)
+            self._bulk_create(BingoTemplateItem, [
+                BingoTemplateItem(template=template, restaurant_id=int(restaurant_id), position=position)
+                for template, restaurant_ids in zip(templates, items)
+                for position, restaurant_id in enumerate(restaurant_ids)
+            ])
+        self.template_ids = np.array([template.pk for template in templates])
+        self.template_sizes = sizes
+        self.template_items = items
+        # Zipf 인기: 무작위 순위 r의 가중치 1 / r^s
+        ranks = self.rng.permutation(n) + 1
+        popularity = 1.0 / ranks ** TEMPLATE_ZIPF
+        self.template_weights = popularity / popularity.sum()
+        self.log(f'템플릿 {n:,}개')
+
+    # -------------------------------------------------------------------------
+    # 보드 / 리뷰 / 좋아요 / 댓글
+    # -------------------------------------------------------------------------
+
+    def review_counts(self, cells):
+        """보드별 리뷰 수 (기하 분포, 셀 수 이하), 합이 목표 리뷰 수가 되도록 보정"""
+        target = min(self.counts['reviews'], int(cells.sum()))
+        mean = target / len(cells)
+        counts = np.minimum(cells, self.rng.geometric(1 / (mean + 1), len(cells)) - 1)
+        while (gap := target - int(counts.sum())) != 0:
+            step = 1 if gap > 0 else -1
+            room = np.flatnonzero(counts < cells if gap > 0 else counts > 0)
+            picks = self.rng.choice(room, min(abs(gap), len(room)), replace=False)
+            counts[picks] += step
+        return counts
+
+    def reaction_counts(self, total, weights, limit=None):
+        """전체 total개를 가중치 비율로 리뷰에 나눈다 (리뷰당 최대 limit)"""
+        if total <= 0 or not weights.sum():
+            return np.zeros(len(weights), dtype=np.int64)
+        counts = self.rng.multinomial(total, weights / weights.sum())
+        return counts if limit is None else np.minimum(counts, limit)
+
+    def create_activity(self):
+        n_boards, n_users = self.counts['boards'], len(self.user_ids)
+        board_templates = self.rng.choice(len(self.template_ids), n_boards, p=self.template_weights)
+        board_users = self.rng.choice(n_users, n_boards, p=self.user_weights)
+        board_targets = self.rng.choice(TARGET_LINES, n_boards, p=TARGET_LINE_WEIGHTS)
+        # 생성 시각 오름차순 = id 순서
+        board_created = np.sort(self.rng.uniform(0, self.window, n_boards))
+        cells = self.template_sizes[board_templates] ** 2
+        reviews_per_board = self.review_counts(cells)
+
+        n_reviews = int(reviews_per_board.sum())
+        is_public = self.rng.random(n_reviews) < PUBLIC_RATIO
+        popularity = np.where(is_public, self.rng.pareto(LIKE_SHAPE, n_reviews) + 1, 0.0)
+        like_counts = self.reaction_counts(self.counts['likes'], popularity, n_users)
+        # 댓글은 좋아요가 많은 리뷰에 더 달린다
+        comment_counts = self.reaction_counts(
+            self.counts['comments'], np.where(is_public, like_counts + 1.0, 0.0),
+        )
+        self.placeholders = self.create_placeholder_images()
+        self.like_stride = coprime_stride(n_users)
+
+        review_start = 0
+        for chunk_start in range(0, n_boards, self.chunk_boards):
+            chunk = slice(chunk_start, min(chunk_start + self.chunk_boards, n_boards))
+            review_end = review_start + int(reviews_per_board[chunk].sum())
+            reviews = slice(review_start, review_end)
+            with transaction.atomic():
+                review_rows = self._create_boards(
+                    board_templates[chunk], board_users[chunk], board_targets[chunk],
+                    board_created[chunk], reviews_per_board[chunk],
+                )
+                review_ids, review_at = self._create_reviews(review_rows, is_public[reviews])
+                self._create_reactions(review_ids, review_at, like_counts[reviews], comment_counts[reviews])
+            review_start = review_end
+            self.log(
+                f"보드 {chunk.stop:,}/{n_boards:,}, 리뷰 {self.created.get('review', 0):,}, "
+                f"좋아요 {self.created.get('reviewlike', 0):,}, 댓글 {self.created.get('reviewcomment', 0):,}"
+            )
+
+    def _create_boards(self, templates, users, targets, created, review_counts):
+        """보드를 만들고 리뷰 행 [(board, restaurant_id, 작성 시각 초)] 반환"""
+        boards, review_rows = [], []
+        for template, user, target, board_at, count in zip(templates, users, targets, created, review_counts):
+            size = int(self.template_sizes[template])
+            positions = self.rng.permutation(size * size)[:count]
+            # 리뷰는 보드 생성 후 BOARD_ACTIVE_DAYS 안에 (구간 끝을 넘지 않게) 순서대로
+            span = min(BOARD_ACTIVE_DAYS * 86400, self.window - board_at)
+            review_at = np.sort(board_at + self.rng.uniform(0, span, count))
+            mask = sum(1 << int(position) for position in positions)
+            lines = sum(1 for line in line_masks(size) if mask & line == line)
+            completed = count > 0 and lines >= target
+            board = BingoBoard(
+                user_id=int(self.user_ids[user]), template_id=int(self.template_ids[template]),
+                target_line_count=int(target), created_at=self._at(board_at),
+                activated_mask=mask, is_completed=completed,
+                completed_at=self._at(review_at[-1]) if completed else None,
+            )
+            boards.append(board)
+            items = self.template_items[template]
+            review_rows.extend(
+                (board, int(items[position]), seconds) for position, seconds in zip(positions, review_at)
+            )
+        self._bulk_create(BingoBoard, boards)
+        return review_rows
+
+    def _create_reviews(self, review_rows, is_public):
+        """리뷰를 만들고 (리뷰 id 배열, 작성 시각 초 배열) 반환"""
+        n = len(review_rows)
+        ratings = self.rng.choice(5, n, p=RATING_WEIGHTS) + 1
+        texts = self.rng.integers(len(REVIEW_TEXTS), size=n)
+        images = self.rng.integers(len(self.placeholders), size=n)
+        reviews = []
+        for i, (board, restaurant_id, seconds) in enumerate(review_rows):
+            created_at = self._at(seconds)
+            reviews.append(Review(
+                user_id=board.user_id, bingo_board_id=board.pk, restaurant_id=restaurant_id,
+                image=self.placeholders[images[i]], content=REVIEW_TEXTS[texts[i]],
+                rating=int(ratings[i]), visited_date=created_at.date(),
+                is_public=bool(is_public[i]), created_at=created_at,
+            ))
+        self._bulk_create(Review, reviews)
+        return (
+            np.array([review.pk for review in reviews]),
+            np.array([seconds for _, _, seconds in review_rows]),
+        )
+
+    def _reaction_rows(self, review_at, counts):
+        """리뷰별 counts개씩 (리뷰 인덱스, 리뷰 안 순번, 작성 시각 초)"""
+        total = int(counts.sum())
+        review_index = np.repeat(np.arange(len(review_at)), counts)
+        nth = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        base = review_at[review_index]
+        reacted_at = base + self.rng.uniform(0, 1, total) * np.minimum(REACTION_DAYS * 86400, self.window - base)
+        return review_index, nth, reacted_at
+
+    def _insert_rows(self, model, fields, rows):
+        """
+        pk가 필요 없는 대량 행은 모델 인스턴스 없이 executemany로 넣는다
+        (좋아요/댓글은 bulk_create의 객체 생성/SQL 컴파일 비용이 INSERT 자체보다 크다)
+        """
+        connection = connections[router.db_for_write(model)]
+        quote = connection.ops.quote_name
+        columns = ', '.join(quote(model._meta.get_field(field).column) for field in fields)
+        sql = (
+            f'INSERT INTO {quote(model._meta.db_table)} ({columns}) '
+            f'VALUES ({", ".join(["%s"] * len(fields))})'
+        )
+        with connection.cursor() as cursor:
+            for start in range(0, len(rows), self.batch_size):
+                cursor.executemany(sql, rows[start:start + self.batch_size])
+        self.created[model._meta.model_name] = self.created.get(model._meta.model_name, 0) + len(rows)
+
+    def _create_reactions(self, review_ids, review_at, like_counts, comment_counts):
+        n_users = len(self.user_ids)
+        adapt = connections[router.db_for_write(ReviewLike)].ops.adapt_datetimefield_value
+
+        review_index, nth, liked_at = self._reaction_rows(review_at, like_counts)
+        # 리뷰마다 무작위 시작점에서 서로소 보폭으로 건너뛰어 (user, review) 중복 없이 고른다
+        offsets = self.rng.integers(n_users, size=len(review_ids))
+        like_users = self.user_ids[(offsets[review_index] + nth * self.like_stride) % n_users]
+        self._insert_rows(ReviewLike, ('user', 'review', 'created_at'), [
+            (int(user), int(review_ids[index]), adapt(self._at(seconds)))
+            for index, user, seconds in zip(review_index, like_users, liked_at)
+        ])
+
+        review_index, _, commented_at = self._reaction_rows(review_at, comment_counts)
+        comment_users = self.user_ids[self.rng.integers(n_users, size=len(review_index))]
+        texts = self.rng.integers(len(COMMENT_TEXTS), size=len(review_index))
+        self._insert_rows(ReviewComment, ('user', 'review', 'content', 'created_at'), [
+            (int(user), int(review_ids[index]), COMMENT_TEXTS[text], adapt(self._at(seconds)))
+            for index, user, text, seconds in zip(review_index, comment_users, texts, commented_at)
+        ])
+
+    def create_placeholder_images(self):
+        """리뷰 이미지용 단색 JPEG (색상별 한 장씩만 저장하고 모든 리뷰가 나눠 쓴다)"""
+        from PIL import Image
+
+        names = []
+        for i, color in enumerate(PLACEHOLDER_COLORS):
+            name = f'reviews/{self.prefix}/placeholder_{i}.jpg'
+            if not default_storage.exists(name):
+                buffer = io.BytesIO()
+                Image.new('RGB', (64, 64), color).save(buffer, 'JPEG')
+                name = default_storage.save(name, ContentFile(buffer.getvalue()))
+            names.append(name)
+        return names
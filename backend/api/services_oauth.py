@@ -2,14 +2,16 @@
 import os
 import requests
 import logging
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.db import transaction
 from .models import SocialAccount, UserProfile
 
 logger = logging.getLogger(__name__)
 
-KAKAO_TOKEN_URL = 'https://kauth.kakao.com/oauth/token'
-KAKAO_USER_INFO_URL = 'https://kapi.kakao.com/v2/user/me'
+# 호스트는 settings.KAKAO_AUTH_HOST / KAKAO_API_HOST (부하 테스트에서 가짜 서버로 교체)
+KAKAO_TOKEN_PATH = '/oauth/token'
+KAKAO_USER_INFO_PATH = '/v2/user/me'
 
 
 class KakaoOAuthService:
@@ -39,7 +41,9 @@ class KakaoOAuthService:
         logger.info(f'Kakao token request - redirect_uri: {redirect_uri}, code: {code[:20]}...')
 
         try:
-            response = requests.post(KAKAO_TOKEN_URL, data=data, timeout=10)
+            response = requests.post(
+                f'{settings.KAKAO_AUTH_HOST}{KAKAO_TOKEN_PATH}', data=data, timeout=10
+            )
             response.raise_for_status()
             return response.json()
         except requests.Timeout:
@@ -48,7 +52,7 @@ class KakaoOAuthService:
         except requests.HTTPError as e:
             error_data = {}
             try:
-                error_data = e.response.json() if e.response else {}
+                error_data = e.response.json() if e.response is not None else {}
             except Exception:
                 pass
             logger.error(f'Kakao token request failed: {e}, response: {error_data}')
@@ -64,7 +68,9 @@ class KakaoOAuthService:
         }
 
         try:
-            response = requests.get(KAKAO_USER_INFO_URL, headers=headers, timeout=10)
+            response = requests.get(
+                f'{settings.KAKAO_API_HOST}{KAKAO_USER_INFO_PATH}', headers=headers, timeout=10
+            )
             response.raise_for_status()
             return response.json()
         except requests.Timeout:
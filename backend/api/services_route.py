@@ -0,0 +1,176 @@
+"""빙고 보드 방문 경로 추천 서비스"""
+import hashlib
+
+from django.core.cache import cache
+
+from .geo import distance_matrix_m
+from .services import BingoService, DEFAULT_BOARD_SIZE, line_masks
+
+ROUTE_CACHE_TIMEOUT = 60 * 10
+START_PRECISION = 4  # 출발 좌표 반올림 자릿수 (캐시 키 단위)
+
+
+class RoutePlanner:
+    """
+    남은 셀(미활성 식당)의 방문 순서를 계산한다.
+
+    - 기본: 최근접 이웃(nearest neighbour)으로 초기 경로를 만든 뒤 2-opt로 개선 (시작점 고정, 열린 경로)
+    - prioritize_lines: 매 단계 새로 완성되는 라인 수가 가장 많은 셀을 먼저, 동률이면 가장 가까운 셀을
+      고르는 탐욕 경로. 라인 우선 순서를 유지하기 위해 2-opt는 적용하지 않는다.
+    """
+
+    @staticmethod
+    def cache_key(board, activated_mask, lat, lng, prioritize_lines, items):
+        # 보드 상태(활성 마스크)나 남은 셀의 식당/좌표(관리자 템플릿 수정)가 바뀌면 키도 바뀌므로
+        # 별도 무효화가 필요 없다
+        items_version = hashlib.md5(repr([
+            (item.position, item.restaurant_id, str(item.restaurant.latitude),
+             str(item.restaurant.longitude))
+            for item in items
+        ]).encode()).hexdigest()[:12]
+        return (
+            f'board-route:{board.id}:{activated_mask}:{board.template.size}:{items_version}:'
+            f'{lat:.4f}:{lng:.4f}:{int(prioritize_lines)}'
+        )
+
+    @classmethod
+    def plan_for_board(cls, board, lat, lng, prioritize_lines=False):
+        """보드의 남은 셀 방문 경로 (보드 상태별 캐시)"""
+        activated = BingoService.get_activated_positions(board)
+        activated_mask = BingoService.positions_to_mask(activated)
+        items = [
+            item for item in board.template.items.select_related('restaurant')
+            if item.position not in activated
+        ]
+        # 캐시 키 단위(약 11m)로 맞춘 출발점에서 계산해야 같은 키의 다른 요청과 거리가 일치한다
+        lat, lng = round(lat, START_PRECISION), round(lng, START_PRECISION)
+        key = cls.cache_key(board, activated_mask, lat, lng, prioritize_lines, items)
+        result = cache.get(key)
+        if result is None:
+            result = cls.plan(
+                items, activated_mask, lat, lng, prioritize_lines, board.template.size
+            )
+            cache.set(key, result, ROUTE_CACHE_TIMEOUT)
+        return result
+
+    @classmethod
+    def plan(cls, items, activated_mask, lat, lng, prioritize_lines=False,
+             size=DEFAULT_BOARD_SIZE):
+        """템플릿 아이템 목록의 방문 순서와 구간 거리를 계산한다"""
+        if not items:
+            return {'total_distance_m': 0, 'route': []}
+
+        dist = distance_matrix_m(
+            [lat] + [float(item.restaurant.latitude) for item in items],
+            [lng] + [float(item.restaurant.longitude) for item in items],
+        )
+        positions = [item.position for item in items]
+
+        if prioritize_lines:
+            order = cls._line_first_nearest_neighbour(dist, positions, activated_mask, size)
+        else:
+            order = cls._two_opt(dist, cls._nearest_neighbour(dist))
+
+        route = []
+        total = 0.0
+        mask = activated_mask
+        previous = 0
+        for node in order:
+            item = items[node - 1]
+            leg = float(dist[previous, node])
+            completes = cls._lines_completed_by(mask, item.position, size)
+            mask |= 1 << item.position
+            total += leg
+            route.append({
+                'order': len(route) + 1,
+                'position': item.position,
+                'restaurant': {
+                    'id': item.restaurant.id,
+                    'name': item.restaurant.name,
+                    'latitude': float(item.restaurant.latitude),
+                    'longitude': float(item.restaurant.longitude),
+                },
+                'leg_distance_m': round(leg),
+                'completes_lines': completes,
+            })
+            previous = node
+
+        return {'total_distance_m': round(total), 'route': route}
+
+    @staticmethod
+    def _lines_completed_by(mask, position, size=DEFAULT_BOARD_SIZE):
+        """mask 상태에서 position을 추가하면 새로 완성되는 라인 수"""
+        new_mask = mask | (1 << position)
+        return sum(
+            1 for line in line_masks(size)
+            if line & (1 << position) and (new_mask & line) == line and (mask & line) != line
+        )
+
+    @staticmethod
+    def _nearest_neighbour(dist):
+        """노드 0(시작점)에서 출발하는 최근접 이웃 경로 (시작점 제외 노드 목록)"""
+        import numpy as np
+
+        n = len(dist)
+        visited = np.zeros(n, dtype=bool)
+        visited[0] = True
+        order = []
+        current = 0
+        for _ in range(n - 1):
+            candidates = np.where(visited, np.inf, dist[current])
+            current = int(np.argmin(candidates))
+            visited[current] = True
+            order.append(current)
+        return order
+
+    @classmethod
+    def _line_first_nearest_neighbour(cls, dist, positions, activated_mask,
+                                      size=DEFAULT_BOARD_SIZE):
+        """완성 라인 수가 가장 많은 셀 중 최근접 셀을 고르는 경로"""
+        import numpy as np
+
+        n = len(dist)
+        visited = np.zeros(n, dtype=bool)
+        visited[0] = True
+        order = []
+        current = 0
+        mask = activated_mask
+        for _ in range(n - 1):
+            gains = np.array(
+                [-1] + [cls._lines_completed_by(mask, pos, size) for pos in positions]
+            )
+            gains[visited] = -1
+            cost = np.where(gains == gains.max(), dist[current], np.inf)
+            current = int(np.argmin(cost))
+            visited[current] = True
+            mask |= 1 << positions[current - 1]
+            order.append(current)
+        return order
+
+    @staticmethod
+    def _two_opt(dist, order, max_passes=20):
+        """시작점 고정 열린 경로에 대한 2-opt 개선 (구간 뒤집기를 벡터화 평가)"""
+        import numpy as np
+
+        path = np.array([0] + order)
+        n = len(path)
+        for _ in range(max_passes):
+            improved = False
+            for i in range(1, n - 1):
+                a, b = path[i - 1], path[i]
+                ks = np.arange(i + 1, n)
+                c = path[ks]
+                # 경로 끝(k == n-1)이면 뒤 간선이 없다
+                d = path[np.minimum(ks + 1, n - 1)]
+                has_next = ks + 1 < n
+                before = dist[a, b] + np.where(has_next, dist[c, d], 0.0)
+                after = dist[a, c] + np.where(has_next, dist[b, d], 0.0)
+                delta = after - before
+                best = int(np.argmin(delta))
+                if delta[best] < -1e-9:
+                    k = int(ks[best])
+                    path[i:k + 1] = path[i:k + 1][::-1]
+                    improved = True
+            if not improved:
+                break
+        return [int(node) for node in path[1:]]
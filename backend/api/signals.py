@@ -0,0 +1,225 @@
+import logging
+import threading
+from collections import defaultdict
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import analytics, realtime, search, stats
+from .models import BingoBoard, Restaurant, Review, ReviewComment, ReviewLike
+
+User = get_user_model()
+logger = logging.getLogger(__name__)
+
+RESTAURANT_SEARCH_FIELDS = ('name', 'address')
+USER_SEARCH_FIELDS = ('username', 'email')
+
+
+def _search_fields_changed(update_fields, fields):
+    return update_fields is None or bool(set(update_fields) & set(fields))
+
+
+@receiver(post_save, sender=Restaurant)
+def index_restaurant(sender, instance, update_fields=None, using='default', **kwargs):
+    """식당 이름/주소 검색 색인 갱신"""
+    if search.uses_trigram_index(using):
+        return
+    if _search_fields_changed(update_fields, RESTAURANT_SEARCH_FIELDS):
+        search.update_ngrams('restaurant', instance.pk, instance.name, instance.address)
+
+
+@receiver(post_delete, sender=Restaurant)
+def unindex_restaurant(sender, instance, using='default', **kwargs):
+    if not search.uses_trigram_index(using):
+        search.delete_ngrams('restaurant', instance.pk)
+
+
+@receiver(post_save, sender=User)
+def index_user(sender, instance, update_fields=None, using='default', **kwargs):
+    """사용자명/이메일 검색 색인 갱신 (last_login 갱신 등은 무시)"""
+    if search.uses_trigram_index(using):
+        return
+    if _search_fields_changed(update_fields, USER_SEARCH_FIELDS):
+        search.update_ngrams('user', instance.pk, instance.username, instance.email)
+
+
+@receiver(post_delete, sender=User)
+def unindex_user(sender, instance, using='default', **kwargs):
+    if not search.uses_trigram_index(using):
+        search.delete_ngrams('user', instance.pk)
+
+
+def _publish_on_commit(build_event, using):
+    """
+    커밋된 변경만 구독자에게 전달 (롤백된 변경은 발행하지 않는다)
+    발행 실패는 로그만 남긴다 (이미 커밋된 쓰기 요청이 500으로 응답하지 않도록)
+    """
+    def publish():
+        try:
+            realtime.publish(build_event())
+        except Exception:
+            logger.exception('review event publish failed')
+
+    transaction.on_commit(publish, using=using)
+
+
+class _ReviewEventBatch:
+    """
+    한 트랜잭션의 좋아요 수 / 댓글 삭제 이벤트를 모아 커밋 후 리뷰당 한 번씩 발행
+    (리뷰/보드/사용자 삭제로 좋아요·댓글이 딸려 지워져도 행마다 COUNT + NOTIFY 하지 않는다)
+
+    발행할 때 DB를 다시 읽어 같은 트랜잭션에서 지워진 리뷰는 건너뛰고 좋아요 수는 커밋된 값으로,
+    댓글은 실제로 지워진 것만 보낸다. 그래서 롤백으로 발행되지 않은 묶음을 다음 트랜잭션이
+    이어 써도 잘못된 이벤트가 나가지 않는다.
+    """
+
+    def __init__(self, using):
+        self.using = using
+        self.like_reviews = set()
+        self.deleted_comments = {}  # comment_id: review_id
+        self.published = False
+
+    def events(self):
+        review_ids = self.like_reviews | set(self.deleted_comments.values())
+        like_counts = dict(
+            Review.objects.using(self.using).filter(pk__in=review_ids)
+            .annotate(like_count=Count('likes')).values_list('pk', 'like_count')
+        )
+        events = [
+            {'type': 'like', 'review_id': review_id, 'like_count': like_counts[review_id]}
+            for review_id in sorted(self.like_reviews) if review_id in like_counts
+        ]
+        comments = {
+            comment_id: review_id for comment_id, review_id in self.deleted_comments.items()
+            if review_id in like_counts
+        }
+        if comments:
+            remaining = set(
+                ReviewComment.objects.using(self.using).filter(pk__in=comments)
+                .values_list('pk', flat=True)
+            )
+            deleted = defaultdict(list)
+            for comment_id, review_id in sorted(comments.items()):
+                if comment_id not in remaining:
+                    deleted[review_id].append(comment_id)
+            events += [
+                {'type': 'comment.deleted', 'review_id': review_id, 'comment_ids': comment_ids}
+                for review_id, comment_ids in sorted(deleted.items())
+            ]
+        return events
+
+    def __call__(self):
+        # 이벤트마다 on_commit에 등록되므로 처음 한 번만 발행한다
+        if self.published:
+            return
+        self.published = True
+        try:
+            for event in self.events():
+                realtime.publish(event)
+        except Exception:
+            logger.exception('review event publish failed')
+
+
+_local = threading.local()
+
+
+def _event_batch(using):
+    """이 스레드에서 아직 발행하지 않은 이벤트 묶음 (없으면 새로)"""
+    batches = _local.__dict__.setdefault('batches', {})
+    batch = batches.get(using)
+    if batch is None or batch.published:
+        batch = batches[using] = _ReviewEventBatch(using)
+    return batch
+
+
+def _queue_like_count(review_id, using):
+    batch = _event_batch(using)
+    batch.like_reviews.add(review_id)
+    # 트랜잭션 밖이면 바로 실행되므로 이벤트를 넣은 뒤 등록한다 (세이브포인트 롤백도 on_commit이 처리)
+    transaction.on_commit(batch, using=using)
+
+
+@receiver(post_save, sender=ReviewLike)
+def publish_like_added(sender, instance, created, using='default', **kwargs):
+    """좋아요 수 변경 이벤트"""
+    if created:
+        _queue_like_count(instance.review_id, using)
+
+
+@receiver(post_delete, sender=ReviewLike)
+def publish_like_removed(sender, instance, using='default', **kwargs):
+    _queue_like_count(instance.review_id, using)
+
+
+@receiver(post_save, sender=ReviewComment)
+def publish_comment_created(sender, instance, created, using='default', **kwargs):
+    if not created:
+        return
+    from .serializers import ReviewCommentSerializer
+    _publish_on_commit(lambda: {
+        'type': 'comment.created',
+        'review_id': instance.review_id,
+        'comment': ReviewCommentSerializer(instance).data,
+    }, using)
+
+
+@receiver(post_delete, sender=ReviewComment)
+def publish_comment_deleted(sender, instance, using='default', **kwargs):
+    batch = _event_batch(using)
+    batch.deleted_comments[instance.pk] = instance.review_id
+    transaction.on_commit(batch, using=using)
+
+
+# 생성/삭제 시 일별 집계(DailyStat)에 반영할 모델: (지표, 날짜 필드)
+DAILY_STAT_SOURCES = {
+    model: (metric, field)
+    for metric, (model, field) in stats.METRIC_SOURCES.items()
+    if metric != 'boards_completed'  # 완료는 BingoService.update_board_completion에서 반영
+}
+
+
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=BingoBoard)
+@receiver(post_save, sender=Review)
+@receiver(post_save, sender=ReviewLike)
+@receiver(post_save, sender=ReviewComment)
+def count_created(sender, instance, created, using='default', **kwargs):
+    """일별 집계 증가"""
+    if created:
+        metric, field = DAILY_STAT_SOURCES[sender]
+        stats.bump(metric, getattr(instance, field), 1, using)
+
+
+@receiver(post_delete, sender=User)
+@receiver(post_delete, sender=BingoBoard)
+@receiver(post_delete, sender=Review)
+@receiver(post_delete, sender=ReviewLike)
+@receiver(post_delete, sender=ReviewComment)
+def count_deleted(sender, instance, using='default', **kwargs):
+    """일별 집계 감소 (재계산 결과와 같도록 원래 날짜에서 뺀다)"""
+    metric, field = DAILY_STAT_SOURCES[sender]
+    stats.bump(metric, getattr(instance, field), -1, using)
+    if sender is BingoBoard:
+        stats.bump('boards_completed', instance.completed_at, -1, using)
+
+
+@receiver(post_save, sender=Review)
+def activate_board_cell(sender, instance, created, using='default', **kwargs):
+    """리뷰 작성 시 보드 활성 마스크와 템플릿 퍼널 갱신"""
+    if created:
+        analytics.record_review(instance, using)
+
+
+@receiver(post_delete, sender=Review)
+def deactivate_board_cell(sender, instance, using='default', **kwargs):
+    analytics.forget_review(instance, using)
+
+
+@receiver(post_save, sender=BingoBoard)
+@receiver(post_delete, sender=BingoBoard)
+def mark_template_funnel_stale(sender, instance, using='default', **kwargs):
+    """보드 시작/삭제 시 템플릿 퍼널 재계산 표시"""
+    analytics.mark_stale(instance.template_id, using)
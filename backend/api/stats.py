@@ -0,0 +1,143 @@
+"""
+관리자 대시보드 일별 집계 (DailyStat)
+
+- 시그널/서비스가 활동이 생기거나 삭제될 때 그날 행의 카운터를 F()로 증감한다.
+  트랜잭션 안의 증감은 모아 두었다가 커밋 후 날짜별 UPDATE 한 번으로 반영한다
+  (리뷰 작성의 보드 잠금 동안 모든 요청이 함께 쓰는 오늘 행을 잠그지 않고,
+  리뷰/보드 삭제로 딸려 지워지는 좋아요/댓글도 행마다 UPDATE하지 않는다).
+- rebuild()는 원본 테이블을 날짜별로 묶어 전체를 다시 계산한다 (rebuild_daily_stats 명령).
+- 대시보드는 조회 기간의 일 수만큼의 행만 읽는다.
+"""
+import threading
+import weakref
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from .models import BingoBoard, DailyStat, Review, ReviewComment, ReviewLike
+
+User = get_user_model()
+
+# 지표 이름: (원본 모델, 해당 날짜를 정하는 필드)
+METRIC_SOURCES = {
+    'signups': (User, 'date_joined'),
+    'boards_created': (BingoBoard, 'created_at'),
+    'boards_completed': (BingoBoard, 'completed_at'),
+    'reviews': (Review, 'created_at'),
+    'likes': (ReviewLike, 'created_at'),
+    'comments': (ReviewComment, 'created_at'),
+}
+METRICS = tuple(METRIC_SOURCES)
+
+
+class PendingDeltas:
+    """한 트랜잭션(같은 세이브포인트 범위)에서 모은 (지표, 날짜)별 증감, 커밋 후 호출되면 반영"""
+
+    def __init__(self, using, deltas=None):
+        self.using = using
+        self.deltas = Counter(deltas)
+        self.applied = False
+
+    def __call__(self):
+        self.applied = True
+        by_day = defaultdict(dict)
+        for (metric, day), delta in self.deltas.items():
+            if delta:
+                by_day[day][metric] = delta
+        for day, deltas in sorted(by_day.items()):
+            apply(day, deltas, self.using)
+
+
+_local = threading.local()
+
+
+def _open_deltas():
+    """
+    이 스레드에서 커밋을 기다리는 PendingDeltas {(DB, 세이브포인트 범위): PendingDeltas}
+    약한 참조라 롤백으로 on_commit 콜백이 버려지면 항목도 함께 사라진다
+    """
+    if not hasattr(_local, 'pending'):
+        _local.pending = weakref.WeakValueDictionary()
+    return _local.pending
+
+
+def bump(metric, when, delta=1, using='default'):
+    """when이 속한 날(현지 시간)의 metric을 delta만큼 증감 (트랜잭션 안이면 커밋 후)"""
+    if when is None:
+        return
+    key = (metric, timezone.localdate(when))
+    connection = transaction.get_connection(using)
+    # 범위가 같아야 세이브포인트 롤백 때 on_commit 콜백과 함께 버려진다
+    scope = (using, tuple(connection.savepoint_ids))
+    pending = _open_deltas().get(scope) if connection.in_atomic_block else None
+    if pending is not None and not pending.applied:
+        pending.deltas[key] += delta
+        return
+    pending = PendingDeltas(using, {key: delta})
+    if connection.in_atomic_block:
+        _open_deltas()[scope] = pending
+    # 집계 실패가 이미 커밋된 요청을 실패시키지 않도록 robust (rebuild로 복구)
+    transaction.on_commit(pending, using=using, robust=True)
+
+
+def apply(day, deltas, using='default'):
+    """day 행의 {지표: 증감}을 UPDATE 한 번으로 반영 (행이 없으면 생성)"""
+    stats = DailyStat.objects.using(using)
+    changes = {metric: F(metric) + delta for metric, delta in deltas.items()}
+    if stats.filter(date=day).update(**changes):
+        return
+    try:
+        with transaction.atomic(using=using):
+            stats.create(date=day, **deltas)
+    except IntegrityError:
+        # 같은 날 행이 동시에 생성된 경우
+        stats.filter(date=day).update(**changes)
+
+
+def rebuild():
+    """원본 테이블에서 전체 일별 집계를 다시 계산, 생성한 행 수 반환"""
+    rows = defaultdict(dict)
+    for metric, (model, field) in METRIC_SOURCES.items():
+        counts = (
+            model.objects.filter(**{f'{field}__isnull': False}).order_by()
+            .annotate(day=TruncDate(field)).values('day')
+            .annotate(total=Count('pk')).values_list('day', 'total')
+        )
+        for day, total in counts:
+            rows[day][metric] = total
+
+    with transaction.atomic():
+        DailyStat.objects.all().delete()
+        DailyStat.objects.bulk_create(
+            [DailyStat(date=day, **values) for day, values in sorted(rows.items())],
+            batch_size=1000,
+        )
+    return len(rows)
+
+
+def totals():
+    """전체 기간 누적 (일별 행의 합)"""
+    return DailyStat.objects.aggregate(
+        **{metric: Coalesce(Sum(metric), 0) for metric in METRICS}
+    )
+
+
+def daily(days, today=None):
+    """최근 days일의 일별 지표 (활동이 없는 날은 0)"""
+    today = today or timezone.localdate()
+    start = today - timedelta(days=days - 1)
+    stored = {
+        row['date']: row
+        for row in DailyStat.objects.filter(date__gte=start, date__lte=today).values('date', *METRICS)
+    }
+    series = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        row = stored.get(day, {})
+        series.append({'date': day, **{metric: row.get(metric, 0) for metric in METRICS}})
+    return series
@@ -3,6 +3,7 @@ from rest_framework.routers import DefaultRouter
 from . import views
 from . import views_auth
 from . import views_admin
+from . import views_events
 
 router = DefaultRouter()
 router.register('categories', views.CategoryViewSet, basename='category')
@@ -19,10 +20,17 @@ admin_router.register('users', views_admin.AdminUserViewSet, basename='admin-use
 
 urlpatterns = [
     path('health/', views.health_check, name='health-check'),
+    path('home/', views.home, name='home'),
     path('reviews/feed/', views.review_feed, name='review-feed'),
+    path('reviews/events/', views_events.review_events, name='review-events'),
+    path('uploads/review-image/', views.review_image_upload_target, name='upload-review-image'),
+    path('uploads/local/', views.local_image_upload, name='upload-local'),
+    path('restaurants/nearby/', views.nearby_restaurants, name='restaurants-nearby'),
     path('', include(router.urls)),
     path('admin/', include(admin_router.urls)),
     path('admin/kakao/search/', views_admin.kakao_search_view, name='admin-kakao-search'),
+    path('admin/stats/', views_admin.admin_stats_view, name='admin-stats'),
+    path('admin/db/', views_admin.admin_db_stats_view, name='admin-db-stats'),
     path('reviews/<int:review_id>/like/', views.review_like_toggle, name='review-like-toggle'),
     path('reviews/<int:review_id>/comments/', views.review_comments, name='review-comments'),
     path('reviews/<int:review_id>/comments/<int:comment_id>/', views.review_comment_delete, name='review-comment-delete'),
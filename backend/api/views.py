@@ -1,12 +1,24 @@
+import hashlib
+import json
+
 from rest_framework import viewsets, status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import (
+    action, api_view, authentication_classes, permission_classes,
+)
+from rest_framework.pagination import CursorPagination
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
-from django.utils import timezone
-from django.db import models
-from django.db.models import Count, F, ExpressionWrapper, DurationField
+from rest_framework.settings import api_settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.urls import reverse
+from django.utils.http import parse_etags
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F, ExpressionWrapper, DurationField, Prefetch
 from django.contrib.auth import get_user_model
-from .models import Category, BingoTemplate, BingoBoard, Review, ReviewLike, ReviewComment
+from .models import (
+    Category, Restaurant, BingoTemplate, BingoTemplateItem, BingoBoard,
+    Review, ReviewLike, ReviewComment,
+)
 
 User = get_user_model()
 from .serializers import (
@@ -17,23 +29,141 @@ from .serializers import (
     BingoBoardCreateSerializer,
     ReviewSerializer,
     ReviewCreateSerializer,
+    ReviewFeedSerializer,
+    LocalImageUploadSerializer,
+    FieldSelection,
+    with_item_count,
+    with_social_counts,
 )
+from .replica import ReplicaReadMixin, reads_from_replica
 from .services import BingoService
+from .services_upload import UploadService
+from .views_auth import user_summary
+
+
+def _template_list_queryset():
+    """활성 템플릿 목록 (카테고리 조인, item_count 주석)"""
+    return with_item_count(
+        BingoTemplate.objects.filter(is_active=True).select_related('category')
+    ).order_by('-created_at')
+
+
+def _restaurant_joins(selection, path='restaurant'):
+    """식당 필드(selection)를 반환하는 데 필요한 select_related 경로"""
+    joins = [path]
+    if selection.wants('category_name') or selection.expands('category'):
+        joins.append(f'{path}__category')
+    return joins
+
+
+def _template_items_queryset(selection):
+    """템플릿 셀 prefetch용 queryset (식당 필드를 요청할 때만 조인)"""
+    items = BingoTemplateItem.objects.all()
+    if selection.wants('restaurant'):
+        items = items.select_related(*_restaurant_joins(selection.nested('restaurant')))
+    return items
+
+
+def _board_list_queryset(user, selection=None):
+    """
+    사용자 보드 목록 (셀/리뷰를 보드 수와 무관하게 고정 쿼리로 prefetch)
+    - ?fields=로 고른 필드에 필요한 조인/prefetch만 붙인다
+    """
+    selection = selection or FieldSelection()
+    queryset = BingoBoard.objects.filter(user=user)
+    if selection.expands('template'):
+        queryset = queryset.select_related('template__category')
+    elif any(selection.wants(name) for name in (
+        'template_title', 'size', 'cells', 'completed_lines', 'progress',
+    )):
+        queryset = queryset.select_related('template')
+
+    cells = selection.nested('cells')
+    prefetches = []
+    if selection.wants('cells') or selection.wants('completed_lines'):
+        prefetches.append(Prefetch('template__items', queryset=_template_items_queryset(cells)))
+    if any(selection.wants(name) for name in ('cells', 'completed_lines', 'progress')):
+        reviews = Review.objects.all()
+        if selection.wants('cells.review'):
+            reviews = with_social_counts(reviews, user, cells.nested('review'))
+        prefetches.append(Prefetch('reviews', queryset=reviews))
+    return queryset.prefetch_related(*prefetches).order_by('-created_at')
+
+
+# 배치 조회 한 번에 받을 수 있는 최대 ID 수
+MAX_BATCH_IDS = 50
+
+
+def _parse_ids(value, max_count=MAX_BATCH_IDS):
+    """?ids=1,2,3 파싱 (요청 순서 유지, 중복 제거)"""
+    try:
+        ids = list(dict.fromkeys(int(part) for part in value.split(',') if part.strip()))
+    except ValueError:
+        raise ValueError('ids는 쉼표로 구분한 ID 목록이어야 합니다.')
+    if not ids:
+        raise ValueError('ids 파라미터가 필요합니다.')
+    if len(ids) > max_count:
+        raise ValueError(f'한 번에 최대 {max_count}개까지 조회할 수 있습니다.')
+    return ids
+
+
+def _batch_response(viewset, request):
+    """
+    get_queryset()(본인 소유 필터 + prefetch)으로 여러 객체를 한 번에 조회
+    - results: 요청한 id 순서, missing: 없거나 권한이 없는 id
+    """
+    try:
+        ids = _parse_ids(request.query_params.get('ids', ''))
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    found = {obj.id: obj for obj in viewset.get_queryset().filter(id__in=ids)}
+    serializer = viewset.get_serializer([found[i] for i in ids if i in found], many=True)
+    return Response({
+        'results': serializer.data,
+        'missing': [i for i in ids if i not in found],
+    })
 
 
-class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
+def _feed_queryset(user, selection=None):
+    selection = selection or FieldSelection()
+    joins = []
+    if selection.expands('restaurant'):
+        joins += _restaurant_joins(selection.nested('restaurant'))
+    elif selection.wants('restaurant_name'):
+        joins.append('restaurant')
+    if selection.wants('display_name'):
+        joins += ['user', 'user__profile']
+    return with_social_counts(
+        Review.objects.filter(is_public=True).select_related(*joins), user, selection,
+    ).order_by('-created_at')
+
+
+class CategoryViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     """카테고리 조회 API (읽기 전용)"""
     queryset = Category.objects.all().order_by('id')
     serializer_class = CategorySerializer
     permission_classes = [AllowAny]
 
 
-class BingoTemplateViewSet(viewsets.ReadOnlyModelViewSet):
+class BingoTemplateViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     """빙고 템플릿 조회 API (읽기 전용, 활성 템플릿만)"""
     permission_classes = [AllowAny]
 
     def get_queryset(self):
-        return BingoTemplate.objects.filter(is_active=True).order_by('-created_at')
+        if self.action == 'list':
+            return _template_list_queryset()
+        queryset = BingoTemplate.objects.filter(is_active=True).order_by('-created_at')
+        if self.action == 'retrieve':
+            # ?fields=/?expand=에 필요한 조인/prefetch만
+            selection = FieldSelection.from_request(self.request)
+            if selection.wants('category_name') or selection.expands('category'):
+                queryset = queryset.select_related('category')
+            if selection.wants('items'):
+                queryset = queryset.prefetch_related(Prefetch(
+                    'items', queryset=_template_items_queryset(selection.nested('items')),
+                ))
+        return queryset
 
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -51,6 +181,10 @@ class BingoBoardViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """사용자 본인의 보드만 조회"""
+        if self.action in ('list', 'retrieve', 'batch'):
+            return _board_list_queryset(
+                self.request.user, FieldSelection.from_request(self.request)
+            )
         return BingoBoard.objects.filter(user=self.request.user).order_by('-created_at')
 
     def get_serializer_class(self):
@@ -62,6 +196,98 @@ class BingoBoardViewSet(viewsets.ModelViewSet):
         """보드 생성 시 사용자 자동 설정"""
         serializer.save(user=self.request.user)
 
+    @action(detail=False, methods=['get'])
+    def batch(self, request):
+        """여러 보드 한 번에 조회 - ?ids=1,2,3 (본인 보드만, 최대 MAX_BATCH_IDS개)"""
+        return _batch_response(self, request)
+
+    @action(detail=True, methods=['get'])
+    def route(self, request, pk=None):
+        """
+        남은 셀 방문 경로 추천
+        - ?lat=&lng= : 출발 좌표 (필수)
+        - ?prioritize=lines : 빙고 라인을 많이 완성하는 셀 우선
+        """
+        from .services_route import RoutePlanner
+
+        board = self.get_object()
+        try:
+            lat, lng = _parse_point(request.query_params, required=True)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        prioritize_lines = request.query_params.get('prioritize') == 'lines'
+
+        result = RoutePlanner.plan_for_board(board, lat, lng, prioritize_lines)
+        return Response({
+            'board_id': board.id,
+            'start': {'latitude': lat, 'longitude': lng},
+            'prioritize_lines': prioritize_lines,
+            **result,
+        })
+
+    @action(detail=True, methods=['get'])
+    def recommendations(self, request, pk=None):
+        """
+        다음에 방문할 셀 추천 (빙고 진행 기여도 순)
+        - ?lat=&lng= : 현재 위치 (선택, 주어지면 거리로 가중)
+        - ?limit= : 최대 개수
+        """
+        board = self.get_object()
+        try:
+            point = _parse_point(request.query_params)
+            limit = _to_number(request.query_params.get('limit', 25), 'limit', int)
+            if limit < 1:
+                raise ValueError('limit은 1 이상이어야 합니다.')
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        activated = BingoService.get_activated_positions(board)
+        size = board.template.size
+        completed_lines = BingoService.count_completed_lines(activated, size)
+        ranking = BingoService.rank_next_cells(BingoService.positions_to_mask(activated), size)
+        items = {
+            item.position: item
+            for item in board.template.items.select_related('restaurant')
+        }
+        ranking = [r for r in ranking if r[0] in items]
+
+        distances = [None] * len(ranking)
+        if point and ranking:
+            from .geo import haversine_m
+            distances = haversine_m(
+                point[0], point[1],
+                [float(items[r[0]].restaurant.latitude) for r in ranking],
+                [float(items[r[0]].restaurant.longitude) for r in ranking],
+            ).tolist()
+
+        recommendations = []
+        for (position, lines_completed, lines_one_away, score), distance in zip(ranking, distances):
+            restaurant = items[position].restaurant
+            # 거리 가중: 1km 떨어진 셀은 점수가 절반이 된다
+            weighted = score / (1 + distance / 1000) if distance is not None else score
+            recommendations.append({
+                'position': position,
+                'restaurant': {
+                    'id': restaurant.id,
+                    'name': restaurant.name,
+                    'latitude': float(restaurant.latitude),
+                    'longitude': float(restaurant.longitude),
+                },
+                'lines_completed': lines_completed,
+                'lines_one_away': lines_one_away,
+                'reaches_goal': completed_lines + lines_completed >= board.target_line_count,
+                'score': round(weighted, 2),
+                'distance_m': round(distance) if distance is not None else None,
+            })
+        recommendations.sort(key=lambda r: -r['score'])
+
+        return Response({
+            'board_id': board.id,
+            'completed_lines': completed_lines,
+            'target_line_count': board.target_line_count,
+            'recommendations': recommendations[:limit],
+        })
+
 
 class ReviewViewSet(viewsets.ModelViewSet):
     """리뷰 API (인증 필요)"""
@@ -69,39 +295,55 @@ class ReviewViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """사용자 본인의 리뷰만 조회"""
-        return Review.objects.filter(user=self.request.user).order_by('-created_at')
+        queryset = Review.objects.filter(user=self.request.user).order_by('-created_at')
+        if self.action in ('list', 'retrieve', 'batch'):
+            selection = FieldSelection.from_request(self.request)
+            if selection.expands('restaurant'):
+                queryset = queryset.select_related(
+                    *_restaurant_joins(selection.nested('restaurant'))
+                )
+            queryset = with_social_counts(queryset, self.request.user, selection)
+        return queryset
 
     def get_serializer_class(self):
         if self.action == 'create':
             return ReviewCreateSerializer
         return ReviewSerializer
 
+    @action(detail=False, methods=['get'])
+    def batch(self, request):
+        """여러 리뷰 한 번에 조회 - ?ids=1,2,3 (본인 리뷰만, 최대 MAX_BATCH_IDS개)"""
+        return _batch_response(self, request)
+
     def create(self, request, *args, **kwargs):
-        """리뷰 생성 후 빙고 완료 체크"""
+        """
+        리뷰 생성 후 빙고 완료 체크
+
+        같은 보드에 리뷰가 동시에 들어와도 완료 판정이 한 번만 일어나도록
+        리뷰 저장과 완료 체크를 보드 행 잠금(select_for_update) 아래 한 트랜잭션에서 처리한다.
+        """
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        review = serializer.save(user=request.user)
-
-        # 빙고 완료 체크
-        board = review.bingo_board
-        bingo_completed = False
-        goal_achieved = False
-
-        if not board.is_completed:
-            activated = BingoService.get_activated_positions(board)
-            completed_lines = BingoService.count_completed_lines(activated)
-            if completed_lines >= board.target_line_count:
-                board.is_completed = True
-                board.completed_at = timezone.now()
-                board.save()
-                bingo_completed = True
-                goal_achieved = True
-            elif completed_lines > 0:
-                # 새 라인이 완성되었지만 목표 미달성
-                bingo_completed = True
+        # 이미지 해시/저장은 잠금을 잡기 전에 (파일 전체를 읽는 동안 다른 리뷰가 기다리지 않도록)
+        serializer.store_image()
+
+        try:
+            with transaction.atomic():
+                board = BingoBoard.objects.select_for_update().select_related('template').get(
+                    pk=serializer.validated_data['bingo_board'].pk
+                )
+                serializer.save(user=request.user, bingo_board=board)
+                completed_lines, goal_achieved = BingoService.update_board_completion(board)
+        except IntegrityError:
+            # 유효성 검사 이후 같은 식당 리뷰가 먼저 저장된 경우
+            return Response(
+                {'restaurant': ['이미 이 보드에 리뷰를 작성한 식당입니다.']},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
         response_data = serializer.data
-        response_data['bingo_completed'] = bingo_completed
+        # 새 라인이 완성되었지만 목표 미달성인 경우에도 bingo_completed는 True
+        response_data['bingo_completed'] = completed_lines > 0
         response_data['goal_achieved'] = goal_achieved
 
         return Response(response_data, status=status.HTTP_201_CREATED)
@@ -113,6 +355,7 @@ class ReviewViewSet(viewsets.ModelViewSet):
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
+@reads_from_replica
 def leaderboard(request):
     """
     리더보드 API
@@ -185,20 +428,216 @@ def leaderboard(request):
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
+@reads_from_replica
 def review_feed(request):
     """공개 리뷰 피드 - 최신순, 페이지네이션"""
     from rest_framework.pagination import PageNumberPagination
-    from .serializers import ReviewFeedSerializer
 
-    reviews = Review.objects.filter(is_public=True).select_related(
-        'restaurant', 'user', 'user__profile'
-    ).order_by('-created_at')
+    reviews = _feed_queryset(request.user, FieldSelection.from_request(request))
     paginator = PageNumberPagination()
     page = paginator.paginate_queryset(reviews, request)
     serializer = ReviewFeedSerializer(page, many=True, context={'request': request})
     return paginator.get_paginated_response(serializer.data)
 
 
+# =============================================================================
+# Home API
+# =============================================================================
+
+def _first_page(request, queryset, serializer_class, list_url_name):
+    """목록 엔드포인트의 첫 페이지와 같은 형태 (next는 원래 목록 엔드포인트를 가리킨다)"""
+    page_size = api_settings.PAGE_SIZE
+    count = queryset.count()
+    results = list(queryset[:page_size]) if count else []
+    next_url = None
+    if count > page_size:
+        next_url = request.build_absolute_uri(f'{reverse(list_url_name)}?page=2')
+    return {
+        'count': count,
+        'next': next_url,
+        'previous': None,
+        # 섹션 형태가 고정되도록 ?fields=/?expand=는 적용하지 않는다
+        'results': serializer_class(
+            results, many=True, context={'request': request}, selection=FieldSelection(),
+        ).data,
+    }
+
+
+def _section_etag(name, data):
+    digest = hashlib.md5(
+        json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True).encode()
+    ).hexdigest()
+    return f'W/"{name}-{digest[:20]}"'
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def home(request):
+    """
+    앱 첫 화면 묶음 조회 - me, boards, templates, categories, feed를 한 번에 반환
+    - 각 섹션은 개별 엔드포인트(첫 페이지)와 같은 형태, 비로그인 시 me/boards는 null
+    - etags: 섹션별 ETag. If-None-Match에 이전 ETag들을 보내면
+      바뀌지 않은 섹션은 응답에서 빠지고 not_modified에 이름이 담긴다.
+    """
+    user = request.user if request.user.is_authenticated else None
+    sections = {
+        'me': user_summary(user) if user else None,
+        'boards': _first_page(
+            request, _board_list_queryset(user), BingoBoardSerializer, 'board-list'
+        ) if user else None,
+        'templates': _first_page(
+            request, _template_list_queryset(), BingoTemplateListSerializer, 'template-list'
+        ),
+        'categories': _first_page(
+            request, Category.objects.order_by('id'), CategorySerializer, 'category-list'
+        ),
+        'feed': _first_page(request, _feed_queryset(user), ReviewFeedSerializer, 'review-feed'),
+    }
+
+    etags = {name: _section_etag(name, data) for name, data in sections.items()}
+    known = set(parse_etags(request.headers.get('If-None-Match', '')))
+    not_modified = [name for name, etag in etags.items() if etag in known]
+    return Response({
+        **{name: data for name, data in sections.items() if name not in not_modified},
+        'etags': etags,
+        'not_modified': not_modified,
+    })
+
+
+# =============================================================================
+# Nearby Restaurants API
+# =============================================================================
+
+NEARBY_DEFAULT_RADIUS_M = 1000
+NEARBY_MAX_RADIUS_M = 20000
+NEARBY_DEFAULT_LIMIT = 50
+NEARBY_MAX_LIMIT = 200
+
+
+def _to_number(value, name, cast=float):
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'{name} 값이 올바르지 않습니다.')
+
+
+def _parse_point(params, required=False):
+    """?lat=&lng= 좌표 파싱 (없으면 None, 잘못된 값이면 ValueError)"""
+    if 'lat' not in params and 'lng' not in params:
+        if required:
+            raise ValueError('lat/lng가 필요합니다.')
+        return None
+    point = (_to_number(params.get('lat'), 'lat'), _to_number(params.get('lng'), 'lng'))
+    if not (-90 <= point[0] <= 90 and -180 <= point[1] <= 180):
+        raise ValueError('lat/lng 범위가 올바르지 않습니다.')
+    return point
+
+
+def _parse_nearby_params(params):
+    """주변 식당 조회 파라미터 파싱 (잘못된 값이면 ValueError)"""
+    center = _parse_point(params)
+
+    limit = _to_number(params.get('limit', NEARBY_DEFAULT_LIMIT), 'limit', int)
+    if not (1 <= limit <= NEARBY_MAX_LIMIT):
+        raise ValueError(f'limit은 1 이상 {NEARBY_MAX_LIMIT} 이하여야 합니다.')
+
+    if 'bbox' in params:
+        values = params['bbox'].split(',')
+        if len(values) != 4:
+            raise ValueError('bbox는 south,west,north,east 형식이어야 합니다.')
+        south, west, north, east = (_to_number(v, 'bbox') for v in values)
+        if south > north or west > east:
+            raise ValueError('bbox는 south,west,north,east 형식이어야 합니다.')
+        if center is None:
+            center = ((south + north) / 2, (west + east) / 2)
+        return center, None, (south, west, north, east), limit
+
+    if center is None:
+        raise ValueError('lat/lng 또는 bbox가 필요합니다.')
+    radius = _to_number(params.get('radius', NEARBY_DEFAULT_RADIUS_M), 'radius')
+    if not (0 < radius <= NEARBY_MAX_RADIUS_M):
+        raise ValueError(f'radius는 0 초과 {NEARBY_MAX_RADIUS_M} 이하(m)여야 합니다.')
+    return center, radius, None, limit
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def nearby_restaurants(request):
+    """
+    주변 식당 API
+    - ?lat=&lng=&radius=(m) : 반경 내 식당 (거리순)
+    - ?bbox=south,west,north,east : 영역 내 식당 (lat/lng가 없으면 영역 중심 기준 거리순)
+    승인된 식당과 활성 템플릿에 포함된 식당만 반환한다.
+    """
+    import numpy as np
+    from django.db.models import Prefetch
+    from . import geo
+    from .serializers import NearbyRestaurantSerializer
+
+    try:
+        center, radius, bbox, limit = _parse_nearby_params(request.query_params)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    if bbox is None:
+        bbox = geo.bbox_around(center[0], center[1], radius)
+
+    # 1) geohash 범위 조건으로 후보 좁히기 (인덱스 사용)
+    cells = geo.covering_geohashes(*bbox)
+    candidates = list(
+        Restaurant.objects
+        .filter(geo.geohash_cover_q(cells))
+        .values_list('id', 'latitude', 'longitude', 'is_approved')
+    )
+    if not candidates:
+        return Response({'count': 0, 'results': []})
+
+    ids = np.array([c[0] for c in candidates])
+    lats = np.array([float(c[1]) for c in candidates])
+    lngs = np.array([float(c[2]) for c in candidates])
+    approved = np.array([c[3] for c in candidates], dtype=bool)
+
+    # 2) 벡터화 거리 계산 및 정확한 영역 판정
+    distances = geo.haversine_m(center[0], center[1], lats, lngs)
+    if radius is not None:
+        inside = distances <= radius
+    else:
+        south, west, north, east = bbox
+        inside = (lats >= south) & (lats <= north) & (lngs >= west) & (lngs <= east)
+
+    # 3) 미승인 식당은 활성 템플릿에 포함된 경우에만 노출
+    unapproved_ids = ids[inside & ~approved].tolist()
+    if unapproved_ids:
+        in_template = set(
+            BingoTemplateItem.objects
+            .filter(template__is_active=True, restaurant_id__in=unapproved_ids)
+            .values_list('restaurant_id', flat=True)
+        )
+        visible = approved | np.isin(ids, list(in_template))
+    else:
+        visible = approved
+    selected = np.flatnonzero(inside & visible)
+    selected = selected[np.argsort(distances[selected], kind='stable')][:limit]
+
+    distance_by_id = {int(ids[i]): float(distances[i]) for i in selected}
+    restaurants = (
+        Restaurant.objects
+        .filter(id__in=distance_by_id.keys())
+        .select_related('category')
+        .prefetch_related(Prefetch(
+            'template_items',
+            queryset=BingoTemplateItem.objects.filter(template__is_active=True).select_related('template'),
+            to_attr='active_template_items',
+        ))
+    )
+    restaurants = sorted(restaurants, key=lambda r: distance_by_id[r.id])
+    for restaurant in restaurants:
+        restaurant.distance_m = distance_by_id[restaurant.id]
+
+    serializer = NearbyRestaurantSerializer(restaurants, many=True, context={'request': request})
+    return Response({'count': len(restaurants), 'results': serializer.data})
+
+
 # =============================================================================
 # Review Social (Like/Comment) APIs
 # =============================================================================
@@ -222,10 +661,18 @@ def review_like_toggle(request, review_id):
     })
 
 
+class ReviewCommentPagination(CursorPagination):
+    """댓글 커서 페이지네이션 - (created_at, id) 순, 댓글이 많아도 응답 크기 고정"""
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('created_at', 'id')
+
+
 @api_view(['GET', 'POST'])
 @permission_classes([AllowAny])
 def review_comments(request, review_id):
-    """리뷰 댓글 목록 조회 (AllowAny) / 작성 (인증 필요)"""
+    """리뷰 댓글 목록 조회 (AllowAny, 커서 페이지네이션) / 작성 (인증 필요)"""
     try:
         review = Review.objects.get(id=review_id, is_public=True)
     except Review.DoesNotExist:
@@ -233,9 +680,11 @@ def review_comments(request, review_id):
 
     if request.method == 'GET':
         from .serializers import ReviewCommentSerializer
-        comments = review.comments.select_related('user').all()
-        serializer = ReviewCommentSerializer(comments, many=True)
-        return Response(serializer.data)
+        comments = review.comments.select_related('user', 'user__profile')
+        paginator = ReviewCommentPagination()
+        page = paginator.paginate_queryset(comments, request)
+        serializer = ReviewCommentSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
     # POST - 인증 필요
     if not request.user or not request.user.is_authenticated:
@@ -274,3 +723,42 @@ def review_comment_delete(request, review_id, comment_id):
 
     comment.delete()
     return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+# =============================================================================
+# 리뷰 이미지 직접 업로드
+# =============================================================================
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def review_image_upload_target(request):
+    """
+    리뷰 이미지 업로드 대상 발급
+    - 응답의 upload_url에 fields + file을 multipart로 직접 업로드한 뒤
+      리뷰 생성 시 image 대신 image_ref를 보낸다.
+    """
+    return Response(
+        UploadService.create_target(request.user, request),
+        status=status.HTTP_201_CREATED
+    )
+
+
+@api_view(['POST'])
+@authentication_classes([])
+@permission_classes([AllowAny])
+def local_image_upload(request):
+    """
+    로컬/테스트용 업로드 엔드포인트 (Cloudinary 서명 업로드와 같은 계약)
+    - 인증은 발급 시 서명된 upload_token으로 대신한다.
+    """
+    if UploadService.cloudinary_credentials():
+        return Response({'error': '로컬 업로드가 비활성화되어 있습니다.'}, status=status.HTTP_404_NOT_FOUND)
+
+    serializer = LocalImageUploadSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    try:
+        name = UploadService.local_upload_name(serializer.validated_data['upload_token'])
+        name = UploadService.save_local(name, serializer.validated_data['file'])
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response({'public_id': name}, status=status.HTTP_201_CREATED)
@@ -1,23 +1,27 @@
 import os
-import requests
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from rest_framework import viewsets, filters, status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework import viewsets, status
+from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 
+from . import analytics, stats
 from .models import Category, Restaurant, BingoTemplate
 from .permissions import IsAdminUser
+from .search import IndexedSearchFilter
 from .serializers_admin import (
     AdminCategorySerializer,
     AdminRestaurantSerializer,
     AdminTemplateListSerializer,
     AdminTemplateDetailSerializer,
     AdminTemplateCreateUpdateSerializer,
+    AdminTemplateFunnelSerializer,
     AdminUserSerializer,
+    AdminRestaurantBulkSerializer,
+    AdminUserBulkSerializer,
 )
 
 User = get_user_model()
@@ -30,6 +34,20 @@ class AdminPagination(PageNumberPagination):
     max_page_size = 100
 
 
+def _bulk_results(ids, updated_ids, errors=None):
+    """일괄 처리 결과를 id별 상태 목록으로 변환"""
+    errors = errors or {}
+    results = []
+    for pk in ids:
+        if pk in errors:
+            results.append({'id': pk, 'status': 'error', 'error': errors[pk]})
+        elif pk in updated_ids:
+            results.append({'id': pk, 'status': 'updated'})
+        else:
+            results.append({'id': pk, 'status': 'not_found'})
+    return {'updated_count': len(updated_ids), 'results': results}
+
+
 class AdminCategoryViewSet(viewsets.ModelViewSet):
     """Admin 카테고리 관리 ViewSet"""
     queryset = Category.objects.all().order_by('id')
@@ -44,14 +62,36 @@ class AdminRestaurantViewSet(viewsets.ModelViewSet):
     serializer_class = AdminRestaurantSerializer
     permission_classes = [IsAdminUser]
     pagination_class = AdminPagination
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter]
+    filter_backends = [DjangoFilterBackend, IndexedSearchFilter]
     filterset_fields = ['category', 'is_approved']
     search_fields = ['name', 'address']
+    search_index_kind = 'restaurant'
 
     def perform_create(self, serializer):
         """생성 시 created_by 자동 설정"""
         serializer.save(created_by=self.request.user)
 
+    @action(detail=False, methods=['patch'], url_path='bulk')
+    def bulk(self, request):
+        """식당 일괄 승인/반려/카테고리 변경 (단일 UPDATE)"""
+        serializer = AdminRestaurantBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        ids = list(dict.fromkeys(data['ids']))
+
+        if data['action'] == 'approve':
+            values = {'is_approved': True}
+        elif data['action'] == 'reject':
+            values = {'is_approved': False}
+        else:
+            values = {'category': data['category']}
+
+        queryset = Restaurant.objects.filter(id__in=ids)
+        updated_ids = set(queryset.values_list('id', flat=True))
+        queryset.update(**values)
+
+        return Response(_bulk_results(ids, updated_ids))
+
 
 class AdminTemplateViewSet(viewsets.ModelViewSet):
     """Admin 템플릿 관리 ViewSet"""
@@ -66,6 +106,54 @@ class AdminTemplateViewSet(viewsets.ModelViewSet):
             return AdminTemplateDetailSerializer
         return AdminTemplateCreateUpdateSerializer
 
+    @action(detail=True, methods=['get'])
+    def simulate(self, request, pk=None):
+        """
+        템플릿 난이도 시뮬레이션
+        - ?simulations= : 시행 횟수 (기본 100,000, 최대 200,000)
+        - ?mode=random|distance : 방문 순서 (무작위 / 가까운 곳 우선)
+        - ?seed= : 재현용 난수 시드
+        """
+        from .services_simulation import TemplateSimulator
+
+        template = self.get_object()
+        try:
+            simulations = int(request.query_params.get('simulations', 100_000))
+            seed = request.query_params.get('seed')
+            seed = int(seed) if seed is not None else None
+        except ValueError:
+            return Response(
+                {'error': 'simulations/seed는 정수여야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not (1 <= simulations <= 200_000):
+            return Response(
+                {'error': 'simulations는 1 이상 200,000 이하여야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            result = TemplateSimulator.simulate_template(
+                template,
+                simulations=simulations,
+                mode=request.query_params.get('mode', 'random'),
+                seed=seed,
+            )
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({'template_id': template.id, **result})
+
+    @action(detail=True, methods=['get'])
+    def funnel(self, request, pk=None):
+        """
+        템플릿 진행 퍼널 (보드 시작 → 라인 1/3/5 달성 → 완료, 포지션 히트맵, 이탈 칸)
+        저장된 집계를 그대로 반환한다 (is_stale이면 refresh_template_funnels 실행 전까지 이전 값).
+        """
+        template = self.get_object()
+        funnel = analytics.get_funnel(template)
+        return Response(AdminTemplateFunnelSerializer(funnel).data)
+
 
 class AdminUserViewSet(viewsets.ModelViewSet):
     """Admin 사용자 관리 ViewSet"""
@@ -73,9 +161,10 @@ class AdminUserViewSet(viewsets.ModelViewSet):
     serializer_class = AdminUserSerializer
     permission_classes = [IsAdminUser]
     pagination_class = AdminPagination
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter]
+    filter_backends = [DjangoFilterBackend, IndexedSearchFilter]
     filterset_fields = ['is_staff', 'is_active']
     search_fields = ['username', 'email']
+    search_index_kind = 'user'
     http_method_names = ['get', 'patch', 'head', 'options']  # 생성/삭제 불가
 
     def _is_falsy(self, value):
@@ -112,11 +201,93 @@ class AdminUserViewSet(viewsets.ModelViewSet):
 
         return super().update(request, *args, **kwargs)
 
+    @action(detail=False, methods=['patch'], url_path='bulk')
+    def bulk(self, request):
+        """사용자 일괄 활성화/비활성화 (단일 UPDATE, 자기 자신 비활성화 불가)"""
+        serializer = AdminUserBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        ids = list(dict.fromkeys(data['ids']))
+
+        errors = {}
+        if data['action'] == 'deactivate' and request.user.id in ids:
+            errors[request.user.id] = '자기 자신을 비활성화할 수 없습니다.'
+
+        queryset = User.objects.filter(id__in=ids).exclude(id__in=errors.keys())
+        updated_ids = set(queryset.values_list('id', flat=True))
+        queryset.update(is_active=data['action'] == 'activate')
+
+        return Response(_bulk_results(ids, updated_ids, errors))
+
+
+STATS_DEFAULT_DAYS = 30
+STATS_MAX_DAYS = 365
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def admin_stats_view(request):
+    """
+    관리자 대시보드 통계 (?days=30, 최대 365)
+    - totals: 전체 누적 (활동 지표는 DailyStat 합계, 관리 대상 테이블은 행 수)
+    - daily: 최근 days일의 일별 가입/보드 생성·완료/리뷰/좋아요/댓글
+    """
+    try:
+        days = int(request.GET.get('days', STATS_DEFAULT_DAYS))
+    except ValueError:
+        days = 0
+    if not 1 <= days <= STATS_MAX_DAYS:
+        return Response(
+            {'error': f'days는 1~{STATS_MAX_DAYS} 사이의 정수여야 합니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    return Response({
+        'totals': {
+            **stats.totals(),
+            # 관리자가 직접 관리하는 작은 테이블은 바로 센다
+            'restaurants': Restaurant.objects.count(),
+            'templates': BingoTemplate.objects.count(),
+            'categories': Category.objects.count(),
+        },
+        'daily': stats.daily(days),
+    })
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def admin_db_stats_view(request):
+    """
+    DB 연결 설정과 연결 풀 통계 (이 요청을 처리한 워커 프로세스 기준)
+    - pool.avg_wait_ms / requests_wait_ms: 풀에서 연결을 기다린 시간
+    - pool.avg_connect_ms / connections_ms: 새 연결 수립 시간 (콜드 워커)
+    """
+    from django.db import connection
+    from config.database import pool_stats
+
+    settings_dict = connection.settings_dict
+    return Response({
+        'vendor': connection.vendor,
+        'pid': os.getpid(),
+        'pool_options': settings_dict['OPTIONS'].get('pool') or None,
+        'conn_max_age': settings_dict['CONN_MAX_AGE'],
+        'health_checks': settings_dict['CONN_HEALTH_CHECKS'],
+        'server_side_cursors': not settings_dict.get('DISABLE_SERVER_SIDE_CURSORS', False),
+        'pool': pool_stats(connection.alias),
+        'replica': settings.READ_REPLICA_ALIAS and {
+            'alias': settings.READ_REPLICA_ALIAS,
+            'pin_seconds': settings.REPLICA_PIN_SECONDS,
+            'pool': pool_stats(settings.READ_REPLICA_ALIAS),
+        },
+    })
+
 
 @api_view(['GET'])
 @permission_classes([IsAdminUser])
 def kakao_search_view(request):
     """카카오 로컬 검색 프록시 API"""
+    import requests
+
     query = request.GET.get('query', '')
     x = request.GET.get('x', '')  # 경도 (longitude)
     y = request.GET.get('y', '')  # 위도 (latitude)
@@ -150,7 +321,7 @@ def kakao_search_view(request):
 
     try:
         response = requests.get(
-            'https://dapi.kakao.com/v2/local/search/keyword.json',
+            f'{settings.KAKAO_LOCAL_HOST}/v2/local/search/keyword.json',
             headers=headers,
             params=params,
             timeout=10
@@ -6,10 +6,10 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from .throttles import AuthRateThrottle
 from rest_framework.response import Response
 from rest_framework.authtoken.models import Token
+from django.conf import settings
 from django.contrib.auth import get_user_model, authenticate
 
 from .models import BingoBoard, Review
-from .services_oauth import KakaoOAuthService
 
 logger = logging.getLogger(__name__)
 
@@ -165,7 +165,7 @@ def kakao_authorize_view(request):
         'response_type': 'code',
         'state': state,
     }
-    kakao_auth_url = f'https://kauth.kakao.com/oauth/authorize?{urlencode(params)}'
+    kakao_auth_url = f'{settings.KAKAO_AUTH_HOST}/oauth/authorize?{urlencode(params)}'
 
     return Response({'url': kakao_auth_url})
 
@@ -175,6 +175,8 @@ def kakao_authorize_view(request):
 def kakao_login_view(request):
     """카카오 OAuth 로그인/회원가입 API"""
     from django.core import signing
+    # 로그인 시에만 필요한 모듈 (requests 포함)은 기동 시 import하지 않는다
+    from .services_oauth import KakaoOAuthService
 
     code = request.data.get('code')
     state = request.data.get('state')
@@ -264,14 +266,10 @@ def kakao_login_view(request):
         )
 
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
-def me_view(request):
-    """현재 사용자 정보 조회"""
+def user_summary(user):
+    """현재 사용자 요약 정보 (me, home 응답 공용)"""
     from .models import UserProfile
 
-    user = request.user
-
     # UserProfile에서 닉네임 가져오기
     display_name = user.username
     try:
@@ -281,13 +279,20 @@ def me_view(request):
     except UserProfile.DoesNotExist:
         pass
 
-    return Response({
+    return {
         'id': user.id,
         'username': user.username,
         'email': user.email,
         'is_staff': user.is_staff,
         'display_name': display_name,
-    })
+    }
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def me_view(request):
+    """현재 사용자 정보 조회"""
+    return Response(user_summary(request.user))
 
 
 @api_view(['GET', 'PATCH'])
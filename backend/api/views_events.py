@@ -0,0 +1,79 @@
+"""
+리뷰 실시간 이벤트 SSE 스트림 (비동기 뷰)
+
+GET /api/reviews/events/?ids=1,2,3
+- like: {review_id, like_count}
+- comment.created: {review_id, comment}
+- comment.deleted: {review_id, comment_ids} (한 트랜잭션에서 지워진 댓글을 리뷰당 한 번에)
+
+연결 하나가 스레드를 점유하지 않도록 ASGI 경로(config.asgi)에서 이벤트 루프로 처리한다.
+"""
+import asyncio
+import json
+
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+
+from .models import Review
+from .realtime import get_broker
+
+MAX_STREAM_REVIEWS = 100
+KEEPALIVE_SECONDS = 15
+# 오래 열린 연결을 주기적으로 끊어 워커 재시작/배포 시 재연결되게 한다 (EventSource 자동 재연결)
+STREAM_MAX_SECONDS = 5 * 60
+RETRY_MILLISECONDS = 3000
+
+
+def _parse_review_ids(value):
+    try:
+        ids = {int(part) for part in value.split(',') if part.strip()}
+    except ValueError:
+        raise ValueError('ids는 쉼표로 구분한 리뷰 ID 목록이어야 합니다.')
+    if not ids:
+        raise ValueError('ids 파라미터가 필요합니다.')
+    if len(ids) > MAX_STREAM_REVIEWS:
+        raise ValueError(f'한 번에 최대 {MAX_STREAM_REVIEWS}개 리뷰까지 구독할 수 있습니다.')
+    return ids
+
+
+def format_event(event):
+    return f'event: {event["type"]}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n'
+
+
+async def _event_stream(review_ids, max_seconds=STREAM_MAX_SECONDS):
+    loop = asyncio.get_running_loop()
+    subscription = get_broker().subscribe(review_ids)
+    try:
+        yield f'retry: {RETRY_MILLISECONDS}\n\n'
+        deadline = loop.time() + max_seconds
+        while (remaining := deadline - loop.time()) > 0:
+            event = await subscription.get(timeout=min(KEEPALIVE_SECONDS, remaining))
+            if event is None:
+                # 프록시 유휴 타임아웃 방지용 주석 라인
+                yield ': keepalive\n\n'
+            else:
+                yield format_event(event)
+    finally:
+        subscription.close()
+
+
+@require_GET
+async def review_events(request):
+    """공개 리뷰의 좋아요/댓글 변경 이벤트 스트림"""
+    try:
+        ids = _parse_review_ids(request.GET.get('ids', ''))
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    public_ids = [
+        pk async for pk in
+        Review.objects.filter(id__in=ids, is_public=True).values_list('id', flat=True)
+    ]
+    if not public_ids:
+        return JsonResponse({'error': '구독할 수 있는 리뷰가 없습니다.'}, status=404)
+
+    response = StreamingHttpResponse(_event_stream(public_ids), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Fly/nginx 등 프록시의 응답 버퍼링 비활성화
+    response['X-Accel-Buffering'] = 'no'
+    return response
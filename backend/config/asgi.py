@@ -3,14 +3,32 @@ ASGI config for config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+비동기 경로(SSE 스트림)만 Django ASGI 핸들러로 처리하고, 나머지 동기 API는
+WSGI 앱을 스레드 풀에서 실행한다. Django ASGI 핸들러는 동기 뷰를 한 스레드에서
+순서대로 실행하므로 기존 gthread 워커와 같은 동시성을 유지하기 위해서다.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
 """
 
 import os
 
+from a2wsgi import WSGIMiddleware
 from django.core.asgi import get_asgi_application
+from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-application = get_asgi_application()
+ASYNC_PATH_PREFIXES = ('/api/reviews/events/',)
+
+django_asgi_app = get_asgi_application()
+django_wsgi_app = WSGIMiddleware(
+    get_wsgi_application(), workers=int(os.environ.get('WSGI_THREADS', 2))
+)
+
+
+async def application(scope, receive, send):
+    if scope['type'] == 'http' and not scope['path'].startswith(ASYNC_PATH_PREFIXES):
+        await django_wsgi_app(scope, receive, send)
+    else:
+        await django_asgi_app(scope, receive, send)
@@ -0,0 +1,113 @@
+"""
+DATABASE_URL → DATABASES 설정 (연결 풀링 / 외부 풀러 대응)
+
+DB_POOLER (기본 auto: 6543 포트면 transaction, 아니면 none)
+- none: 직접 연결. psycopg 3 네이티브 풀을 워커 프로세스마다 하나 두고
+  크기는 워커 스레드 수(WSGI_THREADS)에 맞춘다. 풀에서 꺼낼 때 헬스 체크한다.
+- transaction: PgBouncer/Supavisor 트랜잭션 풀러 (Supabase 6543 포트).
+  풀링은 풀러가 하므로 영속 연결 + 헬스 체크만 두고, 트랜잭션마다 서버 세션이
+  바뀌어도 안전하도록 서버 사이드 커서와 prepared statement를 끈다.
+- session: 세션 풀러. 영속 연결 + 헬스 체크.
+"""
+from urllib.parse import urlparse
+
+from django.core.exceptions import ImproperlyConfigured
+
+POOLER_MODES = ('none', 'transaction', 'session')
+TRANSACTION_POOLER_PORTS = (6543,)
+DEFAULT_CACHE_TABLE = 'django_cache'
+
+
+def pooler_mode(url, env):
+    mode = env.get('DB_POOLER', 'auto')
+    if mode == 'auto':
+        return 'transaction' if urlparse(url).port in TRANSACTION_POOLER_PORTS else 'none'
+    if mode not in POOLER_MODES:
+        raise ImproperlyConfigured(f'DB_POOLER는 auto, {", ".join(POOLER_MODES)} 중 하나여야 합니다.')
+    return mode
+
+
+def pool_options(env):
+    """
+    워커 프로세스 하나의 풀 크기
+    동기 API 스레드(WSGI_THREADS) + SSE 비동기 뷰의 ORM 스레드 1 + 시그널 발행 등 여유 1
+    """
+    threads = int(env.get('WSGI_THREADS', 2))
+    return {
+        'min_size': int(env.get('DB_POOL_MIN_SIZE', 1)),
+        'max_size': int(env.get('DB_POOL_MAX_SIZE', threads + 2)),
+        # 풀이 가득 찼을 때 연결을 기다리는 최대 시간 (초과 시 PoolTimeout)
+        'timeout': float(env.get('DB_POOL_TIMEOUT', 10)),
+        # Supabase가 유휴 연결을 끊기 전에 먼저 정리
+        'max_idle': float(env.get('DB_POOL_MAX_IDLE', 300)),
+        'max_lifetime': float(env.get('DB_POOL_MAX_LIFETIME', 1800)),
+    }
+
+
+def cache_table(env, uses_replica):
+    """
+    공유 DB 캐시 테이블 이름 (None이면 워커 프로세스별 메모리 캐시)
+    복제본을 쓰면 쓰기 후 기본 DB 고정(replica_pin)을 모든 워커/머신이 봐야 하므로 기본으로 켠다
+    """
+    return env.get('CACHE_TABLE') or (DEFAULT_CACHE_TABLE if uses_replica else None)
+
+
+def database_config(url, env):
+    """DB URL과 환경 변수로 DATABASES 항목 생성 (default, replica)"""
+    import dj_database_url
+
+    mode = pooler_mode(url, env)
+    config = dj_database_url.parse(
+        url, conn_max_age=int(env.get('DB_CONN_MAX_AGE', 600)), conn_health_checks=True
+    )
+    if not config['ENGINE'].endswith('postgresql'):
+        # SQLite URL (로컬 복제본 확인용 등)은 풀링 설정 없이 그대로
+        return config
+    if mode == 'none' and env.get('DB_POOL', 'true').lower() == 'true':
+        # 네이티브 풀은 영속 연결(CONN_MAX_AGE)과 함께 쓸 수 없다
+        config['CONN_MAX_AGE'] = 0
+        config.setdefault('OPTIONS', {})['pool'] = pool_options(env)
+    elif mode == 'transaction':
+        config['DISABLE_SERVER_SIDE_CURSORS'] = True
+        config.setdefault('OPTIONS', {})['prepare_threshold'] = None
+    return config
+
+
+def listen_params(url):
+    """
+    LISTEN/NOTIFY 전용 직접 연결 파라미터 (트랜잭션 풀러는 LISTEN을 유지하지 못한다)
+    url이 없으면 None (기본 DB 연결 설정 사용)
+    """
+    if not url:
+        return None
+    parsed = urlparse(url)
+    params = {
+        'dbname': parsed.path.lstrip('/'),
+        'user': parsed.username,
+        'password': parsed.password,
+        'host': parsed.hostname,
+        'port': parsed.port,
+    }
+    return {key: value for key, value in params.items() if value}
+
+
+def pool_stats(alias='default'):
+    """
+    현재 프로세스(워커)의 풀 통계, 풀을 쓰지 않거나 아직 열리지 않았으면 None
+    requests_wait_ms: 풀에서 연결을 기다린 누적 시간, connections_ms: 새 연결 수립 누적 시간
+    """
+    from django.db import connections
+
+    connection = connections[alias]
+    if alias not in getattr(connection, '_connection_pools', {}):
+        return None
+    stats = connection.pool.get_stats()
+    requests_num = stats.get('requests_num', 0)
+    connections_num = stats.get('connections_num', 0)
+    return {
+        **stats,
+        'avg_wait_ms': round(stats.get('requests_wait_ms', 0) / requests_num, 2) if requests_num else 0,
+        'avg_connect_ms': (
+            round(stats.get('connections_ms', 0) / connections_num, 2) if connections_num else 0
+        ),
+    }
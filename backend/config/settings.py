@@ -14,14 +14,22 @@ import os
 import re
 from pathlib import Path
 
+from corsheaders.defaults import default_headers
+
+from config.database import cache_table, database_config, listen_params
+
 # Sentry error monitoring
 SENTRY_DSN = os.environ.get('SENTRY_DSN')
 if SENTRY_DSN:
     import sentry_sdk
+    from sentry_sdk.integrations.django import DjangoIntegration
     sentry_sdk.init(
         dsn=SENTRY_DSN,
         traces_sample_rate=0.1,
         send_default_pii=False,
+        # 설치된 라이브러리별 통합을 모두 import하지 않고 Django 통합만 사용 (기동 시간/메모리)
+        integrations=[DjangoIntegration()],
+        auto_enabling_integrations=False,
     )
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -76,6 +84,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'api.replica.PrimaryPinMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -104,10 +113,9 @@ WSGI_APPLICATION = 'config.wsgi.application'
 DATABASE_URL = os.environ.get('DATABASE_URL')
 
 if DATABASE_URL:
-    # Production: Use PostgreSQL via DATABASE_URL
-    import dj_database_url
+    # Production: Use PostgreSQL via DATABASE_URL (풀링/풀러 모드는 config/database.py)
     DATABASES = {
-        'default': dj_database_url.config(default=DATABASE_URL, conn_max_age=600)
+        'default': database_config(DATABASE_URL, os.environ)
     }
 else:
     # Development: Use SQLite
@@ -115,10 +123,48 @@ else:
         'default': {
             'ENGINE': 'django.db.backends.sqlite3',
             'NAME': BASE_DIR / 'db.sqlite3',
+            # 쓰기 트랜잭션은 시작할 때 쓰기 잠금을 잡고, 다른 쓰기가 끝날 때까지 최대 20초 기다린다
+            # (DEFERRED면 읽기 잠금에서 쓰기 잠금으로 올릴 때 기다리지 않고 'database is locked'로 실패)
+            'OPTIONS': {'transaction_mode': 'IMMEDIATE', 'timeout': 20},
+            # 스레드끼리 쓰기를 기다리도록 테스트 DB도 파일로 (메모리 DB는 공유 캐시라 바로 'table is locked')
+            'TEST': {'NAME': BASE_DIR / 'test_db.sqlite3'},
         }
     }
 
 
+# 읽기 전용 복제본 (선택): 공개 조회 API만 복제본을 쓴다 (api/replica.py)
+# 로컬에서는 SQLite 파일 두 개로 확인: DATABASE_REPLICA_URL=sqlite:///db_replica.sqlite3
+DATABASE_REPLICA_URL = os.environ.get('DATABASE_REPLICA_URL')
+READ_REPLICA_ALIAS = 'replica' if DATABASE_REPLICA_URL else None
+
+if READ_REPLICA_ALIAS:
+    DATABASES[READ_REPLICA_ALIAS] = {
+        **database_config(DATABASE_REPLICA_URL, os.environ),
+        # 테스트에서는 별도 DB를 만들지 않고 기본 테스트 DB를 가리킨다
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['api.replica.ReplicaRouter']
+
+# 쓰기 후 이 시간(초) 동안 해당 사용자의 조회를 기본 DB로 고정 (복제 지연 대비, 로그인 사용자는 캐시에 기록)
+REPLICA_PIN_SECONDS = int(os.environ.get('REPLICA_PIN_SECONDS', 10))
+
+# 공유 캐시: 기본은 워커 프로세스별 메모리 캐시이고, 복제본을 쓰거나 CACHE_TABLE을 주면
+# 워커/머신이 복제본 고정 같은 값을 공유하도록 DB 캐시 테이블을 쓴다 (기동 시 생성, config/startup.py)
+CACHE_TABLE = cache_table(os.environ, bool(READ_REPLICA_ALIAS))
+if CACHE_TABLE:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': CACHE_TABLE,
+        }
+    }
+
+
+# 실시간 이벤트 LISTEN 전용 직접 연결 (DATABASE_URL이 트랜잭션 풀러일 때 필요)
+REALTIME_LISTEN_PARAMS = listen_params(os.environ.get('DATABASE_LISTEN_URL'))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -166,7 +212,8 @@ CLOUDINARY_URL = os.environ.get('CLOUDINARY_URL')
 
 if CLOUDINARY_URL:
     # 프로덕션: Cloudinary 사용
-    INSTALLED_APPS += ['cloudinary_storage', 'cloudinary']
+    # 미디어 스토리지만 쓰므로 앱(템플릿 태그/정적 파일 명령)은 등록하지 않는다.
+    # 스토리지 백엔드와 cloudinary SDK는 default_storage에 처음 접근할 때 import된다.
 
     # Django 5+ STORAGES 설정 (DEFAULT_FILE_STORAGE 대체)
     STORAGES = {
@@ -207,6 +254,12 @@ def whitenoise_add_headers(headers, path, url):
 
 WHITENOISE_ADD_HEADERS_FUNCTION = whitenoise_add_headers
 
+# 카카오 API 호스트 (OAuth 토큰 / 사용자 정보 / 로컬 검색)
+# 부하 테스트에서는 loadtest 명령이 로컬 가짜 서버(api/fake_kakao.py)로 바꿔 띄운다
+KAKAO_AUTH_HOST = os.environ.get('KAKAO_AUTH_HOST', 'https://kauth.kakao.com')
+KAKAO_API_HOST = os.environ.get('KAKAO_API_HOST', 'https://kapi.kakao.com')
+KAKAO_LOCAL_HOST = os.environ.get('KAKAO_LOCAL_HOST', 'https://dapi.kakao.com')
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/6.0/ref/settings/#default-auto-field
 
@@ -222,6 +275,8 @@ CORS_ALLOWED_ORIGINS = [
     if origin.strip()
 ]
 CORS_ALLOW_CREDENTIALS = True
+# /api/home/ 섹션별 ETag 조건부 요청
+CORS_ALLOW_HEADERS = (*default_headers, 'if-none-match')
 
 # Django REST Framework
 REST_FRAMEWORK = {
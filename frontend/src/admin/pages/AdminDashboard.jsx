@@ -1,6 +1,17 @@
 import { useState, useEffect } from 'react';
 import { Link } from 'react-router-dom';
-import { adminRestaurantsApi, adminTemplatesApi, adminCategoriesApi } from '../api/adminEndpoints';
+import { adminStatsApi } from '../api/adminEndpoints';
+
+const RECENT_DAYS = 14;
+
+const ACTIVITY_METRICS = [
+  { key: 'signups', label: '가입' },
+  { key: 'boards_created', label: '보드 생성' },
+  { key: 'boards_completed', label: '보드 완료' },
+  { key: 'reviews', label: '리뷰' },
+  { key: 'likes', label: '좋아요' },
+  { key: 'comments', label: '댓글' },
+];
 
 export default function AdminDashboard() {
   const [stats, setStats] = useState({
@@ -8,22 +19,16 @@ export default function AdminDashboard() {
     templates: 0,
     categories: 0,
   });
+  const [daily, setDaily] = useState([]);
   const [isLoading, setIsLoading] = useState(true);
 
   useEffect(() => {
     const fetchStats = async () => {
       try {
-        const [restaurantsRes, templatesRes, categoriesRes] = await Promise.all([
-          adminRestaurantsApi.getAll({ page_size: 1 }),
-          adminTemplatesApi.getAll({ page_size: 1 }),
-          adminCategoriesApi.getAll(),
-        ]);
-
-        setStats({
-          restaurants: restaurantsRes.data.count || 0,
-          templates: templatesRes.data.count || 0,
-          categories: categoriesRes.data.length || 0,
-        });
+        // 일별 집계(DailyStat) 기반 단일 요청
+        const response = await adminStatsApi.get(RECENT_DAYS);
+        setStats(response.data.totals);
+        setDaily([...response.data.daily].reverse());
       } catch (error) {
         console.error('통계 로드 실패:', error);
       } finally {
@@ -99,6 +104,44 @@ export default function AdminDashboard() {
             ))}
           </div>
 
+          {/* 활동 누적 */}
+          <div className="bg-white rounded-lg shadow-sm p-6 mb-8">
+            <h2 className="text-lg font-semibold text-gray-800 mb-4">전체 활동</h2>
+            <div className="grid grid-cols-2 md:grid-cols-6 gap-4">
+              {ACTIVITY_METRICS.map(({ key, label }) => (
+                <div key={key}>
+                  <p className="text-sm text-gray-500">{label}</p>
+                  <p className="text-xl font-bold text-gray-800">{stats[key] ?? 0}</p>
+                </div>
+              ))}
+            </div>
+          </div>
+
+          {/* 최근 일별 활동 */}
+          <div className="bg-white rounded-lg shadow-sm p-6 mb-8 overflow-x-auto">
+            <h2 className="text-lg font-semibold text-gray-800 mb-4">최근 {RECENT_DAYS}일</h2>
+            <table className="min-w-full text-sm">
+              <thead>
+                <tr className="text-left text-gray-500 border-b">
+                  <th className="py-2 pr-4 font-medium">날짜</th>
+                  {ACTIVITY_METRICS.map(({ key, label }) => (
+                    <th key={key} className="py-2 pr-4 font-medium text-right">{label}</th>
+                  ))}
+                </tr>
+              </thead>
+              <tbody>
+                {daily.map((row) => (
+                  <tr key={row.date} className="border-b last:border-0">
+                    <td className="py-2 pr-4 text-gray-700">{row.date}</td>
+                    {ACTIVITY_METRICS.map(({ key }) => (
+                      <td key={key} className="py-2 pr-4 text-right text-gray-800">{row[key]}</td>
+                    ))}
+                  </tr>
+                ))}
+              </tbody>
+            </table>
+          </div>
+
           {/* 빠른 액션 */}
           <div className="bg-white rounded-lg shadow-sm p-6">
             <h2 className="text-lg font-semibold text-gray-800 mb-4">빠른 액션</h2>
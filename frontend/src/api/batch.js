@@ -0,0 +1,51 @@
+// 배치 엔드포인트의 최대 ID 수 (backend api.views.MAX_BATCH_IDS)
+export const MAX_BATCH_SIZE = 50;
+
+/**
+ * 같은 틱에 요청된 단건 조회를 모아 배치 엔드포인트 한 번으로 보낸다
+ * (예: 여러 보드 쿼리가 동시에 무효화되어 다시 조회될 때)
+ * @param {(ids: Array<string>) => Promise} fetchMany - { data: { results, missing } } 응답
+ * @returns {{ load: (id: number|string) => Promise<object> }}
+ */
+export function createBatchLoader(fetchMany, maxBatchSize = MAX_BATCH_SIZE) {
+  let queue = [];
+
+  const dispatch = async (batch) => {
+    const ids = [...new Set(batch.map((request) => request.id))];
+    try {
+      const response = await fetchMany(ids);
+      const byId = new Map(response.data.results.map((item) => [String(item.id), item]));
+      batch.forEach(({ id, resolve, reject }) => {
+        if (byId.has(id)) {
+          resolve(byId.get(id));
+        } else {
+          // 단건 조회의 404와 같은 형태로 실패시킨다
+          const error = new Error('Not found');
+          error.response = { status: 404 };
+          reject(error);
+        }
+      });
+    } catch (error) {
+      batch.forEach(({ reject }) => reject(error));
+    }
+  };
+
+  const flush = () => {
+    const pending = queue;
+    queue = [];
+    for (let i = 0; i < pending.length; i += maxBatchSize) {
+      dispatch(pending.slice(i, i + maxBatchSize));
+    }
+  };
+
+  return {
+    load(id) {
+      return new Promise((resolve, reject) => {
+        queue.push({ id: String(id), resolve, reject });
+        if (queue.length === 1) {
+          queueMicrotask(flush);
+        }
+      });
+    },
+  };
+}
@@ -0,0 +1,37 @@
+import { describe, it, expect, vi } from 'vitest';
+import { createBatchLoader } from './batch';
+
+describe('createBatchLoader', () => {
+  it('combines loads from the same tick into one request', async () => {
+    const fetchMany = vi.fn().mockResolvedValue({
+      data: { results: [{ id: 1 }, { id: 2 }], missing: [] },
+    });
+    const loader = createBatchLoader(fetchMany);
+
+    const [a, b, c] = await Promise.all([loader.load(1), loader.load('2'), loader.load(1)]);
+
+    expect(fetchMany).toHaveBeenCalledTimes(1);
+    expect(fetchMany).toHaveBeenCalledWith(['1', '2']);
+    expect(a).toEqual({ id: 1 });
+    expect(b).toEqual({ id: 2 });
+    expect(c).toEqual({ id: 1 });
+  });
+
+  it('rejects missing ids with a 404-shaped error', async () => {
+    const fetchMany = vi.fn().mockResolvedValue({ data: { results: [], missing: [3] } });
+    const loader = createBatchLoader(fetchMany);
+
+    await expect(loader.load(3)).rejects.toMatchObject({ response: { status: 404 } });
+  });
+
+  it('splits batches larger than the limit', async () => {
+    const fetchMany = vi.fn((ids) =>
+      Promise.resolve({ data: { results: ids.map((id) => ({ id: Number(id) })), missing: [] } })
+    );
+    const loader = createBatchLoader(fetchMany, 2);
+
+    await Promise.all([1, 2, 3].map((id) => loader.load(id)));
+
+    expect(fetchMany.mock.calls).toEqual([[['1', '2']], [['3']]]);
+  });
+});
@@ -1,4 +1,14 @@
-import apiClient from './client';
+import axios from 'axios';
+import apiClient, { API_BASE_URL } from './client';
+
+// 첫 화면 묶음 API (me, boards, templates, categories, feed)
+export const homeApi = {
+  // etags: 이전 응답의 섹션별 ETag 목록 (바뀌지 않은 섹션은 응답에서 빠진다)
+  get: (etags = []) =>
+    apiClient.get('/home/', {
+      headers: etags.length ? { 'If-None-Match': etags.join(', ') } : undefined,
+    }),
+};
 
 // 카테고리 API
 export const categoriesApi = {
@@ -12,12 +22,31 @@ export const templatesApi = {
   getById: (id) => apiClient.get(`/templates/${id}/`),
 };
 
+// 식당 API
+export const restaurantsApi = {
+  // params: { lat, lng, radius } 또는 { bbox: 'south,west,north,east' }
+  nearby: (params) => apiClient.get('/restaurants/nearby/', { params }),
+};
+
+// 보드 목록 화면에 필요한 필드 (셀/리뷰 직렬화와 조인을 건너뛴다)
+const BOARD_LIST_FIELDS = [
+  'id', 'template', 'template_title', 'target_line_count', 'is_completed',
+  'created_at', 'completed_at', 'completed_lines', 'progress',
+].join(',');
+
 // 빙고 보드 API
 export const boardsApi = {
-  getAll: () => apiClient.get('/boards/'),
+  getAll: () => apiClient.get('/boards/', { params: { fields: BOARD_LIST_FIELDS } }),
   getById: (id) => apiClient.get(`/boards/${id}/`),
+  // 응답: { results, missing } (ids 최대 50개, 본인 보드만)
+  getMany: (ids) => apiClient.get('/boards/batch/', { params: { ids: ids.join(',') } }),
   create: (data) => apiClient.post('/boards/', data),
   delete: (id) => apiClient.delete(`/boards/${id}/`),
+  // params: { lat, lng, prioritize: 'lines' }
+  getRoute: (id, params) => apiClient.get(`/boards/${id}/route/`, { params }),
+  // params: { lat, lng, limit } (모두 선택)
+  getRecommendations: (id, params) =>
+    apiClient.get(`/boards/${id}/recommendations/`, { params }),
 };
 
 // 리뷰 API
@@ -27,15 +56,42 @@ export const reviewsApi = {
       headers: { 'Content-Type': 'multipart/form-data' },
     }),
   getById: (id) => apiClient.get(`/reviews/${id}/`),
+  // 응답: { results, missing } (ids 최대 50개, 본인 리뷰만)
+  getMany: (ids) => apiClient.get('/reviews/batch/', { params: { ids: ids.join(',') } }),
   getFeed: (page = 1) => apiClient.get('/reviews/feed/', { params: { page } }),
   toggleLike: (reviewId) => apiClient.post(`/reviews/${reviewId}/like/`),
-  getComments: (reviewId) => apiClient.get(`/reviews/${reviewId}/comments/`),
+  // 커서 페이지네이션 응답: { next, previous, results }
+  getComments: (reviewId, cursor) =>
+    apiClient.get(`/reviews/${reviewId}/comments/`, { params: cursor ? { cursor } : undefined }),
   createComment: (reviewId, content) =>
     apiClient.post(`/reviews/${reviewId}/comments/`, { content }),
   deleteComment: (reviewId, commentId) =>
     apiClient.delete(`/reviews/${reviewId}/comments/${commentId}/`),
+  // 좋아요/댓글 변경 SSE 스트림 URL (EventSource용, ids: 쉼표로 구분한 리뷰 ID)
+  eventsUrl: (ids) => `${API_BASE_URL}/reviews/events/?ids=${ids}`,
+};
+
+// 이미지 직접 업로드 API
+export const uploadsApi = {
+  // 응답: { upload_url, method, file_field, fields, image_ref, expires_in }
+  createReviewImageTarget: () => apiClient.post('/uploads/review-image/'),
 };
 
+/**
+ * 리뷰 이미지를 스토리지에 직접 업로드하고 리뷰 생성에 쓸 image_ref를 반환
+ * (업로드 대상이 외부 스토리지일 수 있으므로 apiClient의 인증 헤더 없이 전송)
+ * @param {File} file - 이미지 파일
+ * @returns {Promise<string>} image_ref
+ */
+export async function uploadReviewImage(file) {
+  const { data: target } = await uploadsApi.createReviewImageTarget();
+  const body = new FormData();
+  Object.entries(target.fields).forEach(([key, value]) => body.append(key, value));
+  body.append(target.file_field, file);
+  await axios.post(target.upload_url, body);
+  return target.image_ref;
+}
+
 // 리더보드 API
 export const leaderboardApi = {
   get: () => apiClient.get('/leaderboard/'),
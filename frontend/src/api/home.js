@@ -0,0 +1,44 @@
+import { homeApi } from './endpoints';
+
+const HOME_CACHE_KEY = 'homeCache';
+
+function readHomeCache() {
+  try {
+    return JSON.parse(localStorage.getItem(HOME_CACHE_KEY)) || {};
+  } catch {
+    return {};
+  }
+}
+
+// 로그아웃 시 사용자별 섹션(me, boards)이 남지 않도록 삭제
+export function clearHomeCache() {
+  localStorage.removeItem(HOME_CACHE_KEY);
+}
+
+/**
+ * 첫 화면 데이터를 /home/ 한 번으로 받아 React Query 캐시를 채운다
+ * - 이전에 받은 섹션 ETag를 보내고, 바뀌지 않은 섹션은 저장해 둔 값을 쓴다
+ * @returns {Promise<object>} { me, boards, templates, categories, feed }
+ */
+export async function loadHome(queryClient) {
+  const cached = readHomeCache();
+  const response = await homeApi.get(Object.values(cached.etags || {}));
+  const { etags, not_modified: notModified, ...sections } = response.data;
+  notModified.forEach((name) => {
+    sections[name] = cached.sections?.[name] ?? null;
+  });
+
+  try {
+    localStorage.setItem(HOME_CACHE_KEY, JSON.stringify({ etags, sections }));
+  } catch {
+    // 저장 공간 부족 시 다음 요청에서 전체를 다시 받는다
+  }
+
+  if (sections.boards) {
+    queryClient.setQueryData(['boards'], sections.boards);
+  }
+  queryClient.setQueryData(['templates'], sections.templates);
+  queryClient.setQueryData(['categories'], sections.categories);
+  queryClient.setQueryData(['reviewFeed'], { pages: [sections.feed], pageParams: [1] });
+  return sections;
+}
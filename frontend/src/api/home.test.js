@@ -0,0 +1,75 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { QueryClient } from '@tanstack/react-query';
+
+vi.mock('./endpoints', () => ({
+  homeApi: { get: vi.fn() },
+}));
+
+import { homeApi } from './endpoints';
+import { loadHome, clearHomeCache } from './home';
+
+const page = (results) => ({ count: results.length, next: null, previous: null, results });
+
+describe('loadHome', () => {
+  let queryClient;
+
+  beforeEach(() => {
+    queryClient = new QueryClient();
+    localStorage.clear();
+    vi.clearAllMocks();
+  });
+
+  it('seeds query caches from a single response', async () => {
+    homeApi.get.mockResolvedValue({
+      data: {
+        me: { id: 1, username: 'user1' },
+        boards: page([{ id: 10 }]),
+        templates: page([{ id: 20 }]),
+        categories: page([{ id: 30 }]),
+        feed: page([{ id: 40 }]),
+        etags: { me: 'W/"me-1"', templates: 'W/"templates-1"' },
+        not_modified: [],
+      },
+    });
+
+    const sections = await loadHome(queryClient);
+
+    expect(homeApi.get).toHaveBeenCalledWith([]);
+    expect(sections.me.username).toBe('user1');
+    expect(queryClient.getQueryData(['boards']).results).toEqual([{ id: 10 }]);
+    expect(queryClient.getQueryData(['templates']).results).toEqual([{ id: 20 }]);
+    expect(queryClient.getQueryData(['reviewFeed'])).toEqual({
+      pages: [page([{ id: 40 }])],
+      pageParams: [1],
+    });
+  });
+
+  it('sends stored etags and reuses unchanged sections', async () => {
+    localStorage.setItem('homeCache', JSON.stringify({
+      etags: { templates: 'W/"templates-1"' },
+      sections: { templates: page([{ id: 20 }]) },
+    }));
+    homeApi.get.mockResolvedValue({
+      data: {
+        me: null,
+        boards: null,
+        categories: page([]),
+        feed: page([]),
+        etags: { templates: 'W/"templates-1"' },
+        not_modified: ['templates'],
+      },
+    });
+
+    await loadHome(queryClient);
+
+    expect(homeApi.get).toHaveBeenCalledWith(['W/"templates-1"']);
+    expect(queryClient.getQueryData(['templates']).results).toEqual([{ id: 20 }]);
+    expect(queryClient.getQueryData(['boards'])).toBeUndefined();
+  });
+
+  it('clearHomeCache removes stored sections', () => {
+    localStorage.setItem('homeCache', '{}');
+    clearHomeCache();
+    expect(localStorage.getItem('homeCache')).toBeNull();
+  });
+});
@@ -2,13 +2,22 @@ import { useMemo } from 'react';
 import BingoCell from './BingoCell';
 import { getCompletedLines, getHighlightedPositions } from './bingoUtils';
 
+// Tailwind가 클래스를 추출할 수 있도록 크기별 클래스를 그대로 나열
+const GRID_COLS = {
+  3: 'grid-cols-3',
+  4: 'grid-cols-4',
+  5: 'grid-cols-5',
+  7: 'grid-cols-7',
+};
+
 /**
  * 빙고 그리드 컴포넌트
  * @param {Object} props
- * @param {Array} props.cells - 25개의 셀 데이터
+ * @param {Array} props.cells - size×size개의 셀 데이터
+ * @param {number} props.size - 보드 한 변의 칸 수 (기본 5)
  * @param {function} props.onCellClick - 셀 클릭 핸들러
  */
-export default function BingoGrid({ cells, onCellClick }) {
+export default function BingoGrid({ cells, size = 5, onCellClick }) {
   // 위치순으로 정렬된 셀
   const sortedCells = useMemo(() => {
     return [...cells].sort((a, b) => a.position - b.position);
@@ -16,8 +25,8 @@ export default function BingoGrid({ cells, onCellClick }) {
 
   // 완료된 라인 계산
   const completedLines = useMemo(() => {
-    return getCompletedLines(cells);
-  }, [cells]);
+    return getCompletedLines(cells, size);
+  }, [cells, size]);
 
   // 하이라이트 할 위치
   const highlightedPositions = useMemo(() => {
@@ -26,7 +35,7 @@ export default function BingoGrid({ cells, onCellClick }) {
 
   return (
     <div className="bg-white p-2 sm:p-4 rounded-2xl shadow-lg">
-      <div className="grid grid-cols-5 gap-2 sm:gap-3">
+      <div className={`grid ${GRID_COLS[size] || GRID_COLS[5]} gap-2 sm:gap-3`}>
         {sortedCells.map((cell) => (
           <BingoCell
             key={cell.position}
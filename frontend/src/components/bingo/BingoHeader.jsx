@@ -6,6 +6,7 @@
  * @param {number} props.completedLines - 완료된 라인 수
  * @param {number} props.targetLines - 목표 라인 수
  * @param {number} props.activatedCells - 활성화된 셀 수
+ * @param {number} props.totalCells - 전체 셀 수 (기본 25)
  * @param {boolean} props.isCompleted - 목표 달성 여부
  */
 export default function BingoHeader({
@@ -13,9 +14,10 @@ export default function BingoHeader({
   completedLines,
   targetLines,
   activatedCells,
+  totalCells = 25,
   isCompleted,
 }) {
-  const progress = Math.round((activatedCells / 25) * 100);
+  const progress = Math.round((activatedCells / totalCells) * 100);
   const lineProgress = Math.min(Math.round((completedLines / targetLines) * 100), 100);
 
   return (
@@ -45,7 +47,7 @@ export default function BingoHeader({
           <p className="text-xs sm:text-sm text-gray-500">목표</p>
         </div>
         <div className="text-center">
-          <p className="text-2xl sm:text-3xl font-bold text-brand-charcoal">{activatedCells}/25</p>
+          <p className="text-2xl sm:text-3xl font-bold text-brand-charcoal">{activatedCells}/{totalCells}</p>
           <p className="text-xs sm:text-sm text-gray-500">방문 완료</p>
         </div>
       </div>
@@ -18,6 +18,9 @@ export default function ReviewSocialSection({ review, boardId }) {
   const {
     data: comments,
     isLoading: commentsLoading,
+    hasNextPage: hasMoreComments,
+    fetchNextPage: fetchMoreComments,
+    isFetchingNextPage: fetchingMoreComments,
   } = useReviewComments(showComments ? review.id : null);
 
   const handleLike = () => {
@@ -94,6 +97,17 @@ export default function ReviewSocialSection({ review, boardId }) {
                   </div>
                 </li>
               ))}
+              {hasMoreComments && (
+                <li>
+                  <button
+                    onClick={() => fetchMoreComments()}
+                    disabled={fetchingMoreComments}
+                    className="text-xs text-gray-500 hover:text-gray-700 disabled:opacity-50"
+                  >
+                    {fetchingMoreComments ? '불러오는 중...' : '댓글 더보기'}
+                  </button>
+                </li>
+              )}
             </ul>
           ) : (
             <p className="text-sm text-gray-400">아직 댓글이 없습니다.</p>
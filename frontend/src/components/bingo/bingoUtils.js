@@ -1,33 +1,33 @@
-// 12개의 빙고 라인 (가로 5, 세로 5, 대각선 2)
-export const WINNING_LINES = [
-  // 가로
-  [0, 1, 2, 3, 4],
-  [5, 6, 7, 8, 9],
-  [10, 11, 12, 13, 14],
-  [15, 16, 17, 18, 19],
-  [20, 21, 22, 23, 24],
-  // 세로
-  [0, 5, 10, 15, 20],
-  [1, 6, 11, 16, 21],
-  [2, 7, 12, 17, 22],
-  [3, 8, 13, 18, 23],
-  [4, 9, 14, 19, 24],
-  // 대각선
-  [0, 6, 12, 18, 24],
-  [4, 8, 12, 16, 20],
-];
+/**
+ * N×N 보드의 빙고 라인 생성 (가로 N, 세로 N, 대각선 2)
+ * @param {number} size - 보드 한 변의 칸 수
+ * @returns {Array} 라인별 포지션 배열
+ */
+export function getWinningLines(size = 5) {
+  const range = [...Array(size).keys()];
+  return [
+    ...range.map((r) => range.map((c) => r * size + c)),
+    ...range.map((c) => range.map((r) => r * size + c)),
+    range.map((i) => i * (size + 1)),
+    range.map((i) => (i + 1) * (size - 1)),
+  ];
+}
+
+// 기본 5×5 보드의 12개 라인 (가로 5, 세로 5, 대각선 2)
+export const WINNING_LINES = getWinningLines(5);
 
 /**
  * 완료된 빙고 라인 계산
  * @param {Array} cells - 셀 배열
+ * @param {number} size - 보드 한 변의 칸 수
  * @returns {Array} 완료된 라인의 배열
  */
-export function getCompletedLines(cells) {
+export function getCompletedLines(cells, size = 5) {
   const activatedPositions = new Set(
     cells.filter((cell) => cell.is_activated).map((cell) => cell.position)
   );
 
-  return WINNING_LINES.filter((line) =>
+  return getWinningLines(size).filter((line) =>
     line.every((pos) => activatedPositions.has(pos))
   );
 }
@@ -1,5 +1,10 @@
 import { describe, it, expect } from 'vitest';
-import { WINNING_LINES, getCompletedLines, getHighlightedPositions } from './bingoUtils';
+import {
+  WINNING_LINES,
+  getWinningLines,
+  getCompletedLines,
+  getHighlightedPositions,
+} from './bingoUtils';
 
 describe('bingoUtils', () => {
   describe('WINNING_LINES', () => {
@@ -26,6 +31,21 @@ describe('bingoUtils', () => {
     });
   });
 
+  describe('getWinningLines', () => {
+    it('generates 2N + 2 lines for N×N boards', () => {
+      [3, 4, 5, 7].forEach((size) => {
+        const lines = getWinningLines(size);
+        expect(lines).toHaveLength(size * 2 + 2);
+        lines.forEach((line) => expect(line).toHaveLength(size));
+      });
+    });
+
+    it('generates 3×3 diagonals', () => {
+      const lines = getWinningLines(3);
+      expect(lines.slice(6)).toEqual([[0, 4, 8], [2, 4, 6]]);
+    });
+  });
+
   describe('getCompletedLines', () => {
     it('returns empty array when no cells are activated', () => {
       const cells = Array(25).fill(null).map((_, i) => ({
@@ -2,6 +2,7 @@ import { useState } from 'react';
 import ReviewForm from '../forms/ReviewForm';
 import KakaoMap from '../map/KakaoMap';
 import ReviewSocialSection from '../bingo/ReviewSocialSection';
+import { useReviewEvents } from '../../hooks/useReviewSocial';
 
 /**
  * 셀 상세 모달 컴포넌트
@@ -20,6 +21,7 @@ export default function CellDetailModal({
   isSubmitting = false,
 }) {
   const [showReviewForm, setShowReviewForm] = useState(false);
+  useReviewEvents(cell.review?.is_public ? [cell.review.id] : [], boardId);
 
   const handleBackdropClick = (e) => {
     if (e.target === e.currentTarget) {
@@ -1,21 +1,30 @@
 import { useState, useEffect, useCallback, useRef } from 'react';
+import { useQueryClient } from '@tanstack/react-query';
 import { authApi } from '../api/endpoints';
+import { loadHome, clearHomeCache } from '../api/home';
 import { AuthContext } from './authContext';
 
 export function AuthProvider({ children }) {
   const [user, setUser] = useState(null);
   const [isLoading, setIsLoading] = useState(true);
   const initializedRef = useRef(false);
+  const queryClient = useQueryClient();
 
   useEffect(() => {
     if (initializedRef.current) return;
     initializedRef.current = true;
 
+    // 사용자 정보와 첫 화면 목록(보드/템플릿/피드)을 /home/ 한 번으로 받는다
     const token = localStorage.getItem('authToken');
+    const home = loadHome(queryClient);
     if (token) {
-      authApi.me()
-        .then((response) => {
-          setUser(response.data);
+      home
+        .then((sections) => {
+          if (sections.me) {
+            setUser(sections.me);
+          } else {
+            localStorage.removeItem('authToken');
+          }
         })
         .catch(() => {
           localStorage.removeItem('authToken');
@@ -24,9 +33,12 @@ export function AuthProvider({ children }) {
           setIsLoading(false);
         });
     } else {
+      home.catch(() => {
+        // 첫 화면 데이터는 각 페이지에서 다시 조회한다
+      });
       Promise.resolve().then(() => setIsLoading(false));
     }
-  }, []);
+  }, [queryClient]);
 
   const register = useCallback(async (data) => {
     const response = await authApi.register(data);
@@ -51,6 +63,7 @@ export function AuthProvider({ children }) {
       // 에러 무시
     }
     localStorage.removeItem('authToken');
+    clearHomeCache();
     setUser(null);
   }, []);
 
@@ -1,5 +1,10 @@
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
-import { boardsApi, reviewsApi } from '../api/endpoints';
+import { boardsApi, reviewsApi, uploadReviewImage } from '../api/endpoints';
+import { createBatchLoader } from '../api/batch';
+
+// 동시에 다시 조회되는 보드/리뷰를 배치 엔드포인트 한 번으로 묶는다
+const boardLoader = createBatchLoader((ids) => boardsApi.getMany(ids));
+const reviewLoader = createBatchLoader((ids) => reviewsApi.getMany(ids));
 
 // 내 빙고 보드 목록 조회
 export function useBoards() {
@@ -16,10 +21,7 @@ export function useBoards() {
 export function useBoard(id) {
   return useQuery({
     queryKey: ['board', id],
-    queryFn: async () => {
-      const response = await boardsApi.getById(id);
-      return response.data;
-    },
+    queryFn: () => boardLoader.load(id),
     enabled: !!id,
   });
 }
@@ -59,6 +61,12 @@ export function useCreateReview() {
 
   return useMutation({
     mutationFn: async (formData) => {
+      // 이미지는 스토리지에 직접 올리고 리뷰에는 참조(image_ref)만 보낸다
+      const image = formData.get('image');
+      if (image instanceof File) {
+        formData.delete('image');
+        formData.append('image_ref', await uploadReviewImage(image));
+      }
       const response = await reviewsApi.create(formData);
       return response.data;
     },
@@ -76,10 +84,7 @@ export function useCreateReview() {
 export function useReview(id) {
   return useQuery({
     queryKey: ['review', id],
-    queryFn: async () => {
-      const response = await reviewsApi.getById(id);
-      return response.data;
-    },
+    queryFn: () => reviewLoader.load(id),
     enabled: !!id,
   });
 }
@@ -6,14 +6,15 @@ import { useBoard, useCreateReview } from './useBoards';
 // Mock the API endpoints
 vi.mock('../api/endpoints', () => ({
   boardsApi: {
-    getById: vi.fn(),
+    getMany: vi.fn(),
   },
   reviewsApi: {
     create: vi.fn(),
   },
+  uploadReviewImage: vi.fn(),
 }));
 
-import { boardsApi, reviewsApi } from '../api/endpoints';
+import { boardsApi, reviewsApi, uploadReviewImage } from '../api/endpoints';
 
 describe('useBoards hooks', () => {
   let queryClient;
@@ -38,7 +39,7 @@ describe('useBoards hooks', () => {
   describe('Query key type consistency', () => {
     it('useBoard uses string id from params', async () => {
       const mockBoard = { id: 1, cells: [] };
-      boardsApi.getById.mockResolvedValue({ data: mockBoard });
+      boardsApi.getMany.mockResolvedValue({ data: { results: [mockBoard], missing: [] } });
 
       // useParams returns string id
       const stringId = '1';
@@ -94,6 +95,28 @@ describe('useBoards hooks', () => {
       });
     });
 
+    it('useCreateReview uploads the image first and sends image_ref', async () => {
+      uploadReviewImage.mockResolvedValue('signed-ref');
+      reviewsApi.create.mockResolvedValue({ data: { id: 1, bingo_board: 1 } });
+
+      const { result } = renderHook(() => useCreateReview(), {
+        wrapper: createWrapper(),
+      });
+
+      const formData = new FormData();
+      formData.append('content', '맛있었습니다 강력 추천합니다');
+      formData.append('image', new File(['jpeg'], 'photo.jpg', { type: 'image/jpeg' }));
+
+      await act(async () => {
+        await result.current.mutateAsync(formData);
+      });
+
+      expect(uploadReviewImage).toHaveBeenCalledTimes(1);
+      const sent = reviewsApi.create.mock.calls.at(-1)[0];
+      expect(sent.get('image')).toBeNull();
+      expect(sent.get('image_ref')).toBe('signed-ref');
+    });
+
     it('cache invalidation works correctly after review submission', async () => {
       // Setup: Pre-populate cache with board data
       const initialBoard = {
@@ -110,7 +133,7 @@ describe('useBoards hooks', () => {
         cells: [{ position: 0, is_activated: true }],
         is_completed: false,
       };
-      boardsApi.getById.mockResolvedValue({ data: updatedBoard });
+      boardsApi.getMany.mockResolvedValue({ data: { results: [updatedBoard], missing: [] } });
 
       const mockReviewResponse = {
         id: 1,
@@ -138,7 +161,7 @@ describe('useBoards hooks', () => {
 
       // After invalidation, the query should refetch
       await waitFor(() => {
-        expect(boardsApi.getById).toHaveBeenCalled();
+        expect(boardsApi.getMany).toHaveBeenCalledWith(['1']);
       });
     });
   });
@@ -1,4 +1,5 @@
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { useEffect } from 'react';
+import { useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { reviewsApi } from '../api/endpoints';
 
 export function useToggleLike(boardId) {
@@ -18,13 +19,22 @@ export function useToggleLike(boardId) {
   });
 }
 
+/**
+ * 리뷰 댓글 목록 (커서 페이지네이션, data는 지금까지 불러온 댓글 배열)
+ */
 export function useReviewComments(reviewId) {
-  return useQuery({
+  return useInfiniteQuery({
     queryKey: ['reviewComments', reviewId],
-    queryFn: async () => {
-      const response = await reviewsApi.getComments(reviewId);
+    queryFn: async ({ pageParam }) => {
+      const response = await reviewsApi.getComments(reviewId, pageParam);
       return response.data;
     },
+    initialPageParam: null,
+    getNextPageParam: (lastPage) => {
+      if (!lastPage.next) return undefined;
+      return new URL(lastPage.next).searchParams.get('cursor');
+    },
+    select: (data) => data.pages.flatMap((page) => page.results),
     enabled: !!reviewId,
   });
 }
@@ -68,3 +78,80 @@ export function useDeleteComment(boardId) {
     },
   });
 }
+
+/**
+ * 리뷰 좋아요/댓글 변경을 SSE로 받아 캐시에 반영 (폴링 대신)
+ * @param {Array<number>} reviewIds - 구독할 공개 리뷰 ID 목록
+ * @param {number} boardId - 빙고 보드 ID (보드 캐시도 갱신할 때)
+ */
+export function useReviewEvents(reviewIds, boardId) {
+  const queryClient = useQueryClient();
+  const ids = [...new Set(reviewIds.filter(Boolean))].sort((a, b) => a - b).join(',');
+
+  useEffect(() => {
+    if (!ids || typeof EventSource === 'undefined') return undefined;
+
+    const patchReview = (reviewId, patch) => {
+      const apply = (review) => (review?.id === reviewId ? { ...review, ...patch(review) } : review);
+      queryClient.setQueriesData({ queryKey: ['reviewFeed'] }, (data) =>
+        data && {
+          ...data,
+          pages: data.pages.map((page) => ({ ...page, results: page.results.map(apply) })),
+        }
+      );
+      if (boardId) {
+        queryClient.setQueryData(['board', String(boardId)], (board) =>
+          board && {
+            ...board,
+            cells: board.cells.map((cell) => ({ ...cell, review: apply(cell.review) })),
+          }
+        );
+      }
+    };
+
+    const source = new EventSource(reviewsApi.eventsUrl(ids));
+
+    source.addEventListener('like', (e) => {
+      const { review_id, like_count } = JSON.parse(e.data);
+      patchReview(review_id, () => ({ like_count }));
+    });
+
+    source.addEventListener('comment.created', (e) => {
+      const { review_id, comment } = JSON.parse(e.data);
+      // 마지막 페이지까지 불러온 경우에만 끝에 붙인다 (아니면 다음 페이지 로드 때 받는다)
+      queryClient.setQueryData(['reviewComments', review_id], (data) => {
+        const lastPage = data?.pages[data.pages.length - 1];
+        if (!lastPage || lastPage.next) return data;
+        if (data.pages.some((page) => page.results.some((c) => c.id === comment.id))) return data;
+        return {
+          ...data,
+          pages: [
+            ...data.pages.slice(0, -1),
+            { ...lastPage, results: [...lastPage.results, comment] },
+          ],
+        };
+      });
+      patchReview(review_id, (review) => ({ comment_count: (review.comment_count || 0) + 1 }));
+    });
+
+    // 한 트랜잭션에서 지워진 리뷰의 댓글들이 이벤트 하나로 온다
+    source.addEventListener('comment.deleted', (e) => {
+      const { review_id, comment_ids } = JSON.parse(e.data);
+      const removed = new Set(comment_ids);
+      queryClient.setQueryData(['reviewComments', review_id], (data) =>
+        data && {
+          ...data,
+          pages: data.pages.map((page) => ({
+            ...page,
+            results: page.results.filter((c) => !removed.has(c.id)),
+          })),
+        }
+      );
+      patchReview(review_id, (review) => ({
+        comment_count: Math.max((review.comment_count || 0) - comment_ids.length, 0),
+      }));
+    });
+
+    return () => source.close();
+  }, [ids, boardId, queryClient]);
+}
@@ -1,4 +1,4 @@
-import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
 import { renderHook, waitFor, act } from '@testing-library/react';
 import { QueryClient, QueryClientProvider } from '@tanstack/react-query';
 import {
@@ -6,6 +6,7 @@ import {
   useReviewComments,
   useCreateComment,
   useDeleteComment,
+  useReviewEvents,
 } from './useReviewSocial';
 
 vi.mock('../api/endpoints', () => ({
@@ -14,6 +15,7 @@ vi.mock('../api/endpoints', () => ({
     getComments: vi.fn(),
     createComment: vi.fn(),
     deleteComment: vi.fn(),
+    eventsUrl: vi.fn((ids) => `/api/reviews/events/?ids=${ids}`),
   },
 }));
 
@@ -82,7 +84,9 @@ describe('useReviewSocial hooks', () => {
         { id: 1, content: '댓글1', username: 'user1' },
         { id: 2, content: '댓글2', username: 'user2' },
       ];
-      reviewsApi.getComments.mockResolvedValue({ data: mockComments });
+      reviewsApi.getComments.mockResolvedValue({
+        data: { next: null, previous: null, results: mockComments },
+      });
 
       const { result } = renderHook(() => useReviewComments(42), {
         wrapper: createWrapper(),
@@ -90,6 +94,33 @@ describe('useReviewSocial hooks', () => {
 
       await waitFor(() => expect(result.current.isSuccess).toBe(true));
       expect(result.current.data).toEqual(mockComments);
+      expect(result.current.hasNextPage).toBe(false);
+    });
+
+    it('loads the next page with the cursor from the next link', async () => {
+      reviewsApi.getComments
+        .mockResolvedValueOnce({
+          data: {
+            next: 'http://localhost/api/reviews/42/comments/?cursor=abc',
+            previous: null,
+            results: [{ id: 1, content: '댓글1' }],
+          },
+        })
+        .mockResolvedValueOnce({
+          data: { next: null, previous: null, results: [{ id: 2, content: '댓글2' }] },
+        });
+
+      const { result } = renderHook(() => useReviewComments(42), {
+        wrapper: createWrapper(),
+      });
+
+      await waitFor(() => expect(result.current.hasNextPage).toBe(true));
+      await act(async () => {
+        await result.current.fetchNextPage();
+      });
+
+      expect(reviewsApi.getComments).toHaveBeenLastCalledWith(42, 'abc');
+      expect(result.current.data.map((c) => c.id)).toEqual([1, 2]);
     });
 
     it('does not fetch when reviewId is falsy', () => {
@@ -151,4 +182,76 @@ describe('useReviewSocial hooks', () => {
       });
     });
   });
+
+  describe('useReviewEvents', () => {
+    class FakeEventSource {
+      static instances = [];
+
+      constructor(url) {
+        this.url = url;
+        this.listeners = {};
+        this.closed = false;
+        FakeEventSource.instances.push(this);
+      }
+
+      addEventListener(type, listener) {
+        this.listeners[type] = listener;
+      }
+
+      emit(type, data) {
+        this.listeners[type]({ data: JSON.stringify(data) });
+      }
+
+      close() {
+        this.closed = true;
+      }
+    }
+
+    beforeEach(() => {
+      FakeEventSource.instances = [];
+      vi.stubGlobal('EventSource', FakeEventSource);
+    });
+
+    afterEach(() => {
+      vi.unstubAllGlobals();
+    });
+
+    it('applies pushed like counts and comments to the cache', () => {
+      queryClient.setQueryData(['board', '5'], {
+        id: 5,
+        cells: [{ position: 0, review: { id: 42, like_count: 0, comment_count: 0 } }],
+      });
+      queryClient.setQueryData(['reviewComments', 42], {
+        pages: [{ next: null, previous: null, results: [] }],
+        pageParams: [null],
+      });
+
+      const { unmount } = renderHook(() => useReviewEvents([42], 5), {
+        wrapper: createWrapper(),
+      });
+      const source = FakeEventSource.instances[0];
+      expect(source.url).toBe('/api/reviews/events/?ids=42');
+
+      act(() => {
+        source.emit('like', { review_id: 42, like_count: 3 });
+        source.emit('comment.created', { review_id: 42, comment: { id: 7, content: '좋아요' } });
+      });
+
+      const board = queryClient.getQueryData(['board', '5']);
+      expect(board.cells[0].review.like_count).toBe(3);
+      expect(board.cells[0].review.comment_count).toBe(1);
+      expect(queryClient.getQueryData(['reviewComments', 42]).pages[0].results).toEqual([
+        { id: 7, content: '좋아요' },
+      ]);
+
+      act(() => {
+        source.emit('comment.deleted', { review_id: 42, comment_ids: [7] });
+      });
+      expect(queryClient.getQueryData(['reviewComments', 42]).pages[0].results).toEqual([]);
+      expect(queryClient.getQueryData(['board', '5']).cells[0].review.comment_count).toBe(0);
+
+      unmount();
+      expect(source.closed).toBe(true);
+    });
+  });
 });
@@ -77,6 +77,7 @@ export default function BoardPage() {
         completedLines={board.completed_lines || 0}
         targetLines={board.target_line_count}
         activatedCells={activatedCells}
+        totalCells={board.progress?.total_cells}
         isCompleted={board.is_completed}
       />
 
@@ -93,7 +94,7 @@ export default function BoardPage() {
       )}
 
       {/* 빙고 그리드 */}
-      <BingoGrid cells={cells} onCellClick={handleCellClick} />
+      <BingoGrid cells={cells} size={board.size} onCellClick={handleCellClick} />
 
       {/* 셀 상세 모달 */}
       {selectedCell && (
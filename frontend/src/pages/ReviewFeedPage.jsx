@@ -1,4 +1,5 @@
 import { useReviewFeed } from '../hooks/useReviewFeed';
+import { useReviewEvents } from '../hooks/useReviewSocial';
 import ReviewSocialSection from '../components/bingo/ReviewSocialSection';
 import { SkeletonFeedItem } from '../components/common/Skeleton';
 
@@ -21,6 +22,9 @@ export default function ReviewFeedPage() {
     isFetchingNextPage,
   } = useReviewFeed();
 
+  const reviews = data?.pages.flatMap((page) => page.results) || [];
+  useReviewEvents(reviews.map((review) => review.id));
+
   if (isLoading) {
     return (
       <div className="max-w-2xl mx-auto">
@@ -50,8 +54,6 @@ export default function ReviewFeedPage() {
     );
   }
 
-  const reviews = data?.pages.flatMap((page) => page.results) || [];
-
   if (reviews.length === 0) {
     return (
       <div className="max-w-2xl mx-auto">